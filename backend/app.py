@@ -1,17 +1,36 @@
-from flask import Flask
+import time
+import click
+from flask import Flask, Request, Response, g, request
 from flask_cors import CORS
 from flask_migrate import Migrate
 from config import Config
 from models import db
+from services.file_storage import UploadSpool
 
-def create_app():
+class AppRequest(Request):
+    @property
+    def max_content_length(self):
+        if self.endpoint == 'candidates.bulk_upload_resumes':
+            return Config.BULK_UPLOAD_MAX_CONTENT_LENGTH
+        return super().max_content_length
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # Parse file parts straight to disk next to the upload folders instead of
+        # werkzeug's in-memory/tmp spool, so FileStorage can rename them into place
+        return UploadSpool(max_size=self.max_content_length)
+
+def create_app(start_workers=None, metrics=None):
     app = Flask(__name__)
+    app.request_class = AppRequest
     app.config.from_object(Config)
+    app.config['USE_X_SENDFILE'] = Config.DOCUMENT_SENDFILE_MODE == 'x-sendfile'
 
     CORS(app, resources={r"/api/*": {"origins": Config.CORS_ORIGINS}})
 
     db.init_app(app)
-    migrate = Migrate(app, db)
+
+    from services.search_index import SearchIndex
+    migrate = Migrate(app, db, include_name=SearchIndex.include_name)
 
     from routes.candidates import candidates_bp
     app.register_blueprint(candidates_bp, url_prefix='/api/candidates')
@@ -20,8 +39,65 @@ def create_app():
     def health_check():
         return {'status': 'healthy'}, 200
 
-    with app.app_context():
-        db.create_all()
+    if metrics is None:
+        metrics = Config.METRICS_ENABLED
+
+    # Disabled, every instrumented call returns after one flag check
+    from services.metrics import REGISTRY, HTTP_REQUEST_SECONDS
+    REGISTRY.enabled = metrics
+
+    if metrics and Config.METRICS_MULTIPROC_DIR and REGISTRY.multiprocess_dir is None:
+        REGISTRY.enable_multiprocess(Config.METRICS_MULTIPROC_DIR, Config.METRICS_FLUSH_SECONDS)
+
+    if metrics:
+        @app.before_request
+        def start_request_timer():
+            g.request_started = time.perf_counter()
+
+        @app.after_request
+        def observe_request(response):
+            started = g.pop('request_started', None)
+            if started is not None:
+                HTTP_REQUEST_SECONDS.observe(
+                    time.perf_counter() - started,
+                    method=request.method,
+                    endpoint=request.endpoint or 'unmatched',
+                    status=response.status_code
+                )
+            return response
+
+        @app.route('/metrics', methods=['GET'])
+        def metrics_endpoint():
+            return Response(REGISTRY.render(), content_type=REGISTRY.CONTENT_TYPE)
+
+    @app.cli.command('rebuild-search-index')
+    def rebuild_search_index():
+        """Re-index every candidate, e.g. after importing existing data"""
+        with db.engine.begin() as connection:
+            count = SearchIndex.rebuild(connection)
+        print(f"[SEARCH] Indexed {count} candidate(s)")
+
+    @app.cli.command('migrate-storage')
+    @click.option('--batch-size', default=200, show_default=True)
+    @click.option('--dry-run', is_flag=True, help='Only report what would be moved')
+    def migrate_storage(batch_size, dry_run):
+        """Move files from the flat layout into content-addressed storage"""
+        from services.storage import StorageMigrator
+        stats = StorageMigrator.migrate_to_cas(batch_size=batch_size, dry_run=dry_run)
+        action = 'Would move' if dry_run else 'Moved'
+        print(f"[STORAGE] {action} {stats['migrated']} file(s) ({stats['bytes']} bytes); "
+              f"{stats['missing']} missing on disk")
+
+    if start_workers is None:
+        start_workers = Config.RESUME_WORKERS_EMBEDDED
+
+    if start_workers and Config.RESUME_WORKER_COUNT > 0:
+        from services.job_queue import ResumeWorkerPool
+        app.extensions['resume_workers'] = ResumeWorkerPool(app).start()
+
+    if start_workers:
+        from services.notification_dispatcher import NotificationDispatcher
+        app.extensions['notification_dispatcher'] = NotificationDispatcher(app).start()
 
     return app
 
@@ -0,0 +1,5 @@
+"""
+Repeatable performance benchmarks: a local fake of the Azure OpenAI
+chat-completions API, a synthetic resume corpus and HTTP scenarios run
+through the Flask test client. See `python -m benchmarks.run --help`.
+"""
@@ -0,0 +1,136 @@
+import io
+import random
+import zipfile
+import docx
+from PIL import Image, ImageDraw
+
+FIRST_NAMES = ['Aarav', 'Priya', 'Rohan', 'Ananya', 'Vikram', 'Meera', 'Arjun', 'Kavya', 'Rahul', 'Sneha',
+               'Karan', 'Divya', 'Aditya', 'Isha', 'Nikhil', 'Pooja']
+LAST_NAMES = ['Sharma', 'Iyer', 'Patel', 'Reddy', 'Nair', 'Gupta', 'Menon', 'Singh', 'Das', 'Kulkarni']
+COMPANIES = ['Infosys', 'Acme Analytics', 'Northwind Labs', 'Zeta Systems', 'Globex', 'Initech']
+TITLES = ['Software Engineer', 'Senior Software Engineer', 'Data Engineer', 'Product Manager',
+          'DevOps Engineer', 'Frontend Developer']
+SKILLS = ['Python', 'Java', 'React', 'Node.js', 'SQL', 'PostgreSQL', 'AWS', 'Docker', 'Kubernetes',
+          'Machine Learning', 'TypeScript', 'Go', 'Spark', 'Terraform', 'Django', 'Flask']
+FILLER = ('Designed and shipped features end to end, worked with product and design, improved latency '
+          'and reliability of core services, mentored engineers and reviewed code.')
+
+# Pages of experience per resume; most are short, a few are long
+SIZES = [1, 1, 2, 2, 3, 5, 8]
+
+
+def _resume_lines(rng, index, pages):
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name,
+        f"{name.lower().replace(' ', '.')}{index}@example.com",
+        f"+91 98{rng.randint(10000000, 99999999)}",
+        f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)}",
+        '',
+        'SKILLS',
+        ', '.join(rng.sample(SKILLS, 6)),
+        '',
+        'EXPERIENCE'
+    ]
+    for _ in range(pages * 10):
+        lines.append(f"{rng.randint(2012, 2024)} {rng.choice(TITLES)}, {rng.choice(COMPANIES)}")
+        lines.append(FILLER)
+    lines += ['', 'EDUCATION', 'B.Tech Computer Science']
+    return lines
+
+
+def make_pdf(pages):
+    """
+    Minimal text PDF (Helvetica, one content stream per page); pages is a
+    list of line lists
+    """
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    pages_id = add(None)
+    kids = []
+    for lines in pages:
+        operations = ["BT /F1 10 Tf 50 800 Td 13 TL"]
+        for line in lines:
+            escaped = line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+            operations.append(f"({escaped}) Tj T*")
+        operations.append("ET")
+        stream = "\n".join(operations).encode('latin-1', 'replace')
+        content = add(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        kids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 842] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 %d 0 R >> >> >>" % (pages_id, content, font)
+        ))
+    objects[pages_id - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids)
+    )
+    catalog = add(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, catalog, xref)
+    return bytes(output)
+
+
+def make_docx(lines):
+    document = docx.Document()
+    for line in lines:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def resume_corpus(count, seed=42):
+    """
+    Returns [(filename, bytes)] of synthetic resumes, alternating PDF and
+    DOCX, 1-8 pages long. The same seed always gives the same corpus.
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for index in range(count):
+        pages = rng.choice(SIZES)
+        lines = _resume_lines(rng, index, pages)
+        if index % 2 == 0:
+            per_page = 55
+            content = make_pdf([lines[start:start + per_page] for start in range(0, len(lines), per_page)])
+            corpus.append((f"resume_{index:04d}.pdf", content))
+        else:
+            corpus.append((f"resume_{index:04d}.docx", make_docx(lines)))
+    return corpus
+
+
+def resume_zip(corpus):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for filename, content in corpus:
+            archive.writestr(filename, content)
+    return buffer.getvalue()
+
+
+def id_card_photo(seed=42, size=(3000, 2000), quality=92):
+    """
+    Phone-photo-sized JPEG of a fake ID card with some noise, so it does
+    not compress unrealistically well
+    """
+    rng = random.Random(seed)
+    image = Image.effect_noise(size, 24).convert('RGB')
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([200, 200, size[0] - 200, size[1] - 200], outline=(20, 40, 120), width=12)
+    for row in range(8):
+        top = 400 + row * 140
+        draw.rectangle([600, top, 600 + rng.randint(800, 1800), top + 60], fill=(30, 30, 30))
+    buffer = io.BytesIO()
+    image.save(buffer, 'JPEG', quality=quality)
+    return buffer.getvalue()
@@ -0,0 +1,206 @@
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+class FakeAzureOpenAI:
+    """
+    Local stand-in for the Azure OpenAI chat-completions API
+    (POST /openai/deployments/<deployment>/chat/completions). Each request
+    waits latency_ms ± jitter_ms, then fails with 429 (rate_limit_rate,
+    with a retry-after header) or 500 (error_rate), or answers with a
+    plausible completion: JSON fields for the resume extraction prompts,
+    a short email for the email writer, a validation verdict for the
+    request sender. Token usage is estimated from text length so token
+    metrics move. A fixed seed makes the failure sequence reproducible.
+    """
+
+    EMAIL_PATTERN = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+    PHONE_PATTERN = re.compile(r'\+?\d[\d\s-]{8,}\d')
+
+    def __init__(self, host='127.0.0.1', port=0, latency_ms=800, jitter_ms=200, error_rate=0.0,
+                 rate_limit_rate=0.0, retry_after_ms=200, seed=7):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after_ms = retry_after_ms
+        self.counters = {'requests': 0, 'completions': 0, 'rate_limited': 0, 'errors': 0}
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def endpoint(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-azure-openai', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters)
+
+    def _draw(self):
+        """
+        Returns (delay seconds, outcome) under the lock so the sequence only
+        depends on the seed and the request order
+        """
+        with self._lock:
+            self.counters['requests'] += 1
+            delay = max(0.0, self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+            roll = self._random.random()
+
+            if roll < self.rate_limit_rate:
+                outcome = 'rate_limited'
+            elif roll < self.rate_limit_rate + self.error_rate:
+                outcome = 'errors'
+            else:
+                outcome = 'completions'
+            self.counters[outcome] += 1
+            return delay, outcome
+
+    @staticmethod
+    def _estimate_tokens(text):
+        return max(1, len(text) // 4)
+
+    def _complete(self, prompt):
+        if '"is_valid"' in prompt:
+            return json.dumps({
+                'is_valid': True,
+                'request_type': 'email',
+                'priority': 'medium',
+                'summary': 'Request for PAN and Aadhaar documents'
+            })
+
+        if 'Resume Text' in prompt:
+            resume_text = prompt.split('Resume Text:', 1)[-1].strip()
+            first_line = next((line.strip() for line in resume_text.splitlines() if line.strip()), None)
+            email = self.EMAIL_PATTERN.search(resume_text)
+            phone = self.PHONE_PATTERN.search(resume_text)
+            return json.dumps({
+                'full_name': {'value': first_line, 'confidence': 0.9},
+                'email': {'value': email.group(0) if email else None, 'confidence': 0.95 if email else 0},
+                'phone': {'value': phone.group(0) if phone else None, 'confidence': 0.9 if phone else 0},
+                'current_company': {'value': 'Example Corp', 'confidence': 0.8},
+                'designation': {'value': 'Software Engineer', 'confidence': 0.8},
+                'skills': {'value': ['Python', 'SQL', 'Docker'], 'confidence': 0.85},
+                'years_of_experience': 5,
+                'education': 'B.Tech Computer Science'
+            })
+
+        return (
+            "Subject: Documents required for your application\n\n"
+            "Dear Candidate,\n\nFor further processing we need a copy of your PAN Card and Aadhaar Card "
+            "for verification. Please upload them through our candidate portal or reply to this email.\n\n"
+            "Regards,\nHR, TraqCheck"
+        )
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status, payload, headers=None):
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                path = urlparse(self.path).path
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+                if not path.endswith('/chat/completions'):
+                    self._send_json(404, {'error': {'code': '404', 'message': 'Resource not found'}})
+                    return
+
+                delay, outcome = fake._draw()
+                time.sleep(delay)
+
+                if outcome == 'rate_limited':
+                    self._send_json(429, {'error': {'code': '429', 'message': 'Rate limit exceeded'}}, {
+                        'retry-after-ms': str(fake.retry_after_ms),
+                        'retry-after': str(max(1, round(fake.retry_after_ms / 1000)))
+                    })
+                    return
+                if outcome == 'errors':
+                    self._send_json(500, {'error': {'code': '500', 'message': 'Internal server error'}})
+                    return
+
+                request = json.loads(body or b'{}')
+                prompt = '\n'.join(
+                    message.get('content') or '' for message in request.get('messages', [])
+                    if isinstance(message.get('content'), str)
+                )
+                content = fake._complete(prompt)
+                prompt_tokens = fake._estimate_tokens(prompt)
+                completion_tokens = fake._estimate_tokens(content)
+
+                self._send_json(200, {
+                    'id': f"chatcmpl-{uuid.uuid4().hex}",
+                    'object': 'chat.completion',
+                    'created': int(time.time()),
+                    'model': request.get('model') or 'gpt-4o',
+                    'choices': [{
+                        'index': 0,
+                        'finish_reason': 'stop',
+                        'message': {'role': 'assistant', 'content': content}
+                    }],
+                    'usage': {
+                        'prompt_tokens': prompt_tokens,
+                        'completion_tokens': completion_tokens,
+                        'total_tokens': prompt_tokens + completion_tokens
+                    }
+                })
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a fake Azure OpenAI chat-completions API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--latency-ms', type=float, default=800)
+    parser.add_argument('--jitter-ms', type=float, default=200)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    fake = FakeAzureOpenAI(
+        host=args.host, port=args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate, seed=args.seed
+    )
+    print(f"[FAKE AZURE] Listening on {fake.endpoint}; set AZURE_OPENAI_ENDPOINT to it")
+    try:
+        fake._server.serve_forever()
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+import argparse
+import os
+import sys
+
+TEST = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'test_import_budget.py')
+
+
+def main():
+    """
+    Runs tests/test_import_budget.py, which holds the measurement and the
+    assertions, with the budget and run count taken from the command line
+    """
+    parser = argparse.ArgumentParser(description='Fail when app startup exceeds its import-time budget')
+    parser.add_argument('--budget-ms', type=float, default=float(os.getenv('IMPORT_BUDGET_MS', 1000)),
+                        help='Maximum median startup time (default: IMPORT_BUDGET_MS or 1000)')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ['IMPORT_BUDGET_MS'] = str(args.budget_ms)
+    os.environ['IMPORT_BUDGET_RUNS'] = str(args.runs)
+
+    import pytest
+    sys.exit(pytest.main(['-q', '-s', TEST]))
+
+
+if __name__ == '__main__':
+    main()
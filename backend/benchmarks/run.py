@@ -0,0 +1,145 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from benchmarks.fake_azure import FakeAzureOpenAI
+
+DEFAULT_SCENARIOS = ['single_upload', 'bulk_upload', 'list_detail', 'document_serving']
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _configure_environment(args, endpoint, workdir):
+    """
+    Points the app at the fake server and a throwaway database and upload
+    folder. Must run before anything imports config.
+    """
+    os.environ.update({
+        'AZURE_OPENAI_ENDPOINT': endpoint,
+        'AZURE_OPENAI_API_KEY': 'benchmark',
+        'AZURE_OPENAI_API_VERSION': '2024-02-01',
+        'AZURE_OPENAI_DEPLOYMENT_NAME': 'benchmark',
+        'DATABASE_URL': f"sqlite:///{os.path.join(workdir, 'benchmark.db')}",
+        'UPLOAD_FOLDER': os.path.join(workdir, 'uploads'),
+        'LLM_CACHE_ENABLED': 'false',
+        'AGENT_MODE': args.agent_mode,
+        'RESUME_WORKER_COUNT': str(args.workers),
+        'RESUME_WORKER_POLL_INTERVAL': '0.05',
+        'NOTIFICATION_POLL_INTERVAL': '0.5',
+        'SMTP_HOST': ''
+    })
+    if args.parse_processes is not None:
+        os.environ['PARSE_POOL_PROCESSES'] = str(args.parse_processes)
+
+
+def _run(args, fake, workdir):
+    from benchmarks.scenarios import SCENARIOS
+
+    started = time.perf_counter()
+    from app import create_app
+    app = create_app(start_workers=False)
+    startup_seconds = time.perf_counter() - started
+
+    # Workers start only once the schema exists
+    from flask_migrate import upgrade
+    from services.job_queue import ResumeWorkerPool
+    from services.notification_dispatcher import NotificationDispatcher
+    with app.app_context():
+        upgrade(directory=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations'))
+    workers = ResumeWorkerPool(app).start() if args.workers > 0 else None
+    dispatcher = NotificationDispatcher(app).start()
+
+    options = {
+        'corpus_size': args.corpus_size,
+        'iterations': args.iterations,
+        'concurrency': args.concurrency,
+        'seed': args.seed,
+        'timeout': args.timeout,
+        'poll_interval': 0.05
+    }
+
+    report = {
+        'commit': _git_commit(),
+        'timestamp': datetime.utcnow().isoformat(),
+        'python': platform.python_version(),
+        'config': dict(vars(args), scenarios=args.scenarios),
+        'startup_seconds': round(startup_seconds, 3),
+        'scenarios': {}
+    }
+
+    try:
+        for name in args.scenarios:
+            print(f"[BENCHMARK] Running {name}")
+            report['scenarios'][name] = SCENARIOS[name](app, options)
+    finally:
+        if workers is not None:
+            workers.stop(timeout=10)
+        dispatcher.stop(timeout=10)
+        report['fake_azure'] = fake.stats()
+        fake.stop()
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the TraqCheck benchmark scenarios against a fake Azure OpenAI')
+    parser.add_argument('scenarios', nargs='*', default=DEFAULT_SCENARIOS,
+                        help=f"Scenarios to run (default: {' '.join(DEFAULT_SCENARIOS)})")
+    parser.add_argument('--corpus-size', type=int, default=20, help='Resumes (or documents) per scenario')
+    parser.add_argument('--iterations', type=int, default=3)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=2, help='RESUME_WORKER_COUNT for the app')
+    parser.add_argument('--parse-processes', type=int, default=None, help='PARSE_POOL_PROCESSES for the app')
+    parser.add_argument('--agent-mode', default='hybrid', choices=['hybrid', 'llm', 'local'])
+    parser.add_argument('--latency-ms', type=float, default=800)
+    parser.add_argument('--jitter-ms', type=float, default=200)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--timeout', type=float, default=300, help='Seconds to wait for processing to finish')
+    parser.add_argument('--output', help='Write the JSON report here as well as to stdout')
+    parser.add_argument('--keep', action='store_true', help='Keep the temporary database and uploads')
+    args = parser.parse_args()
+
+    from benchmarks.scenarios import SCENARIOS
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown scenario(s): {', '.join(unknown)}")
+
+    fake = FakeAzureOpenAI(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate, seed=args.seed
+    ).start()
+    workdir = tempfile.mkdtemp(prefix='traqcheck-benchmark-')
+    _configure_environment(args, fake.endpoint, workdir)
+
+    # App and worker logs go to stderr so stdout is only the JSON report
+    with contextlib.redirect_stdout(sys.stderr):
+        report = _run(args, fake, workdir)
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as handle:
+            handle.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from benchmarks.corpus import id_card_photo, resume_corpus, resume_zip
+
+TERMINAL_STATUSES = {'completed', 'failed'}
+
+
+def percentile(values, fraction):
+    """
+    Linear-interpolated percentile of an unsorted list
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class Recorder:
+    """
+    Collects per-operation latencies and errors from concurrent workers
+    """
+
+    def __init__(self):
+        self._samples = {}
+        self._errors = {}
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def record(self, operation, seconds, ok=True):
+        with self._lock:
+            if ok:
+                self._samples.setdefault(operation, []).append(seconds)
+            else:
+                self._errors[operation] = self._errors.get(operation, 0) + 1
+
+    @contextmanager
+    def time(self, operation):
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.record(operation, time.perf_counter() - started, ok=False)
+            raise
+        self.record(operation, time.perf_counter() - started)
+
+    def stop(self):
+        self.finished = time.perf_counter()
+
+    def summary(self):
+        wall = (self.finished or time.perf_counter()) - self.started
+        operations = {}
+        for operation in sorted(set(self._samples) | set(self._errors)):
+            samples = self._samples.get(operation, [])
+            milliseconds = [sample * 1000 for sample in samples]
+            operations[operation] = {
+                'count': len(samples),
+                'errors': self._errors.get(operation, 0),
+                'p50_ms': _round(percentile(milliseconds, 0.50)),
+                'p95_ms': _round(percentile(milliseconds, 0.95)),
+                'p99_ms': _round(percentile(milliseconds, 0.99)),
+                'mean_ms': _round(sum(milliseconds) / len(milliseconds) if milliseconds else None),
+                'max_ms': _round(max(milliseconds) if milliseconds else None),
+                'throughput_per_second': _round(len(samples) / wall if wall else None)
+            }
+        return {'wall_seconds': _round(wall), 'operations': operations}
+
+
+def _round(value):
+    return None if value is None else round(value, 2)
+
+
+def _expect(response, *statuses):
+    if response.status_code not in statuses:
+        raise RuntimeError(f"{response.request.method} {response.request.path} returned "
+                           f"{response.status_code}: {response.get_data(as_text=True)[:200]}")
+    return response
+
+
+def _run_concurrently(function, items, concurrency):
+    """
+    Calls function(item) from `concurrency` threads; failures are already
+    recorded, so they are only printed and counted here
+    """
+    failures = 0
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        for future in [executor.submit(function, item) for item in items]:
+            try:
+                future.result()
+            except Exception as e:
+                failures += 1
+                if failures <= 3:
+                    print(f"[BENCHMARK] {str(e)}")
+    return failures
+
+
+def _wait_for_candidate(client, candidate_id, timeout, poll_interval):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = _expect(client.get(f'/api/candidates/{candidate_id}/status'), 200).get_json()
+        if status['extraction_status'] in TERMINAL_STATUSES:
+            if status['extraction_status'] != 'completed':
+                raise RuntimeError(f"Candidate {candidate_id} extraction {status['extraction_status']}")
+            return
+        time.sleep(poll_interval)
+    raise TimeoutError(f"Candidate {candidate_id} not processed within {timeout}s")
+
+
+def single_upload(app, options):
+    """
+    Concurrent single-resume uploads. 'upload' is the request latency,
+    'processed' the time from upload until extraction completed.
+    """
+    recorder = Recorder()
+    corpus = resume_corpus(options['corpus_size'], seed=options['seed'])
+
+    def upload(entry):
+        filename, content = entry
+        client = app.test_client()
+        started = time.perf_counter()
+        with recorder.time('upload'):
+            response = _expect(client.post(
+                '/api/candidates/upload',
+                data={'file': (io.BytesIO(content), filename)},
+                content_type='multipart/form-data'
+            ), 202)
+        with recorder.time('processed'):
+            _wait_for_candidate(client, response.get_json()['candidate_id'], options['timeout'],
+                                options['poll_interval'])
+        recorder.record('end_to_end', time.perf_counter() - started)
+
+    _run_concurrently(upload, corpus, options['concurrency'])
+    recorder.stop()
+    return recorder.summary()
+
+
+def bulk_upload(app, options):
+    """
+    One ZIP of the whole corpus per iteration; 'batch_processed' runs until
+    every resume in the batch reached a terminal status
+    """
+    recorder = Recorder()
+    client = app.test_client()
+    resumes = 0
+    failed = 0
+
+    for iteration in range(options['iterations']):
+        corpus = resume_corpus(options['corpus_size'], seed=options['seed'] + 1000 + iteration)
+        archive = resume_zip(corpus)
+        with recorder.time('bulk_upload'):
+            response = _expect(client.post(
+                '/api/candidates/bulk-upload',
+                data={'files': (io.BytesIO(archive), 'resumes.zip')},
+                content_type='multipart/form-data'
+            ), 202)
+        batch_id = response.get_json()['batch_id']
+
+        deadline = time.monotonic() + options['timeout']
+        with recorder.time('batch_processed'):
+            while True:
+                batch = _expect(client.get(f'/api/candidates/bulk-upload/{batch_id}'), 200).get_json()
+                if batch['status'] == 'completed':
+                    break
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Batch {batch_id} not processed within {options['timeout']}s")
+                time.sleep(options['poll_interval'])
+
+        failed += batch['summary'].get('failed', 0) + batch['summary'].get('rejected', 0)
+        resumes += len(corpus)
+
+    recorder.stop()
+    summary = recorder.summary()
+    summary['failed_resumes'] = failed
+    summary['resumes_per_second'] = _round(resumes / summary['wall_seconds']) if summary['wall_seconds'] else None
+    return summary
+
+
+def list_detail(app, options):
+    """
+    Walks the candidate list with keyset cursors and fetches each
+    candidate's detail; needs candidates from an earlier scenario or seeds
+    a bulk upload itself
+    """
+    client = app.test_client()
+    if not _expect(client.get('/api/candidates?limit=1&total=exact'), 200).get_json()['candidates']:
+        bulk_upload(app, dict(options, iterations=1))
+
+    recorder = Recorder()
+
+    def walk(_):
+        client = app.test_client()
+        cursor = None
+        candidate_ids = []
+        while True:
+            with recorder.time('list_page'):
+                page = _expect(client.get('/api/candidates', query_string={'limit': 20, 'after': cursor or ''}),
+                               200).get_json()
+            candidate_ids += [candidate['id'] for candidate in page['candidates']]
+            cursor = page.get('next_cursor')
+            if not cursor:
+                break
+
+        for candidate_id in candidate_ids:
+            with recorder.time('detail'):
+                _expect(client.get(f'/api/candidates/{candidate_id}'), 200)
+
+    _run_concurrently(walk, range(options['iterations'] * options['concurrency']), options['concurrency'])
+    recorder.stop()
+    return recorder.summary()
+
+
+def document_serving(app, options):
+    """
+    Submits an ID card photo per candidate, then measures full downloads,
+    conditional re-downloads (304), range requests and thumbnails
+    """
+    client = app.test_client()
+    candidates = _expect(client.get('/api/candidates?limit=100&total=none'), 200).get_json()['candidates']
+    if not candidates:
+        bulk_upload(app, dict(options, iterations=1))
+        candidates = _expect(client.get('/api/candidates?limit=100&total=none'), 200).get_json()['candidates']
+    candidates = candidates[:options['corpus_size']]
+
+    recorder = Recorder()
+    photo = id_card_photo(seed=options['seed'])
+    documents = []
+    documents_lock = threading.Lock()
+
+    def submit(candidate):
+        client = app.test_client()
+        with recorder.time('submit'):
+            response = _expect(client.post(
+                f"/api/candidates/{candidate['id']}/submit-documents",
+                data={'file': (io.BytesIO(photo), 'aadhaar.jpg'), 'document_type': 'aadhaar'},
+                content_type='multipart/form-data'
+            ), 201)
+        with documents_lock:
+            documents.append(f"/api/candidates/{candidate['id']}/documents/{response.get_json()['document_id']}")
+
+    _run_concurrently(submit, candidates, options['concurrency'])
+
+    def fetch(url):
+        client = app.test_client()
+        for _ in range(options['iterations']):
+            with recorder.time('download'):
+                response = _expect(client.get(url), 200)
+                response.get_data()
+            etag = response.headers.get('ETag')
+            with recorder.time('download_not_modified'):
+                _expect(client.get(url, headers={'If-None-Match': etag}), 304)
+            with recorder.time('download_range'):
+                _expect(client.get(url, headers={'Range': 'bytes=0-65535'}), 206).get_data()
+            with recorder.time('thumbnail'):
+                _expect(client.get(f'{url}/thumbnail'), 200).get_data()
+
+    _run_concurrently(fetch, documents, options['concurrency'])
+    recorder.stop()
+    return recorder.summary()
+
+
+SCENARIOS = {
+    'single_upload': single_upload,
+    'bulk_upload': bulk_upload,
+    'list_detail': list_detail,
+    'document_serving': document_serving
+}
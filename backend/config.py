@@ -7,6 +7,10 @@ class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key')
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///traqcheck.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'false').lower() == 'true'
+    METRICS_PORT = int(os.getenv('METRICS_PORT', 9102))
+    METRICS_MULTIPROC_DIR = os.getenv('METRICS_MULTIPROC_DIR', '')
+    METRICS_FLUSH_SECONDS = float(os.getenv('METRICS_FLUSH_SECONDS', 5))
     UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'uploads')
     MAX_CONTENT_LENGTH = int(os.getenv('MAX_CONTENT_LENGTH', 10485760))
     ALLOWED_RESUME_EXTENSIONS = {'pdf', 'docx'}
@@ -18,3 +22,85 @@ class Config:
     AZURE_OPENAI_DEPLOYMENT_NAME = os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME')
 
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', 'http://localhost:5173').split(',')
+
+    RESUME_WORKERS_EMBEDDED = os.getenv('RESUME_WORKERS_EMBEDDED', 'true').lower() == 'true'
+    RESUME_WORKER_COUNT = int(os.getenv('RESUME_WORKER_COUNT', 2))
+    RESUME_WORKER_POLL_INTERVAL = float(os.getenv('RESUME_WORKER_POLL_INTERVAL', 1.0))
+    JOB_LEASE_SECONDS = int(os.getenv('JOB_LEASE_SECONDS', 300))
+    JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', 3))
+    JOB_RETRY_BACKOFF_SECONDS = int(os.getenv('JOB_RETRY_BACKOFF_SECONDS', 10))
+
+    # Outbound email; with SMTP_HOST empty, notifications are only printed
+    SMTP_HOST = os.getenv('SMTP_HOST', '')
+    SMTP_PORT = int(os.getenv('SMTP_PORT', 587))
+    SMTP_USERNAME = os.getenv('SMTP_USERNAME', '')
+    SMTP_PASSWORD = os.getenv('SMTP_PASSWORD', '')
+    SMTP_USE_TLS = os.getenv('SMTP_USE_TLS', 'true').lower() == 'true'
+    SMTP_FROM = os.getenv('SMTP_FROM', 'no-reply@traqcheck.local')
+    SMTP_TIMEOUT_SECONDS = float(os.getenv('SMTP_TIMEOUT_SECONDS', 10))
+    SMTP_POOL_SIZE = int(os.getenv('SMTP_POOL_SIZE', 2))
+
+    NOTIFICATION_BATCH_SIZE = int(os.getenv('NOTIFICATION_BATCH_SIZE', 50))
+    NOTIFICATION_POLL_INTERVAL = float(os.getenv('NOTIFICATION_POLL_INTERVAL', 2.0))
+    NOTIFICATION_LEASE_SECONDS = int(os.getenv('NOTIFICATION_LEASE_SECONDS', 300))
+    NOTIFICATION_MAX_ATTEMPTS = int(os.getenv('NOTIFICATION_MAX_ATTEMPTS', 5))
+    NOTIFICATION_RETRY_BACKOFF_SECONDS = int(os.getenv('NOTIFICATION_RETRY_BACKOFF_SECONDS', 30))
+    NOTIFICATION_MAX_BACKOFF_SECONDS = int(os.getenv('NOTIFICATION_MAX_BACKOFF_SECONDS', 3600))
+
+    LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+    LLM_CACHE_PATH = os.getenv('LLM_CACHE_PATH', 'instance/llm_cache.sqlite3')
+    LLM_CACHE_TTL_SECONDS = int(os.getenv('LLM_CACHE_TTL_SECONDS', 7 * 24 * 3600))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', 10000))
+    LLM_CACHE_MEMORY_ENTRIES = int(os.getenv('LLM_CACHE_MEMORY_ENTRIES', 256))
+
+    AGENT_STEP_TIMEOUT_SECONDS = float(os.getenv('AGENT_STEP_TIMEOUT_SECONDS', 60))
+    # Jobs each resume worker runs at once on its event loop
+    AGENT_MAX_CONCURRENCY = int(os.getenv('AGENT_MAX_CONCURRENCY', 4))
+
+    # Shared Azure OpenAI connection pool; 0 sizes it from the worker and agent concurrency
+    LLM_HTTP_MAX_CONNECTIONS = int(os.getenv('LLM_HTTP_MAX_CONNECTIONS', 0))
+    LLM_HTTP_KEEPALIVE_SECONDS = float(os.getenv('LLM_HTTP_KEEPALIVE_SECONDS', 60))
+    LLM_HTTP_TIMEOUT_SECONDS = float(os.getenv('LLM_HTTP_TIMEOUT_SECONDS', 60))
+    LLM_HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv('LLM_HTTP_CONNECT_TIMEOUT_SECONDS', 5))
+    LLM_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', 2))
+
+    AGENT_MODE = os.getenv('AGENT_MODE', 'hybrid')
+    LOCAL_EXTRACTION_MIN_CONFIDENCE = float(os.getenv('LOCAL_EXTRACTION_MIN_CONFIDENCE', 0.9))
+
+    RESUME_TOKEN_BUDGET = int(os.getenv('RESUME_TOKEN_BUDGET', 3000))
+
+    PARSE_POOL_PROCESSES = int(os.getenv('PARSE_POOL_PROCESSES', os.cpu_count() or 2))
+    PARSE_POOL_MAX_TASKS_PER_CHILD = int(os.getenv('PARSE_POOL_MAX_TASKS_PER_CHILD', 100))
+    PARSE_TIMEOUT_SECONDS = float(os.getenv('PARSE_TIMEOUT_SECONDS', 30))
+    PARSE_KILL_GRACE_SECONDS = float(os.getenv('PARSE_KILL_GRACE_SECONDS', 5))
+    PDF_MAX_PAGES = int(os.getenv('PDF_MAX_PAGES', 20))
+    RESUME_MAX_TEXT_CHARS = int(os.getenv('RESUME_MAX_TEXT_CHARS', 40000))
+    BULK_UPLOAD_MAX_CONTENT_LENGTH = int(os.getenv('BULK_UPLOAD_MAX_CONTENT_LENGTH', 524288000))
+    BULK_UPLOAD_MAX_FILES = int(os.getenv('BULK_UPLOAD_MAX_FILES', 1000))
+    BULK_UPLOAD_COMMIT_BATCH_SIZE = int(os.getenv('BULK_UPLOAD_COMMIT_BATCH_SIZE', 50))
+    CANDIDATE_COUNT_CACHE_SECONDS = int(os.getenv('CANDIDATE_COUNT_CACHE_SECONDS', 30))
+
+    RANKER_BM25_K1 = float(os.getenv('RANKER_BM25_K1', 1.2))
+    RANKER_BM25_B = float(os.getenv('RANKER_BM25_B', 0.75))
+    RANKER_SKILL_WEIGHT = int(os.getenv('RANKER_SKILL_WEIGHT', 3))
+
+    RESUMABLE_UPLOAD_CHUNK_SIZE = int(os.getenv('RESUMABLE_UPLOAD_CHUNK_SIZE', 1048576))
+    RESUMABLE_UPLOAD_TTL_SECONDS = int(os.getenv('RESUMABLE_UPLOAD_TTL_SECONDS', 86400))
+
+    # '' (serve from Python), 'x-accel' (nginx X-Accel-Redirect) or 'x-sendfile'
+    DOCUMENT_SENDFILE_MODE = os.getenv('DOCUMENT_SENDFILE_MODE', '').lower()
+    DOCUMENT_ACCEL_REDIRECT_PREFIX = os.getenv('DOCUMENT_ACCEL_REDIRECT_PREFIX', '/protected-uploads/')
+
+    # 'flat' (one file per upload) or 'cas' (deduplicated, content-addressed)
+    STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'flat').lower()
+
+    # Longest side in pixels of each generated document thumbnail
+    DOCUMENT_THUMBNAIL_SIZES = os.getenv('DOCUMENT_THUMBNAIL_SIZES', '160,480')
+    DOCUMENT_THUMBNAIL_QUALITY = int(os.getenv('DOCUMENT_THUMBNAIL_QUALITY', 80))
+    THUMBNAIL_WORKERS = int(os.getenv('THUMBNAIL_WORKERS', 2))
+
+    # Re-encode submitted JPEG/PNG photos: orientation applied, EXIF stripped, downsampled
+    DOCUMENT_IMAGE_NORMALIZE = os.getenv('DOCUMENT_IMAGE_NORMALIZE', 'false').lower() == 'true'
+    DOCUMENT_IMAGE_MAX_DIMENSION = int(os.getenv('DOCUMENT_IMAGE_MAX_DIMENSION', 2000))
+    DOCUMENT_IMAGE_QUALITY = int(os.getenv('DOCUMENT_IMAGE_QUALITY', 82))
+    DOCUMENT_KEEP_ORIGINAL = os.getenv('DOCUMENT_KEEP_ORIGINAL', 'false').lower() == 'true'
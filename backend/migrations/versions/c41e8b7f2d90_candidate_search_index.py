@@ -0,0 +1,104 @@
+"""candidate search index
+
+Revision ID: c41e8b7f2d90
+Revises: a6a7bc6c71f3
+Create Date: 2026-10-18 18:30:00.000000
+
+"""
+import json
+import zlib
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41e8b7f2d90'
+down_revision = 'a6a7bc6c71f3'
+branch_labels = None
+depends_on = None
+
+
+# Frozen copy of the schema and indexing rules at this revision; later
+# changes to services.search_index must not alter what this migration does
+SQLITE_SCHEMA = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS candidate_search USING fts5(
+        candidate_id UNINDEXED, full_name, current_company, designation, skills, resume_text,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )"""
+]
+
+POSTGRES_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS candidate_search (
+        candidate_id VARCHAR(36) PRIMARY KEY REFERENCES candidates(id) ON DELETE CASCADE,
+        body TEXT NOT NULL,
+        document TSVECTOR NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS ix_candidate_search_document ON candidate_search USING GIN (document)"
+]
+
+SQLITE_INSERT = """
+    INSERT INTO candidate_search (candidate_id, full_name, current_company, designation, skills, resume_text)
+    VALUES (:candidate_id, :full_name, :current_company, :designation, :skills, :resume_text)
+"""
+
+POSTGRES_INSERT = """
+    INSERT INTO candidate_search (candidate_id, body, document) VALUES (
+        :candidate_id, :body,
+        setweight(to_tsvector('english', :full_name), 'A') ||
+        setweight(to_tsvector('english', :current_company || ' ' || :designation), 'B') ||
+        setweight(to_tsvector('english', :skills), 'B') ||
+        setweight(to_tsvector('english', :resume_text), 'D')
+    )
+"""
+
+
+def upgrade():
+    connection = op.get_bind()
+    postgres = connection.dialect.name == 'postgresql'
+    for statement in POSTGRES_SCHEMA if postgres else SQLITE_SCHEMA:
+        connection.execute(sa.text(statement))
+    backfill(connection, postgres)
+
+
+def _skills_text(skills):
+    if not skills:
+        return ''
+    try:
+        return ' '.join(str(skill) for skill in json.loads(skills))
+    except (ValueError, TypeError):
+        return skills
+
+
+def backfill(connection, postgres):
+    candidate_ids = connection.execute(sa.text(
+        "SELECT candidate_id FROM extracted_data UNION SELECT candidate_id FROM resume_texts"
+    )).scalars().all()
+
+    for candidate_id in candidate_ids:
+        row = connection.execute(sa.text(
+            "SELECT full_name, current_company, designation, skills FROM extracted_data WHERE candidate_id = :id"
+        ), {'id': candidate_id}).first()
+        content = connection.execute(sa.text(
+            "SELECT content FROM resume_texts WHERE candidate_id = :id"
+        ), {'id': candidate_id}).scalar()
+        fields = {
+            'candidate_id': candidate_id,
+            'full_name': (row.full_name if row is not None else None) or '',
+            'current_company': (row.current_company if row is not None else None) or '',
+            'designation': (row.designation if row is not None else None) or '',
+            'skills': _skills_text(row.skills) if row is not None else '',
+            'resume_text': zlib.decompress(content).decode('utf-8') if content is not None else ''
+        }
+
+        if postgres:
+            fields['body'] = '\n'.join(
+                value for value in (fields['full_name'], fields['current_company'], fields['designation'],
+                                    fields['skills'], fields['resume_text']) if value
+            )
+            connection.execute(sa.text(POSTGRES_INSERT), fields)
+        else:
+            connection.execute(sa.text(SQLITE_INSERT), fields)
+
+
+def downgrade():
+    op.execute(sa.text("DROP TABLE IF EXISTS candidate_search"))
@@ -6,3 +6,9 @@ from .candidate import Candidate
 from .extracted_data import ExtractedData
 from .document_request import DocumentRequest
 from .submitted_document import SubmittedDocument
+from .processing_job import ProcessingJob
+from .upload_batch import UploadBatch, UploadBatchItem
+from .resume_text import ResumeText
+from .skill import Skill, candidate_skills
+from .stored_blob import StoredBlob
+from .notification_outbox import NotificationOutbox
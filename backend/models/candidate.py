@@ -8,6 +8,7 @@ class Candidate(db.Model):
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     resume_filename = db.Column(db.String(255), nullable=False)
     resume_path = db.Column(db.String(500), nullable=False)
+    content_hash = db.Column(db.String(64), index=True)
     upload_date = db.Column(db.DateTime, default=datetime.utcnow)
     extraction_status = db.Column(db.String(50), default='pending')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -16,11 +17,20 @@ class Candidate(db.Model):
     extracted_data = db.relationship('ExtractedData', backref='candidate', uselist=False, cascade='all, delete-orphan')
     document_requests = db.relationship('DocumentRequest', backref='candidate', lazy=True, cascade='all, delete-orphan')
     submitted_documents = db.relationship('SubmittedDocument', backref='candidate', lazy=True, cascade='all, delete-orphan')
+    resume_text = db.relationship('ResumeText', uselist=False, lazy=True, cascade='all, delete-orphan')
+    skills = db.relationship('Skill', secondary='candidate_skills', lazy=True, order_by='Skill.name')
+
+    __table_args__ = (
+        # Keyset pagination of the dashboard, optionally filtered by status
+        db.Index('ix_candidates_upload_date_id', 'upload_date', 'id'),
+        db.Index('ix_candidates_extraction_status_upload_date', 'extraction_status', 'upload_date', 'id'),
+    )
 
     def to_dict(self):
         return {
             'id': self.id,
             'resume_filename': self.resume_filename,
+            'content_hash': self.content_hash,
             'upload_date': self.upload_date.isoformat() if self.upload_date else None,
             'extraction_status': self.extraction_status,
             'created_at': self.created_at.isoformat() if self.created_at else None,
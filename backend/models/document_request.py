@@ -6,11 +6,16 @@ class DocumentRequest(db.Model):
     __tablename__ = 'document_requests'
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    candidate_id = db.Column(db.String(36), db.ForeignKey('candidates.id', ondelete='CASCADE'), nullable=False)
+    candidate_id = db.Column(db.String(36), db.ForeignKey('candidates.id', ondelete='CASCADE'), nullable=False, index=True)
 
     request_type = db.Column(db.String(50), nullable=False)
     request_message = db.Column(db.Text, nullable=False)
-    request_status = db.Column(db.String(50), default='sent')
+    # queued until every outbox notification is delivered, then sent (or failed)
+    request_status = db.Column(db.String(50), default='queued')
+    auto_generated = db.Column(db.Boolean, default=False, nullable=False, server_default=db.false())
+
+    notifications = db.relationship('NotificationOutbox', backref='document_request', lazy=True,
+                                    cascade='all, delete-orphan')
 
     requested_at = db.Column(db.DateTime, default=datetime.utcnow)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -22,6 +27,7 @@ class DocumentRequest(db.Model):
             'request_type': self.request_type,
             'request_message': self.request_message,
             'request_status': self.request_status,
+            'auto_generated': self.auto_generated,
             'requested_at': self.requested_at.isoformat() if self.requested_at else None,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
@@ -0,0 +1,48 @@
+from . import db
+from datetime import datetime
+import uuid
+
+class NotificationOutbox(db.Model):
+    __tablename__ = 'notification_outbox'
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    document_request_id = db.Column(db.String(36), db.ForeignKey('document_requests.id', ondelete='CASCADE'),
+                                    nullable=False, index=True)
+
+    channel = db.Column(db.String(20), nullable=False)
+    recipient = db.Column(db.String(255), nullable=False)
+    subject = db.Column(db.String(255))
+    body = db.Column(db.Text, nullable=False)
+
+    # pending -> sending -> sent, or back to pending for a retry, or failed
+    status = db.Column(db.String(20), default='pending', nullable=False)
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    max_attempts = db.Column(db.Integer, default=5, nullable=False)
+    last_error = db.Column(db.Text)
+
+    available_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    locked_by = db.Column(db.String(100))
+    locked_at = db.Column(db.DateTime)
+
+    sent_at = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_notification_outbox_status_available_at', 'status', 'available_at'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'document_request_id': self.document_request_id,
+            'channel': self.channel,
+            'recipient': self.recipient,
+            'status': self.status,
+            'attempts': self.attempts,
+            'max_attempts': self.max_attempts,
+            'last_error': self.last_error,
+            'available_at': self.available_at.isoformat() if self.available_at else None,
+            'sent_at': self.sent_at.isoformat() if self.sent_at else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
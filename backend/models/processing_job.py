@@ -0,0 +1,68 @@
+from . import db
+from datetime import datetime
+import uuid
+import json
+
+class ProcessingJob(db.Model):
+    __tablename__ = 'processing_jobs'
+
+    STAGES = ['parse', 'extract', 'generate_email', 'notify']
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    candidate_id = db.Column(db.String(36), db.ForeignKey('candidates.id', ondelete='CASCADE'), nullable=False, index=True)
+
+    status = db.Column(db.String(50), default='queued', nullable=False)
+    current_stage = db.Column(db.String(50))
+    stages = db.Column(db.Text)
+    force_extraction = db.Column(db.Boolean, default=False, nullable=False)
+
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    max_attempts = db.Column(db.Integer, default=3, nullable=False)
+    last_error = db.Column(db.Text)
+
+    available_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    locked_by = db.Column(db.String(100))
+    locked_at = db.Column(db.DateTime)
+
+    started_at = db.Column(db.DateTime)
+    completed_at = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_processing_jobs_status_available_at', 'status', 'available_at'),
+    )
+
+    def get_stages(self):
+        if self.stages:
+            try:
+                return json.loads(self.stages)
+            except:
+                pass
+        return {stage: {'status': 'pending'} for stage in self.STAGES}
+
+    def update_stage(self, stage, status, **details):
+        stages = self.get_stages()
+        entry = stages.get(stage, {})
+        entry['status'] = status
+        entry.update(details)
+        stages[stage] = entry
+        self.stages = json.dumps(stages)
+        self.current_stage = stage
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'candidate_id': self.candidate_id,
+            'status': self.status,
+            'current_stage': self.current_stage,
+            'stages': self.get_stages(),
+            'force_extraction': self.force_extraction,
+            'attempts': self.attempts,
+            'max_attempts': self.max_attempts,
+            'last_error': self.last_error,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
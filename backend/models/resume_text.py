@@ -0,0 +1,31 @@
+from . import db
+from datetime import datetime
+import zlib
+
+class ResumeText(db.Model):
+    __tablename__ = 'resume_texts'
+
+    candidate_id = db.Column(db.String(36), db.ForeignKey('candidates.id', ondelete='CASCADE'), primary_key=True)
+
+    content = db.Column(db.LargeBinary, nullable=False)
+    parser_version = db.Column(db.String(20), nullable=False)
+    char_count = db.Column(db.Integer, nullable=False)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+    def get_text(self):
+        return zlib.decompress(self.content).decode('utf-8')
+
+    def set_text(self, text):
+        self.content = zlib.compress(text.encode('utf-8'), 6)
+        self.char_count = len(text)
+
+    def to_dict(self):
+        return {
+            'candidate_id': self.candidate_id,
+            'parser_version': self.parser_version,
+            'char_count': self.char_count,
+            'compressed_size': len(self.content) if self.content else 0,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
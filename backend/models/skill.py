@@ -0,0 +1,26 @@
+from . import db
+from datetime import datetime
+import uuid
+
+candidate_skills = db.Table(
+    'candidate_skills',
+    db.Column('candidate_id', db.String(36), db.ForeignKey('candidates.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('skill_id', db.String(36), db.ForeignKey('skills.id', ondelete='CASCADE'), primary_key=True),
+    # The primary key serves lookups by candidate; this one serves skill filters
+    db.Index('ix_candidate_skills_skill_id_candidate_id', 'skill_id', 'candidate_id')
+)
+
+class Skill(db.Model):
+    __tablename__ = 'skills'
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    name = db.Column(db.String(100), nullable=False)
+    normalized_name = db.Column(db.String(100), nullable=False, unique=True)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name
+        }
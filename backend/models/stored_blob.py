@@ -0,0 +1,26 @@
+from . import db
+from datetime import datetime
+import uuid
+
+class StoredBlob(db.Model):
+    __tablename__ = 'stored_blobs'
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # Content hash plus extension, e.g. "9f86d0...08.pdf"; also the file's name on disk
+    blob_key = db.Column(db.String(80), nullable=False, unique=True)
+    content_hash = db.Column(db.String(64), nullable=False, index=True)
+    size = db.Column(db.Integer, nullable=False)
+    ref_count = db.Column(db.Integer, default=0, nullable=False)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'blob_key': self.blob_key,
+            'content_hash': self.content_hash,
+            'size': self.size,
+            'ref_count': self.ref_count,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
@@ -6,12 +6,16 @@ class SubmittedDocument(db.Model):
     __tablename__ = 'submitted_documents'
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    candidate_id = db.Column(db.String(36), db.ForeignKey('candidates.id', ondelete='CASCADE'), nullable=False)
+    candidate_id = db.Column(db.String(36), db.ForeignKey('candidates.id', ondelete='CASCADE'), nullable=False, index=True)
 
     document_type = db.Column(db.String(50), nullable=False)
     document_path = db.Column(db.String(500), nullable=False)
     document_filename = db.Column(db.String(255), nullable=False)
     file_size = db.Column(db.Integer)
+    content_hash = db.Column(db.String(64))
+    # Size as uploaded, before image normalization; original_path only if DOCUMENT_KEEP_ORIGINAL
+    original_size = db.Column(db.Integer)
+    original_path = db.Column(db.String(500))
 
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
     verification_status = db.Column(db.String(50), default='pending')
@@ -24,6 +28,8 @@ class SubmittedDocument(db.Model):
             'document_type': self.document_type,
             'document_filename': self.document_filename,
             'file_size': self.file_size,
+            'content_hash': self.content_hash,
+            'original_size': self.original_size,
             'submitted_at': self.submitted_at.isoformat() if self.submitted_at else None,
             'verification_status': self.verification_status,
             'created_at': self.created_at.isoformat() if self.created_at else None
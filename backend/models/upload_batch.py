@@ -0,0 +1,49 @@
+from . import db
+from datetime import datetime
+import uuid
+
+class UploadBatch(db.Model):
+    __tablename__ = 'upload_batches'
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    total_files = db.Column(db.Integer, default=0, nullable=False)
+    accepted_files = db.Column(db.Integer, default=0, nullable=False)
+    rejected_files = db.Column(db.Integer, default=0, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    items = db.relationship('UploadBatchItem', backref='batch', lazy=True, cascade='all, delete-orphan',
+                            order_by='UploadBatchItem.position')
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'total_files': self.total_files,
+            'accepted_files': self.accepted_files,
+            'rejected_files': self.rejected_files,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+
+class UploadBatchItem(db.Model):
+    __tablename__ = 'upload_batch_items'
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    batch_id = db.Column(db.String(36), db.ForeignKey('upload_batches.id', ondelete='CASCADE'), nullable=False, index=True)
+    candidate_id = db.Column(db.String(36), db.ForeignKey('candidates.id', ondelete='SET NULL'), index=True)
+
+    position = db.Column(db.Integer, nullable=False)
+    filename = db.Column(db.String(255), nullable=False)
+    status = db.Column(db.String(50), default='queued', nullable=False)
+    error = db.Column(db.Text)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'batch_id': self.batch_id,
+            'candidate_id': self.candidate_id,
+            'filename': self.filename,
+            'status': self.status,
+            'error': self.error
+        }
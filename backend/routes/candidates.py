@@ -1,13 +1,23 @@
+import re
 from flask import Blueprint, request, jsonify
-from models import db, Candidate, ExtractedData, DocumentRequest, SubmittedDocument
+from sqlalchemy.orm import joinedload, selectinload
+from models import db, Candidate, ExtractedData, DocumentRequest, SubmittedDocument, UploadBatch
 from services.file_storage import FileStorage
-from services.resume_parser import ResumeParser
-from services.langchain_agents import AgentOrchestrator
+from services.job_queue import JobQueue
 from services.notification_service import NotificationService
-import json
+from services.bulk_upload import BulkUploadService
+from services.candidate_listing import CandidateListing, InvalidCursor
+from services.search_index import SearchIndex
+from services.skill_service import SkillService
+from services.resumable_upload import ResumableUploadService, UploadOffsetMismatch
+from services.document_server import DocumentServer
+from services.thumbnails import ThumbnailService
+from config import Config
 
 candidates_bp = Blueprint('candidates', __name__)
 
+CONTENT_RANGE_PATTERN = re.compile(r'^bytes (\d+)-(\d+)/(\d+|\*)$')
+
 @candidates_bp.route('/upload', methods=['POST'])
 def upload_resume():
     try:
@@ -19,111 +29,63 @@ def upload_resume():
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
 
+        force_extraction = request.values.get('force_extraction', 'false').lower() in ('1', 'true', 'yes')
+
         file_info = FileStorage.save_resume(file)
 
         candidate = Candidate(
             resume_filename=file_info['filename'],
             resume_path=file_info['path'],
-            extraction_status='processing'
+            content_hash=file_info['content_hash'],
+            extraction_status='pending'
         )
         db.session.add(candidate)
+        db.session.flush()
+
+        job = JobQueue.enqueue(candidate.id, force_extraction=force_extraction, commit=False)
         db.session.commit()
 
-        try:
-            print("\n" + "="*80)
-            print("LANGCHAIN AGENT ORCHESTRATION STARTED")
-            print("="*80)
-
-            resume_text = ResumeParser.parse_resume(file_info['path'])
-
-            orchestrator = AgentOrchestrator()
-            result = orchestrator.process_resume_and_request_documents(resume_text)
-
-            normalized_data = result['extracted_data']
-            request_message = result['request_message']
-
-            education_value = normalized_data.get('education')
-            if isinstance(education_value, dict):
-                education_value = education_value.get('value')
-
-            extracted_data = ExtractedData(
-                candidate_id=candidate.id,
-                full_name=normalized_data['full_name']['value'],
-                full_name_confidence=normalized_data['full_name']['confidence'],
-                email=normalized_data['email']['value'],
-                email_confidence=normalized_data['email']['confidence'],
-                phone=normalized_data['phone']['value'],
-                phone_confidence=normalized_data['phone']['confidence'],
-                current_company=normalized_data['current_company']['value'],
-                current_company_confidence=normalized_data['current_company']['confidence'],
-                designation=normalized_data['designation']['value'],
-                designation_confidence=normalized_data['designation']['confidence'],
-                years_of_experience=normalized_data['years_of_experience'],
-                education=education_value,
-                raw_extracted_data=json.dumps(normalized_data)
-            )
+        return jsonify({
+            'candidate_id': candidate.id,
+            'job_id': job.id,
+            'message': 'Resume uploaded and queued for processing',
+            'extraction_status': candidate.extraction_status,
+            'status_url': f'/api/candidates/{candidate.id}/status'
+        }), 202
 
-            if normalized_data['skills']['value']:
-                extracted_data.set_skills_list(normalized_data['skills']['value'])
-                extracted_data.skills_confidence = normalized_data['skills']['confidence']
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
 
-            db.session.add(extracted_data)
+@candidates_bp.route('/bulk-upload', methods=['POST'])
+def bulk_upload_resumes():
+    try:
+        files = [file for file in request.files.getlist('files') if file.filename]
 
-            candidate.extraction_status = 'completed'
-            db.session.commit()
+        if not files:
+            return jsonify({'error': 'No files provided'}), 400
 
-            auto_request_generated = False
-            auto_request_message = None
+        batch = BulkUploadService.create_batch(files)
 
-            try:
-                candidate_info = {
-                    'full_name': normalized_data['full_name']['value'] or 'Candidate',
-                    'email': normalized_data['email']['value'] or '',
-                    'phone': normalized_data['phone']['value'] or ''
-                }
-
-                document_request = DocumentRequest(
-                    candidate_id=candidate.id,
-                    request_type='email',
-                    request_message=request_message,
-                    request_status='auto-generated'
-                )
+        return jsonify({
+            'batch_id': batch.id,
+            'message': 'Resumes uploaded and queued for processing',
+            'total_files': batch.total_files,
+            'accepted_files': batch.accepted_files,
+            'rejected_files': batch.rejected_files,
+            'status_url': f'/api/candidates/bulk-upload/{batch.id}'
+        }), 202
 
-                db.session.add(document_request)
-                db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
 
-                NotificationService.send_document_request(
-                    candidate_email=candidate_info['email'],
-                    candidate_phone=candidate_info['phone'],
-                    message=request_message
-                )
+@candidates_bp.route('/bulk-upload/<batch_id>', methods=['GET'])
+def get_bulk_upload(batch_id):
+    try:
+        batch = UploadBatch.query.get_or_404(batch_id)
 
-                auto_request_generated = True
-                auto_request_message = request_message
-
-                print("\n" + "="*80)
-                print("LANGCHAIN ORCHESTRATION COMPLETED SUCCESSFULLY")
-                print("="*80 + "\n")
-            except Exception as e:
-                print(f"Auto-request generation failed: {str(e)}")
-
-            return jsonify({
-                'candidate_id': candidate.id,
-                'message': 'Resume uploaded and processed successfully',
-                'extraction_status': 'completed',
-                'auto_request_generated': auto_request_generated,
-                'auto_request_preview': auto_request_message[:200] + '...' if auto_request_message else None
-            }), 201
-
-        except Exception as e:
-            db.session.rollback()
-            candidate.extraction_status = 'failed'
-            db.session.commit()
-            return jsonify({
-                'candidate_id': candidate.id,
-                'message': f'Resume uploaded but extraction failed: {str(e)}',
-                'extraction_status': 'failed'
-            }), 201
+        return jsonify(BulkUploadService.batch_status(batch)), 200
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -132,35 +94,138 @@ def upload_resume():
 def list_candidates():
     try:
         page = request.args.get('page', 1, type=int)
-        limit = request.args.get('limit', 10, type=int)
+        limit = min(max(request.args.get('limit', 10, type=int), 1), 100)
         status = request.args.get('status', None)
+        total_mode = request.args.get('total', 'cached')
 
-        query = Candidate.query
+        if total_mode not in ('cached', 'exact', 'none'):
+            return jsonify({'error': "total must be one of: cached, exact, none"}), 400
 
-        if status:
-            query = query.filter_by(extraction_status=status)
+        if 'after' in request.args:
+            try:
+                result = CandidateListing.after(
+                    request.args.get('after'),
+                    limit,
+                    status=status,
+                    exact_total=total_mode == 'exact',
+                    include_total=total_mode != 'none'
+                )
+            except InvalidCursor as e:
+                return jsonify({'error': str(e)}), 400
+        else:
+            result = CandidateListing.page(max(page, 1), limit, status=status, exact_total=total_mode == 'exact')
 
-        query = query.order_by(Candidate.upload_date.desc())
+        return jsonify(result), 200
 
-        pagination = query.paginate(page=page, per_page=limit, error_out=False)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
-        candidates_data = []
-        for candidate in pagination.items:
-            candidate_dict = candidate.to_dict()
+@candidates_bp.route('/search', methods=['GET'])
+def search_candidates():
+    try:
+        query = request.args.get('q', '').strip()
+        limit = min(max(request.args.get('limit', 20, type=int), 1), 50)
+        page = max(request.args.get('page', 1, type=int), 1)
+        status = request.args.get('status', None)
+
+        if not query:
+            return jsonify({'error': 'Query parameter q is required'}), 400
 
-            if candidate.extracted_data:
-                candidate_dict['name'] = candidate.extracted_data.full_name
-                candidate_dict['email'] = candidate.extracted_data.email
-                candidate_dict['company'] = candidate.extracted_data.current_company
+        matches = SearchIndex.search(query, limit=limit, offset=(page - 1) * limit, status=status)
+        rows = CandidateListing.rows_for_ids([match['candidate_id'] for match in matches])
 
-            candidates_data.append(candidate_dict)
+        results = []
+        for match in matches:
+            candidate_dict = rows.get(match['candidate_id'])
+            if candidate_dict is None:
+                continue
+            candidate_dict['rank'] = match['rank']
+            candidate_dict['snippet'] = match['snippet']
+            results.append(candidate_dict)
 
         return jsonify({
-            'candidates': candidates_data,
-            'total': pagination.total,
+            'query': query,
+            'candidates': results,
             'page': page,
             'limit': limit,
-            'pages': pagination.pages
+            'has_more': len(matches) == limit
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@candidates_bp.route('/skills', methods=['GET'])
+def filter_candidates_by_skills():
+    try:
+        names = [
+            name for value in request.args.getlist('skills')
+            for name in value.split(',') if name.strip()
+        ]
+        mode = request.args.get('mode', 'all')
+        limit = min(max(request.args.get('limit', 10, type=int), 1), 100)
+        status = request.args.get('status', None)
+
+        if not names:
+            return jsonify({'error': 'Query parameter skills is required'}), 400
+        if mode not in ('all', 'any'):
+            return jsonify({'error': "mode must be 'all' or 'any'"}), 400
+
+        skills, unknown = SkillService.resolve(names)
+
+        if not skills or (mode == 'all' and unknown):
+            result = {'candidates': [], 'limit': limit, 'has_more': False, 'next_cursor': None, 'total': 0}
+        else:
+            result = CandidateListing.after(
+                request.args.get('after'),
+                limit,
+                status=status,
+                exact_total=True,
+                candidate_ids=SkillService.candidate_ids_query([skill.id for skill in skills], match_all=mode == 'all')
+            )
+
+        result['skills'] = [skill.name for skill in skills]
+        result['unknown_skills'] = unknown
+        result['mode'] = mode
+        return jsonify(result), 200
+
+    except InvalidCursor as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@candidates_bp.route('/rank', methods=['POST'])
+def rank_candidates():
+    try:
+        data = request.get_json(silent=True) or {}
+        job_description = (data.get('job_description') or '').strip()
+        try:
+            top_k = min(max(int(data.get('top_k', 20)), 1), 100)
+        except (TypeError, ValueError):
+            return jsonify({'error': 'top_k must be an integer'}), 400
+
+        if not job_description:
+            return jsonify({'error': 'job_description is required'}), 400
+
+        # numpy/scipy are only loaded once ranking is first used
+        from services.candidate_ranker import get_candidate_ranker
+        ranker = get_candidate_ranker()
+        ranker.sync()
+        matches = ranker.rank(job_description, top_k=top_k)
+        rows = CandidateListing.rows_for_ids([match['candidate_id'] for match in matches])
+
+        results = []
+        for match in matches:
+            candidate_dict = rows.get(match['candidate_id'])
+            if candidate_dict is None:
+                continue
+            candidate_dict['score'] = match['score']
+            candidate_dict['matched_terms'] = match['matched_terms']
+            results.append(candidate_dict)
+
+        return jsonify({
+            'candidates': results,
+            'top_k': top_k,
+            'ranked_candidates': ranker.stats()['candidates']
         }), 200
 
     except Exception as e:
@@ -169,13 +234,20 @@ def list_candidates():
 @candidates_bp.route('/<candidate_id>', methods=['GET'])
 def get_candidate(candidate_id):
     try:
-        candidate = Candidate.query.get_or_404(candidate_id)
+        candidate = Candidate.query.options(
+            joinedload(Candidate.extracted_data),
+            selectinload(Candidate.document_requests),
+            selectinload(Candidate.submitted_documents),
+            selectinload(Candidate.skills)
+        ).filter_by(id=candidate_id).first_or_404()
 
         candidate_dict = candidate.to_dict()
 
         if candidate.extracted_data:
             candidate_dict['extracted_data'] = candidate.extracted_data.to_dict()
 
+        candidate_dict['skills'] = [skill.name for skill in candidate.skills]
+
         candidate_dict['document_requests'] = [req.to_dict() for req in candidate.document_requests]
         candidate_dict['submitted_documents'] = [doc.to_dict() for doc in candidate.submitted_documents]
 
@@ -184,10 +256,47 @@ def get_candidate(candidate_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@candidates_bp.route('/<candidate_id>/status', methods=['GET'])
+def get_candidate_status(candidate_id):
+    try:
+        candidate = Candidate.query.get_or_404(candidate_id)
+        job = JobQueue.latest_for_candidate(candidate_id)
+
+        return jsonify({
+            'candidate_id': candidate.id,
+            'extraction_status': candidate.extraction_status,
+            'job': job.to_dict() if job else None
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@candidates_bp.route('/<candidate_id>/reextract', methods=['POST'])
+def reextract_candidate(candidate_id):
+    try:
+        candidate = Candidate.query.get_or_404(candidate_id)
+
+        candidate.extraction_status = 'pending'
+        job = JobQueue.enqueue(candidate.id, force_extraction=True, commit=False)
+        db.session.commit()
+
+        return jsonify({
+            'candidate_id': candidate.id,
+            'job_id': job.id,
+            'message': 'Re-extraction queued',
+            'extraction_status': candidate.extraction_status,
+            'status_url': f'/api/candidates/{candidate.id}/status'
+        }), 202
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @candidates_bp.route('/<candidate_id>/request-documents', methods=['POST'])
 def request_documents(candidate_id):
     try:
-        candidate = Candidate.query.get_or_404(candidate_id)
+        candidate = Candidate.query.options(
+            joinedload(Candidate.extracted_data)
+        ).filter_by(id=candidate_id).first_or_404()
 
         if not candidate.extracted_data:
             return jsonify({'error': 'No extracted data available for this candidate'}), 400
@@ -203,25 +312,28 @@ def request_documents(candidate_id):
         }
 
         print("\n[MANUAL REQUEST] Using EmailWriterAgent to generate request...")
-        from services.langchain_agents import EmailWriterAgent
-        email_writer = EmailWriterAgent()
-        request_message = email_writer.generate_document_request_email(candidate_info)
+        from services.langchain_agents import get_email_writer
+        request_message = get_email_writer().generate_document_request_email(candidate_info)
 
         document_request = DocumentRequest(
             candidate_id=candidate_id,
             request_type='email',
-            request_message=request_message,
-            request_status='sent'
+            request_message=request_message
         )
 
         db.session.add(document_request)
+        NotificationService.enqueue_document_request(
+            document_request,
+            candidate_email=candidate_info['email'],
+            candidate_phone=candidate_info['phone']
+        )
         db.session.commit()
 
         return jsonify({
             'request_id': document_request.id,
             'message': 'Document request generated successfully',
             'request_preview': request_message,
-            'status': 'sent'
+            'status': document_request.request_status
         }), 201
 
     except Exception as e:
@@ -252,11 +364,15 @@ def submit_documents(candidate_id):
             document_path=file_info['path'],
             document_filename=file_info['filename'],
             file_size=file_info['size'],
+            content_hash=file_info['content_hash'],
+            original_size=file_info['original_size'],
+            original_path=file_info['original_path'],
             verification_status='pending'
         )
 
         db.session.add(submitted_document)
         db.session.commit()
+        ThumbnailService.schedule(submitted_document.document_path, submitted_document.content_hash)
 
         return jsonify({
             'document_id': submitted_document.id,
@@ -268,9 +384,135 @@ def submit_documents(candidate_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def _chunk_offset():
+    content_range = request.headers.get('Content-Range')
+    if content_range:
+        match = CONTENT_RANGE_PATTERN.match(content_range.strip())
+        if not match:
+            raise ValueError("Invalid Content-Range header")
+        return int(match.group(1))
+    return int(request.args.get('offset', ''))
+
+@candidates_bp.route('/<candidate_id>/document-uploads', methods=['POST'])
+def initiate_document_upload(candidate_id):
+    try:
+        Candidate.query.get_or_404(candidate_id)
+
+        data = request.get_json(silent=True) or {}
+        document_type = data.get('document_type')
+
+        if not document_type or document_type not in ['pan', 'aadhaar']:
+            return jsonify({'error': 'Invalid document type. Must be "pan" or "aadhaar"'}), 400
+
+        state = ResumableUploadService.initiate(
+            candidate_id, document_type, data.get('filename'), data.get('total_size')
+        )
+
+        return jsonify({
+            'upload_id': state['upload_id'],
+            'received': 0,
+            'total_size': state['total_size'],
+            'chunk_size': Config.RESUMABLE_UPLOAD_CHUNK_SIZE,
+            'upload_url': f"/api/candidates/{candidate_id}/document-uploads/{state['upload_id']}"
+        }), 201
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@candidates_bp.route('/<candidate_id>/document-uploads/<upload_id>', methods=['PUT'])
+def upload_document_chunk(candidate_id, upload_id):
+    try:
+        try:
+            offset = _chunk_offset()
+        except ValueError:
+            return jsonify({'error': 'Chunk offset required (Content-Range: bytes start-end/total or ?offset=)'}), 400
+
+        received = ResumableUploadService.append_chunk(upload_id, candidate_id, offset, request.stream)
+        return jsonify({'upload_id': upload_id, 'received': received}), 200
+
+    except FileNotFoundError as e:
+        return jsonify({'error': str(e)}), 404
+    except UploadOffsetMismatch as e:
+        return jsonify({'error': str(e), 'received': e.received}), 409
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@candidates_bp.route('/<candidate_id>/document-uploads/<upload_id>', methods=['GET'])
+def get_document_upload(candidate_id, upload_id):
+    try:
+        state = ResumableUploadService.status(upload_id, candidate_id)
+        return jsonify({
+            'upload_id': upload_id,
+            'document_type': state['document_type'],
+            'filename': state['filename'],
+            'received': state['received'],
+            'total_size': state['total_size'],
+            'complete': state['complete']
+        }), 200
+
+    except FileNotFoundError as e:
+        return jsonify({'error': str(e)}), 404
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@candidates_bp.route('/<candidate_id>/document-uploads/<upload_id>', methods=['DELETE'])
+def cancel_document_upload(candidate_id, upload_id):
+    try:
+        ResumableUploadService.status(upload_id, candidate_id)
+        ResumableUploadService.discard(upload_id)
+        return jsonify({'message': 'Upload cancelled'}), 200
+
+    except FileNotFoundError as e:
+        return jsonify({'error': str(e)}), 404
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@candidates_bp.route('/<candidate_id>/document-uploads/<upload_id>/finalize', methods=['POST'])
+def finalize_document_upload(candidate_id, upload_id):
+    try:
+        data = request.get_json(silent=True) or {}
+        state, file_info = ResumableUploadService.finalize(upload_id, candidate_id, data.get('sha256'))
+
+        submitted_document = SubmittedDocument(
+            candidate_id=candidate_id,
+            document_type=state['document_type'],
+            document_path=file_info['path'],
+            document_filename=file_info['filename'],
+            file_size=file_info['size'],
+            content_hash=file_info['content_hash'],
+            original_size=file_info['original_size'],
+            original_path=file_info['original_path'],
+            verification_status='pending'
+        )
+
+        db.session.add(submitted_document)
+        db.session.commit()
+        ResumableUploadService.discard(upload_id)
+        ThumbnailService.schedule(submitted_document.document_path, submitted_document.content_hash)
+
+        return jsonify({
+            'document_id': submitted_document.id,
+            'message': 'Document uploaded successfully',
+            'document_type': state['document_type'],
+            'verification_status': 'pending'
+        }), 201
+
+    except FileNotFoundError as e:
+        return jsonify({'error': str(e)}), 404
+    except UploadOffsetMismatch as e:
+        return jsonify({'error': 'Upload is incomplete', 'received': e.received}), 409
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
 @candidates_bp.route('/<candidate_id>/documents/<document_id>', methods=['GET'])
 def view_document(candidate_id, document_id):
-    from flask import send_file
     import os
 
     try:
@@ -282,11 +524,39 @@ def view_document(candidate_id, document_id):
         if not os.path.exists(document.document_path):
             return jsonify({'error': 'Document file not found'}), 404
 
-        return send_file(
-            document.document_path,
-            as_attachment=False,
-            download_name=document.document_filename
-        )
+        if not document.content_hash:
+            # Documents stored before hashes were recorded get one on first view
+            document.content_hash = DocumentServer.file_hash(document.document_path)
+            db.session.commit()
+
+        return DocumentServer.send(document.document_path, document.document_filename, document.content_hash)
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@candidates_bp.route('/<candidate_id>/documents/<document_id>/thumbnail', methods=['GET'])
+def document_thumbnail(candidate_id, document_id):
+    import os
+
+    try:
+        document = SubmittedDocument.query.filter_by(
+            id=document_id,
+            candidate_id=candidate_id
+        ).first_or_404()
+
+        size = request.args.get('size', type=int) or ThumbnailService.sizes()[0]
+
+        if not os.path.exists(document.document_path):
+            return jsonify({'error': 'Document file not found'}), 404
+
+        if not document.content_hash:
+            document.content_hash = DocumentServer.file_hash(document.document_path)
+            db.session.commit()
+
+        thumbnail_path = ThumbnailService.get(document.document_path, document.content_hash, size)
+        return DocumentServer.send(thumbnail_path, f"thumbnail-{size}.jpg", f"{document.content_hash}-{size}")
 
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
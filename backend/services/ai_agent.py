@@ -1,15 +1,14 @@
-from openai import AzureOpenAI
 from config import Config
+from services.llm_clients import get_llm_clients
 
 class AIAgent:
     def __init__(self):
-        self.client = AzureOpenAI(
-            azure_endpoint=Config.AZURE_OPENAI_ENDPOINT,
-            api_key=Config.AZURE_OPENAI_API_KEY,
-            api_version=Config.AZURE_OPENAI_API_VERSION
-        )
         self.deployment_name = Config.AZURE_OPENAI_DEPLOYMENT_NAME
 
+    @property
+    def client(self):
+        return get_llm_clients().openai_client()
+
     def generate_document_request(self, candidate_data):
         name = candidate_data.get('full_name', 'Candidate')
         email = candidate_data.get('email', '')
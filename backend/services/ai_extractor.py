@@ -1,17 +1,16 @@
 import os
 import json
-from openai import AzureOpenAI
 from config import Config
+from services.llm_clients import get_llm_clients
 
 class AIExtractor:
     def __init__(self):
-        self.client = AzureOpenAI(
-            azure_endpoint=Config.AZURE_OPENAI_ENDPOINT,
-            api_key=Config.AZURE_OPENAI_API_KEY,
-            api_version=Config.AZURE_OPENAI_API_VERSION
-        )
         self.deployment_name = Config.AZURE_OPENAI_DEPLOYMENT_NAME
 
+    @property
+    def client(self):
+        return get_llm_clients().openai_client()
+
     def extract_candidate_info(self, resume_text):
         prompt = f"""Extract the following information from the resume text below and provide confidence scores (0-1) for each field:
 
@@ -0,0 +1,124 @@
+import os
+import zipfile
+from werkzeug.datastructures import FileStorage as UploadedFile
+from models import db, Candidate, UploadBatch, UploadBatchItem
+from services.file_storage import FileStorage
+from services.job_queue import JobQueue
+from config import Config
+
+class BulkUploadService:
+    """
+    Stores many resumes (individual files or ZIP archives) in one request,
+    creating candidates and processing jobs in batched transactions
+    """
+
+    TERMINAL_STATUSES = {'completed', 'failed'}
+
+    @staticmethod
+    def iter_uploads(files):
+        """
+        Yields one uploaded file per resume, streaming entries out of ZIP
+        archives without extracting them to disk first
+        """
+        for file in files:
+            if file.filename and file.filename.lower().endswith('.zip'):
+                try:
+                    archive = zipfile.ZipFile(file.stream)
+                except zipfile.BadZipFile:
+                    yield UploadedFile(stream=None, filename=file.filename), "Invalid ZIP archive"
+                    continue
+
+                with archive:
+                    for info in archive.infolist():
+                        name = os.path.basename(info.filename)
+                        if info.is_dir() or not name or name.startswith('.') or info.filename.startswith('__MACOSX/'):
+                            continue
+
+                        with archive.open(info) as entry:
+                            yield UploadedFile(stream=entry, filename=name), None
+            else:
+                yield file, None
+
+    @staticmethod
+    def create_batch(files):
+        batch = UploadBatch()
+        db.session.add(batch)
+        db.session.flush()
+
+        pending = 0
+        position = 0
+
+        for upload, error in BulkUploadService.iter_uploads(files):
+            item = UploadBatchItem(batch_id=batch.id, position=position, filename=upload.filename or '')
+            position += 1
+
+            if error is None and position > Config.BULK_UPLOAD_MAX_FILES:
+                error = f"Batch exceeds the maximum of {Config.BULK_UPLOAD_MAX_FILES} files"
+
+            if error is None:
+                try:
+                    file_info = FileStorage.save_resume(upload, max_size=Config.MAX_CONTENT_LENGTH)
+
+                    candidate = Candidate(
+                        resume_filename=file_info['filename'],
+                        resume_path=file_info['path'],
+                        content_hash=file_info['content_hash'],
+                        extraction_status='pending'
+                    )
+                    db.session.add(candidate)
+                    db.session.flush()
+
+                    JobQueue.enqueue(candidate.id, commit=False)
+                    item.candidate_id = candidate.id
+                    item.status = 'queued'
+                    batch.accepted_files += 1
+                except ValueError as e:
+                    error = str(e)
+
+            if error is not None:
+                item.status = 'rejected'
+                item.error = error
+                batch.rejected_files += 1
+
+            db.session.add(item)
+            pending += 1
+
+            if pending >= Config.BULK_UPLOAD_COMMIT_BATCH_SIZE:
+                batch.total_files = position
+                db.session.commit()
+                pending = 0
+
+        batch.total_files = position
+        db.session.commit()
+
+        print(f"[BULK UPLOAD] Batch {batch.id}: {batch.accepted_files} queued, {batch.rejected_files} rejected")
+        return batch
+
+    @staticmethod
+    def batch_status(batch):
+        rows = db.session.query(UploadBatchItem, Candidate.extraction_status) \
+            .outerjoin(Candidate, UploadBatchItem.candidate_id == Candidate.id) \
+            .filter(UploadBatchItem.batch_id == batch.id) \
+            .order_by(UploadBatchItem.position) \
+            .all()
+
+        items = []
+        summary = {}
+        for item, extraction_status in rows:
+            item_dict = item.to_dict()
+            item_dict['extraction_status'] = extraction_status
+            items.append(item_dict)
+
+            key = extraction_status or item.status
+            summary[key] = summary.get(key, 0) + 1
+
+        finished = all(
+            item['status'] == 'rejected' or item['extraction_status'] in BulkUploadService.TERMINAL_STATUSES
+            for item in items
+        )
+
+        result = batch.to_dict()
+        result['status'] = 'completed' if finished else 'processing'
+        result['summary'] = summary
+        result['items'] = items
+        return result
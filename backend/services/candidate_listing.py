@@ -0,0 +1,182 @@
+import base64
+import binascii
+import json
+import threading
+import time
+from datetime import datetime
+from sqlalchemy import and_, func, or_
+from models import db, Candidate, ExtractedData
+from config import Config
+
+class InvalidCursor(ValueError):
+    pass
+
+class CandidateListing:
+    """
+    Dashboard listing of candidates. Supports keyset pagination on
+    (upload_date, id) with an opaque cursor so deep pages cost the same as
+    the first one, and caches the total count per status filter instead of
+    running COUNT(*) on every request.
+    """
+
+    # Only the columns the dashboard list serializes, fetched in one joined query
+    LIST_COLUMNS = (
+        Candidate.id,
+        Candidate.resume_filename,
+        Candidate.content_hash,
+        Candidate.upload_date,
+        Candidate.extraction_status,
+        Candidate.created_at,
+        Candidate.updated_at,
+        ExtractedData.id.label('extracted_data_id'),
+        ExtractedData.full_name,
+        ExtractedData.email,
+        ExtractedData.current_company
+    )
+
+    _counts = {}
+    _counts_lock = threading.Lock()
+
+    @staticmethod
+    def encode_cursor(upload_date, candidate_id):
+        payload = json.dumps([upload_date.isoformat() if upload_date else None, candidate_id])
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            upload_date, candidate_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            return (datetime.fromisoformat(upload_date) if upload_date else None), str(candidate_id)
+        except (ValueError, TypeError, binascii.Error):
+            raise InvalidCursor("Invalid pagination cursor")
+
+    @staticmethod
+    def serialize_row(row):
+        candidate_dict = {
+            'id': row.id,
+            'resume_filename': row.resume_filename,
+            'content_hash': row.content_hash,
+            'upload_date': row.upload_date.isoformat() if row.upload_date else None,
+            'extraction_status': row.extraction_status,
+            'created_at': row.created_at.isoformat() if row.created_at else None,
+            'updated_at': row.updated_at.isoformat() if row.updated_at else None
+        }
+
+        if row.extracted_data_id:
+            candidate_dict['name'] = row.full_name
+            candidate_dict['email'] = row.email
+            candidate_dict['company'] = row.current_company
+
+        return candidate_dict
+
+    @staticmethod
+    def _base_query(status=None, candidate_ids=None):
+        query = db.session.query(*CandidateListing.LIST_COLUMNS).outerjoin(
+            ExtractedData, ExtractedData.candidate_id == Candidate.id
+        )
+
+        if status:
+            query = query.filter(Candidate.extraction_status == status)
+        if candidate_ids is not None:
+            query = query.filter(Candidate.id.in_(candidate_ids))
+
+        return query.order_by(Candidate.upload_date.desc(), Candidate.id.desc())
+
+    @staticmethod
+    def rows_for_ids(candidate_ids):
+        """
+        Serialized list rows for the given candidates, keyed by id
+        """
+        if not candidate_ids:
+            return {}
+
+        rows = CandidateListing._base_query().filter(Candidate.id.in_(candidate_ids)).all()
+        return {row.id: CandidateListing.serialize_row(row) for row in rows}
+
+    @staticmethod
+    def count(status=None, exact=False, candidate_ids=None):
+        """
+        Total number of candidates for the filter. Unless exact is set, the
+        value is cached for CANDIDATE_COUNT_CACHE_SECONDS and may lag
+        behind recent uploads. Counts restricted to a candidate_ids select
+        are never cached.
+        """
+        if candidate_ids is not None:
+            query = db.session.query(func.count(Candidate.id)).filter(Candidate.id.in_(candidate_ids))
+            if status:
+                query = query.filter(Candidate.extraction_status == status)
+            return query.scalar(), False
+
+        ttl = Config.CANDIDATE_COUNT_CACHE_SECONDS
+        now = time.monotonic()
+
+        if not exact and ttl > 0:
+            with CandidateListing._counts_lock:
+                cached = CandidateListing._counts.get(status)
+            if cached is not None and cached[1] > now:
+                return cached[0], True
+
+        query = db.session.query(func.count(Candidate.id))
+        if status:
+            query = query.filter(Candidate.extraction_status == status)
+        total = query.scalar()
+
+        if ttl > 0:
+            with CandidateListing._counts_lock:
+                CandidateListing._counts[status] = (total, now + ttl)
+
+        return total, False
+
+    @staticmethod
+    def page(page, limit, status=None, exact_total=False):
+        total, cached = CandidateListing.count(status, exact=exact_total)
+        rows = CandidateListing._base_query(status).offset((page - 1) * limit).limit(limit).all()
+
+        return {
+            'candidates': [CandidateListing.serialize_row(row) for row in rows],
+            'total': total,
+            'total_is_cached': cached,
+            'page': page,
+            'limit': limit,
+            'pages': -(-total // limit) if limit else 0
+        }
+
+    @staticmethod
+    def after(cursor, limit, status=None, exact_total=False, include_total=True, candidate_ids=None):
+        """
+        One page of candidates after the given cursor, optionally restricted
+        to the ids returned by a candidate_ids select
+        """
+        query = CandidateListing._base_query(status, candidate_ids)
+
+        if cursor:
+            upload_date, candidate_id = CandidateListing.decode_cursor(cursor)
+            if upload_date is None:
+                # NULL upload dates sort last in descending order on SQLite and first on
+                # PostgreSQL; rows are always created with one, so just compare ids
+                query = query.filter(Candidate.upload_date.is_(None), Candidate.id < candidate_id)
+            else:
+                query = query.filter(or_(
+                    Candidate.upload_date < upload_date,
+                    and_(Candidate.upload_date == upload_date, Candidate.id < candidate_id)
+                ))
+
+        # Fetch one extra row to know whether another page exists without counting
+        rows = query.limit(limit + 1).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        result = {
+            'candidates': [CandidateListing.serialize_row(row) for row in rows],
+            'limit': limit,
+            'has_more': has_more,
+            'next_cursor': CandidateListing.encode_cursor(rows[-1].upload_date, rows[-1].id) if has_more else None
+        }
+
+        if include_total:
+            result['total'], result['total_is_cached'] = CandidateListing.count(
+                status, exact=exact_total, candidate_ids=candidate_ids
+            )
+
+        return result
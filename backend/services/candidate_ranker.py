@@ -0,0 +1,317 @@
+import re
+import threading
+import zlib
+from collections import Counter
+from datetime import timedelta
+import numpy as np
+import scipy.sparse as sp
+from sqlalchemy import or_
+from models import db, ExtractedData, ResumeText, Skill, candidate_skills
+from config import Config
+
+class CandidateRanker:
+    """
+    In-memory BM25 index over stored resume text and canonical skills,
+    kept as a SciPy sparse term-frequency matrix (one row per candidate).
+    New and re-extracted candidates are picked up incrementally from
+    ExtractedData/ResumeText updated_at, so the index also follows
+    extractions done by other processes. A job description is scored
+    against every candidate in one sparse operation.
+    """
+
+    TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+    STOP_WORDS = frozenset("""
+        a an and are as at be by for from has have in is it its of on or our that the their this to was
+        we were will with you your who what which should must can able work working experience years year
+        role team strong good knowledge skills skill job candidate looking using use including etc
+    """.split())
+
+    MATCHED_TERMS = 5
+    COMPACT_MIN_INACTIVE_ROWS = 1000
+    SYNC_BATCH_SIZE = 500
+    # Rows committed late by slow transactions can carry an older updated_at;
+    # re-reading a short window is cheap because unchanged versions are skipped
+    SYNC_OVERLAP = timedelta(seconds=30)
+
+    def __init__(self, k1=1.2, b=0.75, skill_weight=3):
+        self.k1 = k1
+        self.b = b
+        self.skill_weight = skill_weight
+
+        self.vocabulary = {}
+        self.terms = []
+        self.candidate_ids = []
+        self.rows = {}
+        self.versions = {}
+        self.doc_freq = np.zeros(0, dtype=np.int64)
+        self.doc_lengths = np.zeros(0, dtype=np.float64)
+        self.active = np.zeros(0, dtype=bool)
+
+        self._row_terms = []
+        self._pending = []
+        self._matrix = sp.csr_matrix((0, 0), dtype=np.float64)
+        self._columns = None
+        self._watermark = None
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls):
+        return cls(
+            k1=Config.RANKER_BM25_K1,
+            b=Config.RANKER_BM25_B,
+            skill_weight=Config.RANKER_SKILL_WEIGHT
+        )
+
+    @classmethod
+    def tokenize(cls, text):
+        return [
+            token for token in cls.TOKEN_PATTERN.findall((text or '').lower())
+            if (len(token) > 1 and token not in cls.STOP_WORDS) or token in ('c', 'r')
+        ]
+
+    def _vectorize(self, text, skills):
+        counts = Counter(self.tokenize(text))
+        for skill in skills:
+            for token in self.tokenize(skill):
+                counts[token] += self.skill_weight
+
+        indices = np.empty(len(counts), dtype=np.int64)
+        values = np.empty(len(counts), dtype=np.float64)
+        for position, (term, count) in enumerate(counts.items()):
+            column = self.vocabulary.get(term)
+            if column is None:
+                column = self.vocabulary[term] = len(self.terms)
+                self.terms.append(term)
+            indices[position] = column
+            values[position] = count
+
+        order = np.argsort(indices)
+        return indices[order], values[order]
+
+    def _grow(self, array, size, fill=0):
+        if len(array) >= size:
+            return array
+        grown = np.full(max(size, len(array) * 2), fill, dtype=array.dtype)
+        grown[:len(array)] = array
+        return grown
+
+    def add_document(self, candidate_id, text, skills, version=None):
+        """
+        Indexes (or re-indexes) one candidate. Replaced rows are masked
+        out rather than removed from the matrix.
+        """
+        with self._lock:
+            if candidate_id in self.rows:
+                self._remove_row(self.rows.pop(candidate_id))
+
+            indices, values = self._vectorize(text, skills)
+            row = len(self.candidate_ids)
+
+            self.candidate_ids.append(candidate_id)
+            self.rows[candidate_id] = row
+            self.versions[candidate_id] = version
+            self._row_terms.append(indices)
+            self._pending.append((indices, values))
+
+            self.doc_freq = self._grow(self.doc_freq, len(self.terms))
+            np.add.at(self.doc_freq, indices, 1)
+            self.doc_lengths = self._grow(self.doc_lengths, row + 1)
+            self.doc_lengths[row] = values.sum()
+            self.active = self._grow(self.active, row + 1, fill=False)
+            self.active[row] = True
+
+    def remove_document(self, candidate_id):
+        with self._lock:
+            row = self.rows.pop(candidate_id, None)
+            self.versions.pop(candidate_id, None)
+            if row is not None:
+                self._remove_row(row)
+
+    def _remove_row(self, row):
+        np.subtract.at(self.doc_freq, self._row_terms[row], 1)
+        self._row_terms[row] = np.zeros(0, dtype=np.int64)
+        self.candidate_ids[row] = None
+        self.active[row] = False
+        self.doc_lengths[row] = 0
+        self._columns = None
+
+    def _column_matrix(self):
+        """
+        Folds pending rows into the term-frequency matrix and returns it in
+        CSC form, which makes slicing out the query's columns cheap
+        """
+        if self._pending:
+            indptr = np.zeros(len(self._pending) + 1, dtype=np.int64)
+            indptr[1:] = np.cumsum([len(indices) for indices, _ in self._pending])
+            new_rows = sp.csr_matrix(
+                (np.concatenate([values for _, values in self._pending]),
+                 np.concatenate([indices for indices, _ in self._pending]),
+                 indptr),
+                shape=(len(self._pending), len(self.terms))
+            )
+
+            previous = self._matrix
+            previous.resize((previous.shape[0], len(self.terms)))
+            self._matrix = sp.vstack([previous, new_rows], format='csr')
+            self._pending = []
+            self._columns = None
+
+        row_count = self._matrix.shape[0]
+        if row_count - int(self.active[:row_count].sum()) > max(self.COMPACT_MIN_INACTIVE_ROWS, row_count // 2):
+            self._compact()
+
+        if self._columns is None:
+            # Zero out replaced/removed rows so they never score
+            mask = sp.diags(self.active[:self._matrix.shape[0]].astype(np.float64))
+            self._columns = (mask @ self._matrix).tocsc()
+            self._columns.eliminate_zeros()
+
+        return self._columns
+
+    def _compact(self):
+        """
+        Drops replaced/removed rows once they make up most of the matrix
+        """
+        keep = np.flatnonzero(self.active[:self._matrix.shape[0]])
+
+        self._matrix = self._matrix[keep]
+        self.candidate_ids = [self.candidate_ids[row] for row in keep]
+        self._row_terms = [self._row_terms[row] for row in keep]
+        self.rows = {candidate_id: row for row, candidate_id in enumerate(self.candidate_ids)}
+        self.doc_lengths = self.doc_lengths[keep]
+        self.active = np.ones(len(keep), dtype=bool)
+        self._columns = None
+
+    def sync(self):
+        """
+        Re-indexes candidates whose extracted data or resume text changed
+        since the last sync. Must run inside an app context. Database reads
+        happen outside the index lock so rank() is never blocked on them;
+        a sync already running in another thread makes this one a no-op.
+        """
+        if not self._sync_lock.acquire(blocking=False):
+            return 0
+
+        try:
+            watermark = self._watermark
+            changed = db.session.query(
+                ExtractedData.candidate_id, ExtractedData.updated_at, ResumeText.updated_at
+            ).outerjoin(ResumeText, ResumeText.candidate_id == ExtractedData.candidate_id)
+
+            if watermark is not None:
+                changed = changed.filter(or_(
+                    ExtractedData.updated_at >= watermark - self.SYNC_OVERLAP,
+                    ResumeText.updated_at >= watermark - self.SYNC_OVERLAP
+                ))
+            changed = changed.all()
+
+            pending = {}
+            newest = watermark
+            with self._lock:
+                for candidate_id, extracted_at, text_at in changed:
+                    version = (extracted_at, text_at)
+                    newest = max((value for value in (newest, extracted_at, text_at) if value is not None), default=None)
+                    if self.versions.get(candidate_id) != version:
+                        pending[candidate_id] = version
+
+            candidate_ids = list(pending)
+            for start in range(0, len(candidate_ids), self.SYNC_BATCH_SIZE):
+                batch = candidate_ids[start:start + self.SYNC_BATCH_SIZE]
+                texts = dict(
+                    db.session.query(ResumeText.candidate_id, ResumeText.content)
+                    .filter(ResumeText.candidate_id.in_(batch))
+                )
+                skills = {}
+                for candidate_id, name in db.session.query(candidate_skills.c.candidate_id, Skill.name) \
+                        .join(Skill, Skill.id == candidate_skills.c.skill_id) \
+                        .filter(candidate_skills.c.candidate_id.in_(batch)):
+                    skills.setdefault(candidate_id, []).append(name)
+
+                documents = [
+                    (candidate_id, zlib.decompress(texts[candidate_id]).decode('utf-8')
+                     if texts.get(candidate_id) is not None else '')
+                    for candidate_id in batch
+                ]
+                with self._lock:
+                    for candidate_id, text in documents:
+                        self.add_document(
+                            candidate_id, text, skills.get(candidate_id, []), version=pending[candidate_id]
+                        )
+
+            self._watermark = newest
+            return len(candidate_ids)
+        finally:
+            self._sync_lock.release()
+
+    def rank(self, job_description, top_k=20):
+        """
+        Returns [{'candidate_id', 'score', 'matched_terms'}] for the top_k
+        best matches with a positive score
+        """
+        with self._lock:
+            query = Counter(token for token in self.tokenize(job_description) if token in self.vocabulary)
+            active_count = int(self.active.sum())
+            if not query or active_count == 0:
+                return []
+
+            columns = np.fromiter((self.vocabulary[term] for term in query), dtype=np.int64, count=len(query))
+            query_weights = 1.0 + np.log(np.fromiter(query.values(), dtype=np.float64, count=len(query)))
+
+            matrix = self._column_matrix()
+            row_count = matrix.shape[0]
+            doc_lengths = self.doc_lengths[:row_count]
+            average_length = doc_lengths.sum() / active_count or 1.0
+
+            doc_freq = self.doc_freq[columns].astype(np.float64)
+            idf = np.log1p((active_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+            hits = matrix[:, columns].tocoo()
+            term_freq = hits.data
+            saturation = term_freq * (self.k1 + 1) / (
+                term_freq + self.k1 * (1 - self.b + self.b * doc_lengths[hits.row] / average_length)
+            )
+            contributions = saturation * (idf * query_weights)[hits.col]
+            scores = np.bincount(hits.row, weights=contributions, minlength=row_count)
+
+            top_k = min(top_k, int(np.count_nonzero(scores)))
+            if top_k <= 0:
+                return []
+
+            top_rows = np.argpartition(-scores, top_k - 1)[:top_k]
+            top_rows = top_rows[np.argsort(-scores[top_rows], kind='stable')]
+
+            in_top = np.isin(hits.row, top_rows)
+            matched = {}
+            for row, column, value in zip(hits.row[in_top], hits.col[in_top], contributions[in_top]):
+                matched.setdefault(row, []).append((value, self.terms[columns[column]]))
+
+            return [
+                {
+                    'candidate_id': self.candidate_ids[row],
+                    'score': round(float(scores[row]), 4),
+                    'matched_terms': [term for _, term in sorted(matched.get(row, []), reverse=True)[:self.MATCHED_TERMS]]
+                }
+                for row in top_rows
+            ]
+
+    def stats(self):
+        with self._lock:
+            return {
+                'candidates': int(self.active.sum()),
+                'rows': len(self.candidate_ids),
+                'terms': len(self.terms),
+                'nonzeros': int(self._matrix.nnz) + sum(len(indices) for indices, _ in self._pending)
+            }
+
+
+_ranker = None
+_ranker_lock = threading.Lock()
+
+def get_candidate_ranker():
+    global _ranker
+    if _ranker is None:
+        with _ranker_lock:
+            if _ranker is None:
+                _ranker = CandidateRanker.from_config()
+    return _ranker
@@ -0,0 +1,74 @@
+import hashlib
+import mimetypes
+import os
+from urllib.parse import quote
+from flask import Response, request, send_file
+from config import Config
+
+class DocumentServer:
+    """
+    Serves stored files with strong ETags taken from their content hash,
+    conditional GET (304), byte ranges (206) and long-lived private cache
+    headers. Stored files never change once written, so they are marked
+    immutable. With DOCUMENT_SENDFILE_MODE set, the bytes are handed off
+    to the front-end server (nginx X-Accel-Redirect or X-Sendfile) and
+    the worker only returns headers.
+    """
+
+    CACHE_CONTROL = 'private, max-age=31536000, immutable'
+
+    @staticmethod
+    def file_hash(path, chunk_size=64 * 1024):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as source:
+            for chunk in iter(lambda: source.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _not_modified(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = DocumentServer.CACHE_CONTROL
+        return response
+
+    @staticmethod
+    def _accel_redirect(path, download_name, etag):
+        relative_path = os.path.relpath(os.path.abspath(path), os.path.abspath(Config.UPLOAD_FOLDER))
+        if relative_path.startswith('..'):
+            raise ValueError("File is outside the upload folder")
+
+        response = Response(status=200)
+        response.headers['X-Accel-Redirect'] = Config.DOCUMENT_ACCEL_REDIRECT_PREFIX.rstrip('/') + '/' + quote(
+            relative_path.replace(os.sep, '/')
+        )
+        response.headers['Content-Type'] = mimetypes.guess_type(download_name)[0] or 'application/octet-stream'
+        response.headers['Content-Disposition'] = f"inline; filename*=UTF-8''{quote(download_name)}"
+        response.headers['Cache-Control'] = DocumentServer.CACHE_CONTROL
+        response.set_etag(etag)
+        return response
+
+    @staticmethod
+    def send(path, download_name, content_hash):
+        """
+        Returns the response for a stored file. content_hash is the file's
+        SHA-256 and becomes its ETag.
+        """
+        if content_hash in request.if_none_match:
+            return DocumentServer._not_modified(content_hash)
+
+        if Config.DOCUMENT_SENDFILE_MODE == 'x-accel':
+            return DocumentServer._accel_redirect(path, download_name, content_hash)
+
+        # With USE_X_SENDFILE (DOCUMENT_SENDFILE_MODE=x-sendfile) send_file only emits the header
+        response = send_file(
+            os.path.abspath(path),
+            as_attachment=False,
+            download_name=download_name,
+            conditional=True,
+            etag=content_hash,
+            max_age=31536000
+        )
+        response.headers['Cache-Control'] = DocumentServer.CACHE_CONTROL
+        response.headers.setdefault('Accept-Ranges', 'bytes')
+        return response
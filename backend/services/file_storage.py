@@ -1,37 +1,239 @@
 import os
 import uuid
+import errno
+import hashlib
+import shutil
+import tempfile
 from werkzeug.utils import secure_filename
+from services.image_normalizer import ImageNormalizer
+from services.metrics import FILE_SAVE_BYTES, FILE_SAVE_SECONDS
+from services.storage import get_storage, storage_for_path
 from config import Config
 
+class UploadSpool:
+    """
+    File object that multipart uploads are parsed straight into: a temp
+    file under UPLOAD_FOLDER/tmp that hashes the bytes and keeps the first
+    kilobyte for type sniffing as they arrive. FileStorage renames it into
+    place, so the upload is written once and never held in memory. If
+    nothing claims it, closing the spool deletes the temp file.
+    """
+
+    HEAD_SIZE = 1024
+
+    def __init__(self, directory=None, max_size=None):
+        directory = directory or os.path.join(Config.UPLOAD_FOLDER, 'tmp')
+        os.makedirs(directory, exist_ok=True)
+
+        self._file = tempfile.NamedTemporaryFile(dir=directory, prefix='upload-', suffix='.part', delete=False)
+        self.path = self._file.name
+        self.max_size = max_size
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.head = b''
+        self.too_large = False
+        self.claimed = False
+
+    def write(self, data):
+        self.size += len(data)
+        if self.too_large or (self.max_size is not None and self.size > self.max_size):
+            # Keep counting but stop writing; saving the upload will reject it
+            self.too_large = True
+            return len(data)
+
+        if len(self.head) < self.HEAD_SIZE:
+            self.head += bytes(data[:self.HEAD_SIZE - len(self.head)])
+        self.digest.update(data)
+        return self._file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def __iter__(self):
+        return iter(self._file)
+
+    def claim(self, destination):
+        """
+        Moves the spooled bytes to destination (same filesystem) and returns
+        their SHA-256 hex digest
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        try:
+            os.replace(self.path, destination)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(self.path, destination)
+        self.claimed = True
+        return self.digest.hexdigest()
+
+    def close(self):
+        self._file.close()
+        if not self.claimed and os.path.exists(self.path):
+            os.remove(self.path)
+
+
 class FileStorage:
+    # Leading bytes each allowed extension must start with (PDFs may have a short preamble)
+    SIGNATURES = {
+        'pdf': [b'%PDF-'],
+        'docx': [b'PK\x03\x04'],
+        'jpg': [b'\xff\xd8\xff'],
+        'jpeg': [b'\xff\xd8\xff'],
+        'png': [b'\x89PNG\r\n\x1a\n']
+    }
+
     @staticmethod
     def allowed_file(filename, allowed_extensions):
         return '.' in filename and \
                filename.rsplit('.', 1)[1].lower() in allowed_extensions
 
     @staticmethod
-    def save_resume(file):
+    def matches_signature(filename, head):
+        extension = filename.rsplit('.', 1)[1].lower()
+        signatures = FileStorage.SIGNATURES.get(extension)
+        if not signatures:
+            return True
+        if extension == 'pdf':
+            return any(signature in head[:UploadSpool.HEAD_SIZE] for signature in signatures)
+        return any(head.startswith(signature) for signature in signatures)
+
+    @staticmethod
+    def save_resume(file, max_size=None):
         if not file:
             raise ValueError("No file provided")
 
         if not FileStorage.allowed_file(file.filename, Config.ALLOWED_RESUME_EXTENSIONS):
             raise ValueError("Invalid file type. Only PDF and DOCX files are allowed.")
 
+        return FileStorage._store(file, 'resumes', max_size=max_size)
+
+    @staticmethod
+    def _store(file, kind, max_size=None, normalize_images=False):
+        """
+        Writes the upload to a staging file in UPLOAD_FOLDER/tmp, then hands
+        it to the configured storage backend, which decides its final path.
+        With normalize_images, photos are replaced by their normalized copy;
+        the original is stored as well only if DOCUMENT_KEEP_ORIGINAL is set.
+        """
+        with FILE_SAVE_SECONDS.time(kind=kind, outcome='ok'):
+            file_info = FileStorage._stage_and_store(file, kind, max_size, normalize_images)
+        FILE_SAVE_BYTES.inc(file_info['size'], kind=kind)
+        return file_info
+
+    @staticmethod
+    def _stage_and_store(file, kind, max_size, normalize_images):
         filename = secure_filename(file.filename)
-        unique_filename = f"{uuid.uuid4()}_{filename}"
 
-        resume_folder = os.path.join(Config.UPLOAD_FOLDER, 'resumes')
-        os.makedirs(resume_folder, exist_ok=True)
+        staging_folder = os.path.join(Config.UPLOAD_FOLDER, 'tmp')
+        os.makedirs(staging_folder, exist_ok=True)
+        staging_path = os.path.join(staging_folder, f"{uuid.uuid4().hex}.part")
+
+        content_hash, size = FileStorage._save_and_hash(file, staging_path, max_size=max_size)
+        original_hash, original_size = content_hash, size
+        original_path = None
+        normalized = None
+
+        try:
+            if normalize_images and ImageNormalizer.supports(filename):
+                try:
+                    normalized = ImageNormalizer.normalize(staging_path, filename)
+                except Exception as e:
+                    # Pillow cannot read it; the file passed the signature check, so keep it as uploaded
+                    print(f"[STORAGE] Image normalization skipped for {filename}: {str(e)}")
+
+            if normalized is not None:
+                if Config.DOCUMENT_KEEP_ORIGINAL:
+                    original_path = get_storage().store(staging_path, 'originals', filename, content_hash, size)
+                else:
+                    os.remove(staging_path)
+                staging_path, content_hash, size = normalized
 
-        file_path = os.path.join(resume_folder, unique_filename)
-        file.save(file_path)
+            file_path = get_storage().store(staging_path, kind, filename, content_hash, size)
+        except BaseException:
+            for path in (staging_path, normalized and normalized[0]):
+                if path and os.path.exists(path):
+                    os.remove(path)
+            raise
 
         return {
             'filename': filename,
-            'unique_filename': unique_filename,
-            'path': file_path
+            'unique_filename': os.path.basename(file_path),
+            'path': file_path,
+            'content_hash': content_hash,
+            'size': size,
+            'original_hash': original_hash,
+            'original_size': original_size,
+            'original_path': original_path
         }
 
+    @staticmethod
+    def _save_and_hash(file, file_path, chunk_size=64 * 1024, max_size=None):
+        """
+        Stores the upload at file_path and returns (sha256, size). Uploads
+        parsed into an UploadSpool are renamed into place; other streams
+        (e.g. ZIP entries) are copied chunk by chunk into a temp file next
+        to file_path, hashing and checking the size as they go, then
+        renamed. Either way the file type is sniffed from its first bytes
+        and nothing is left behind on failure.
+        """
+        max_size = Config.MAX_CONTENT_LENGTH if max_size is None else max_size
+        stream = file.stream
+
+        if isinstance(stream, UploadSpool) and not stream.claimed:
+            if stream.too_large or stream.size > max_size:
+                raise ValueError(f"File exceeds the maximum size of {max_size} bytes")
+            if not FileStorage.matches_signature(file.filename, stream.head):
+                raise ValueError("File content does not match its extension")
+            if stream.size == 0:
+                raise ValueError("File is empty")
+            return stream.claim(file_path), stream.size
+
+        digest = hashlib.sha256()
+        size = 0
+        head = b''
+        temp_path = None
+
+        try:
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(file_path), prefix='.upload-', suffix='.part',
+                                             delete=False) as destination:
+                temp_path = destination.name
+
+                while True:
+                    chunk = stream.read(chunk_size)
+                    if not chunk:
+                        break
+
+                    size += len(chunk)
+                    if size > max_size:
+                        raise ValueError(f"File exceeds the maximum size of {max_size} bytes")
+
+                    if len(head) < UploadSpool.HEAD_SIZE:
+                        head += chunk[:UploadSpool.HEAD_SIZE - len(head)]
+                        if len(head) >= UploadSpool.HEAD_SIZE and not FileStorage.matches_signature(file.filename, head):
+                            raise ValueError("File content does not match its extension")
+
+                    digest.update(chunk)
+                    destination.write(chunk)
+
+                if size == 0:
+                    raise ValueError("File is empty")
+                if not FileStorage.matches_signature(file.filename, head):
+                    raise ValueError("File content does not match its extension")
+
+                destination.flush()
+                os.fsync(destination.fileno())
+
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return digest.hexdigest(), size
+
     @staticmethod
     def save_document(file, document_type):
         if not file:
@@ -40,28 +242,16 @@ class FileStorage:
         if not FileStorage.allowed_file(file.filename, Config.ALLOWED_DOCUMENT_EXTENSIONS):
             raise ValueError("Invalid file type. Only PDF and image files are allowed.")
 
-        filename = secure_filename(file.filename)
-        unique_filename = f"{uuid.uuid4()}_{filename}"
-
-        documents_folder = os.path.join(Config.UPLOAD_FOLDER, 'documents')
-        os.makedirs(documents_folder, exist_ok=True)
-
-        file_path = os.path.join(documents_folder, unique_filename)
-        file.save(file_path)
-
-        return {
-            'filename': filename,
-            'unique_filename': unique_filename,
-            'path': file_path,
-            'size': os.path.getsize(file_path)
-        }
+        return FileStorage._store(file, 'documents', normalize_images=Config.DOCUMENT_IMAGE_NORMALIZE)
 
     @staticmethod
     def delete_file(file_path):
+        """
+        Drops one reference to a stored file; with content-addressed storage
+        the file itself goes once nothing else refers to it
+        """
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                return True
+            return storage_for_path(file_path).release(file_path)
         except Exception as e:
             print(f"Error deleting file: {str(e)}")
         return False
@@ -0,0 +1,93 @@
+import hashlib
+import os
+import tempfile
+import threading
+from config import Config
+
+class ImageNormalizer:
+    """
+    Shrinks submitted photos of ID cards: applies the EXIF orientation,
+    drops EXIF (camera and GPS data), downsamples so the longest side is at
+    most DOCUMENT_IMAGE_MAX_DIMENSION and recompresses (JPEG at
+    DOCUMENT_IMAGE_QUALITY, PNG losslessly optimized). The image keeps
+    its format, so the stored extension stays valid.
+    """
+
+    FORMATS = {'jpg': 'JPEG', 'jpeg': 'JPEG', 'png': 'PNG'}
+
+    _stats = {'normalized': 0, 'skipped': 0, 'bytes_in': 0, 'bytes_out': 0}
+    _stats_lock = threading.Lock()
+
+    @staticmethod
+    def supports(filename):
+        return '.' in filename and filename.rsplit('.', 1)[1].lower() in ImageNormalizer.FORMATS
+
+    @staticmethod
+    def _record(key, bytes_in=0, bytes_out=0):
+        with ImageNormalizer._stats_lock:
+            ImageNormalizer._stats[key] += 1
+            ImageNormalizer._stats['bytes_in'] += bytes_in
+            ImageNormalizer._stats['bytes_out'] += bytes_out
+
+    @staticmethod
+    def stats():
+        with ImageNormalizer._stats_lock:
+            stats = dict(ImageNormalizer._stats)
+        stats['bytes_saved'] = stats['bytes_in'] - stats['bytes_out']
+        return stats
+
+    @staticmethod
+    def normalize(path, filename):
+        """
+        Writes a normalized copy of the image at path next to it. Returns
+        (normalized_path, sha256, size), or None when the original should be
+        kept as is: it has no EXIF and recompressing would not make it
+        smaller.
+        """
+        from PIL import Image, ImageOps
+
+        image_format = ImageNormalizer.FORMATS[filename.rsplit('.', 1)[1].lower()]
+        max_dimension = Config.DOCUMENT_IMAGE_MAX_DIMENSION
+        original_size = os.path.getsize(path)
+
+        with Image.open(path) as image:
+            has_exif = bool(image.getexif())
+            icc_profile = image.info.get('icc_profile')
+
+            # JPEGs are decoded at the smallest DCT scale still at least max_dimension
+            image.draft('RGB', (max_dimension, max_dimension))
+            normalized = ImageOps.exif_transpose(image)
+            normalized.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+
+            if image_format == 'JPEG' and normalized.mode not in ('RGB', 'L'):
+                normalized = normalized.convert('RGB')
+
+            save_options = {'optimize': True}
+            if image_format == 'JPEG':
+                save_options.update(quality=Config.DOCUMENT_IMAGE_QUALITY, progressive=True)
+            if icc_profile:
+                save_options['icc_profile'] = icc_profile
+
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), prefix='.normalized-', suffix='.part',
+                                             delete=False) as destination:
+                normalized_path = destination.name
+                try:
+                    normalized.save(destination, image_format, **save_options)
+                except BaseException:
+                    destination.close()
+                    os.remove(normalized_path)
+                    raise
+
+        size = os.path.getsize(normalized_path)
+        if size >= original_size and not has_exif:
+            os.remove(normalized_path)
+            ImageNormalizer._record('skipped')
+            return None
+
+        digest = hashlib.sha256()
+        with open(normalized_path, 'rb') as source:
+            for chunk in iter(lambda: source.read(64 * 1024), b''):
+                digest.update(chunk)
+
+        ImageNormalizer._record('normalized', bytes_in=original_size, bytes_out=size)
+        return normalized_path, digest.hexdigest(), size
@@ -0,0 +1,193 @@
+import asyncio
+import os
+import socket
+import threading
+from datetime import datetime, timedelta
+from sqlalchemy import and_, or_, update
+from models import db, ProcessingJob
+from config import Config
+
+class JobQueue:
+    """
+    Durable, database-backed queue of resume processing jobs
+    """
+
+    @staticmethod
+    def enqueue(candidate_id, force_extraction=False, commit=True):
+        job = ProcessingJob(
+            candidate_id=candidate_id,
+            status='queued',
+            force_extraction=force_extraction,
+            max_attempts=Config.JOB_MAX_ATTEMPTS
+        )
+        db.session.add(job)
+
+        if commit:
+            db.session.commit()
+
+        return job
+
+    @staticmethod
+    def _claimable(now):
+        lease_expired = now - timedelta(seconds=Config.JOB_LEASE_SECONDS)
+        return or_(
+            and_(ProcessingJob.status == 'queued', ProcessingJob.available_at <= now),
+            and_(ProcessingJob.status == 'running', ProcessingJob.locked_at < lease_expired)
+        )
+
+    @staticmethod
+    def claim_next(worker_id, scan_size=5):
+        """
+        Atomically claims the oldest available job. Jobs whose lease expired
+        (the worker holding them died) are picked up again.
+        """
+        now = datetime.utcnow()
+
+        job_ids = [
+            row.id for row in db.session.query(ProcessingJob.id)
+            .filter(JobQueue._claimable(now))
+            .order_by(ProcessingJob.available_at, ProcessingJob.created_at)
+            .limit(scan_size)
+        ]
+
+        for job_id in job_ids:
+            result = db.session.execute(
+                update(ProcessingJob)
+                .where(ProcessingJob.id == job_id, JobQueue._claimable(now))
+                .values(
+                    status='running',
+                    locked_by=worker_id,
+                    locked_at=now,
+                    attempts=ProcessingJob.attempts + 1,
+                    started_at=now,
+                    updated_at=now
+                )
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+
+            if result.rowcount == 1:
+                return db.session.get(ProcessingJob, job_id)
+
+        return None
+
+    @staticmethod
+    def complete(job):
+        job.status = 'completed'
+        job.completed_at = datetime.utcnow()
+        job.locked_by = None
+        job.locked_at = None
+        db.session.commit()
+
+    @staticmethod
+    def fail(job, error):
+        """
+        Records a failure and reschedules the job with linear backoff until
+        max_attempts is exhausted. Returns True when the job will be retried.
+        """
+        job.last_error = str(error)
+        job.locked_by = None
+        job.locked_at = None
+
+        if job.attempts < job.max_attempts:
+            job.status = 'queued'
+            job.available_at = datetime.utcnow() + timedelta(
+                seconds=Config.JOB_RETRY_BACKOFF_SECONDS * job.attempts
+            )
+            db.session.commit()
+            return True
+
+        job.status = 'failed'
+        job.completed_at = datetime.utcnow()
+        db.session.commit()
+        return False
+
+    @staticmethod
+    def latest_for_candidate(candidate_id):
+        return ProcessingJob.query.filter_by(candidate_id=candidate_id) \
+            .order_by(ProcessingJob.created_at.desc()).first()
+
+
+class ResumeWorkerPool:
+    """
+    Pool of background threads that drain the job queue. Each thread keeps
+    up to `concurrency` claimed jobs in flight on its pipeline's event loop.
+    """
+
+    def __init__(self, app, size=None, poll_interval=None, concurrency=None):
+        self.app = app
+        self.size = Config.RESUME_WORKER_COUNT if size is None else size
+        self.poll_interval = Config.RESUME_WORKER_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.concurrency = Config.AGENT_MAX_CONCURRENCY if concurrency is None else concurrency
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        from services.resume_pipeline import ResumePipeline
+
+        for index in range(self.size):
+            worker_id = f"{socket.gethostname()}:{os.getpid()}:{index}"
+            thread = threading.Thread(
+                target=self._run,
+                args=(worker_id, ResumePipeline()),
+                name=f"resume-worker-{index}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        print(f"[WORKER] Started {self.size} resume worker(s), {self.concurrency} job(s) each")
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def _run(self, worker_id, pipeline):
+        try:
+            pipeline.execute(self._work(worker_id, pipeline))
+        finally:
+            pipeline.close()
+
+    async def _work(self, worker_id, pipeline):
+        """
+        Claims jobs while fewer than `concurrency` are running, then waits
+        for one to finish or for the poll interval to pass. Jobs still
+        running when the pool stops are finished first.
+        """
+        running = set()
+
+        while not self._stop.is_set():
+            while len(running) < self.concurrency:
+                job_id = self._claim(worker_id)
+                if job_id is None:
+                    break
+                running.add(asyncio.create_task(self._process(worker_id, pipeline, job_id)))
+
+            if running:
+                _, running = await asyncio.wait(
+                    running, timeout=self.poll_interval, return_when=asyncio.FIRST_COMPLETED
+                )
+            else:
+                await asyncio.sleep(self.poll_interval)
+
+        if running:
+            await asyncio.wait(running)
+
+    def _claim(self, worker_id):
+        try:
+            with self.app.app_context():
+                job = JobQueue.claim_next(worker_id)
+                return None if job is None else job.id
+        except Exception as e:
+            print(f"[WORKER] {worker_id} error: {str(e)}")
+            return None
+
+    async def _process(self, worker_id, pipeline, job_id):
+        # Each task pushes its own app context, so each job gets its own session
+        try:
+            with self.app.app_context():
+                await pipeline.run(db.session.get(ProcessingJob, job_id))
+        except Exception as e:
+            print(f"[WORKER] {worker_id} error: {str(e)}")
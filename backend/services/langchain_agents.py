@@ -1,17 +1,104 @@
-from langchain_openai import AzureChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
 from config import Config
+from services.llm_cache import LLMCache, get_llm_cache
+from services.llm_clients import get_llm_clients
+from services.local_extractor import LocalExtractor
+from services.metrics import LLM_CALL_SECONDS, LLM_TOKENS
+from services.resume_compactor import ResumeCompactor
+import asyncio
 import json
 import re
 
-llm = AzureChatOpenAI(
-    azure_endpoint=Config.AZURE_OPENAI_ENDPOINT,
-    api_key=Config.AZURE_OPENAI_API_KEY,
-    api_version=Config.AZURE_OPENAI_API_VERSION,
-    deployment_name=Config.AZURE_OPENAI_DEPLOYMENT_NAME,
-    temperature=0.3
-)
+class _LazyPrompt:
+    """
+    Builds the ChatPromptTemplate on first access, so importing the agents
+    (e.g. when the worker pool starts) does not import LangChain
+    """
+
+    def __init__(self, template):
+        self.template = template
+        self._prompt = None
+
+    def __get__(self, instance, owner):
+        if self._prompt is None:
+            from langchain_core.prompts import ChatPromptTemplate
+            self._prompt = ChatPromptTemplate.from_template(self.template)
+        return self._prompt
+
+
+def _cache_key(prompt, llm, variables, template_version):
+    return LLMCache.make_key(
+        llm.deployment_name,
+        template_version,
+        llm.temperature,
+        prompt.format(**variables)
+    )
+
+
+def _is_cacheable(content, validate):
+    if validate is None:
+        return True
+    try:
+        validate(content)
+        return True
+    except Exception:
+        return False
+
+
+def _record_usage(template_version, response):
+    usage = getattr(response, 'usage_metadata', None)
+    if usage:
+        LLM_TOKENS.inc(usage.get('input_tokens', 0), agent=template_version, type='prompt')
+        LLM_TOKENS.inc(usage.get('output_tokens', 0), agent=template_version, type='completion')
+
+
+def invoke_cached(prompt, llm, variables, template_version, validate=None):
+    """
+    Runs prompt | llm and returns the response content, serving identical
+    requests from the LLM cache. Responses rejected by `validate` are
+    returned but never cached.
+    """
+    cache = get_llm_cache()
+    key = _cache_key(prompt, llm, variables, template_version)
+
+    content = cache.get(key)
+    if content is not None:
+        print(f"[LLM CACHE] Hit for {template_version}")
+        LLM_CALL_SECONDS.observe(0, agent=template_version, outcome='cache_hit')
+        return content
+
+    chain = prompt | llm
+    with LLM_CALL_SECONDS.time(agent=template_version, outcome='ok'):
+        response = chain.invoke(variables)
+    _record_usage(template_version, response)
+    content = response.content
+
+    if _is_cacheable(content, validate):
+        cache.set(key, content)
+    return content
+
+
+async def ainvoke_cached(prompt, llm, variables, template_version, validate=None):
+    """
+    Async counterpart of invoke_cached built on chain.ainvoke
+    """
+    cache = get_llm_cache()
+    key = _cache_key(prompt, llm, variables, template_version)
+
+    content = await asyncio.to_thread(cache.get, key)
+    if content is not None:
+        print(f"[LLM CACHE] Hit for {template_version}")
+        LLM_CALL_SECONDS.observe(0, agent=template_version, outcome='cache_hit')
+        return content
+
+    chain = prompt | llm
+    with LLM_CALL_SECONDS.time(agent=template_version, outcome='ok'):
+        response = await chain.ainvoke(variables)
+    _record_usage(template_version, response)
+    content = response.content
+
+    if _is_cacheable(content, validate):
+        await asyncio.to_thread(cache.set, key, content)
+    return content
 
 
 class ResumeCheckerAgent:
@@ -19,28 +106,14 @@ class ResumeCheckerAgent:
     Agent specialized in analyzing and extracting information from resumes
     """
 
-    def __init__(self):
-        self.llm = llm
+    PROMPT_VERSION = 'resume-checker-v2'
 
-    def extract_information(self, resume_text: str) -> dict:
-        """
-        Extracts structured information from resume text with confidence scores
-        """
-        prompt = ChatPromptTemplate.from_template(
-            """You are an expert HR assistant specialized in resume analysis and information extraction.
+    PROMPT = _LazyPrompt(
+        """You are an expert HR assistant specialized in resume analysis and information extraction.
 
 Analyze the resume below and extract key information. Return ONLY a valid JSON object in this exact format:
 
-{{
-  "full_name": {{"value": "John Doe", "confidence": 0.95}},
-  "email": {{"value": "john@example.com", "confidence": 0.99}},
-  "phone": {{"value": "+91-9876543210", "confidence": 0.95}},
-  "current_company": {{"value": "Tech Corp", "confidence": 0.92}},
-  "designation": {{"value": "Senior Software Engineer", "confidence": 0.90}},
-  "skills": {{"value": ["Python", "React", "AWS"], "confidence": 0.88}},
-  "years_of_experience": 5,
-  "education": "B.Tech Computer Science"
-}}
+{output_format}
 
 Rules:
 - Use null for any field not found
@@ -51,55 +124,146 @@ Rules:
 
 Resume Text:
 {resume_text}"""
+    )
+
+    FIELD_FORMATS = {
+        'full_name': '"full_name": {"value": "John Doe", "confidence": 0.95}',
+        'email': '"email": {"value": "john@example.com", "confidence": 0.99}',
+        'phone': '"phone": {"value": "+91-9876543210", "confidence": 0.95}',
+        'current_company': '"current_company": {"value": "Tech Corp", "confidence": 0.92}',
+        'designation': '"designation": {"value": "Senior Software Engineer", "confidence": 0.90}',
+        'skills': '"skills": {"value": ["Python", "React", "AWS"], "confidence": 0.88}',
+        'years_of_experience': '"years_of_experience": 5',
+        'education': '"education": "B.Tech Computer Science"'
+    }
+
+    LOCAL_FIELDS = ['full_name', 'email', 'phone']
+
+    def __init__(self, mode: str = None):
+        self.mode = Config.AGENT_MODE if mode is None else mode
+
+    @property
+    def llm(self):
+        return get_llm_clients().chat_model()
+
+    def extract_information(self, resume_text: str) -> tuple:
+        """
+        Extracts structured information from resume text with confidence scores.
+        Fields resolved locally with high confidence are left out of the prompt.
+        Returns (extracted info, compaction stats of the prompt's resume text);
+        the stats are None when no LLM call was needed.
+        """
+        resolved, unresolved = self._resolve_locally(resume_text)
+        if not unresolved:
+            return self._merge(resolved, {}), None
+
+        variables, compaction = self._variables(resume_text, unresolved)
+        content = invoke_cached(
+            self.PROMPT, self.llm, variables, self.PROMPT_VERSION,
+            validate=self._parse_response
         )
 
-        chain = prompt | self.llm
+        return self._merge(resolved, self._handle_response(content)), compaction
 
-        response = chain.invoke({"resume_text": resume_text})
+    async def aextract_information(self, resume_text: str) -> tuple:
+        """
+        Async variant of extract_information
+        """
+        resolved, unresolved = self._resolve_locally(resume_text)
+        if not unresolved:
+            return self._merge(resolved, {}), None
+
+        variables, compaction = self._variables(resume_text, unresolved)
+        content = await ainvoke_cached(
+            self.PROMPT, self.llm, variables, self.PROMPT_VERSION,
+            validate=self._parse_response
+        )
 
-        try:
-            content = response.content.strip()
+        return self._merge(resolved, self._handle_response(content)), compaction
 
-            if content.startswith('```json'):
-                content = content[7:]
-            if content.startswith('```'):
-                content = content[3:]
-            if content.endswith('```'):
-                content = content[:-3]
-            content = content.strip()
+    def _resolve_locally(self, resume_text):
+        """
+        Returns (resolved fields, fields still needing the LLM). In 'local'
+        mode every field is treated as resolved and no LLM call is made.
+        """
+        if self.mode == 'llm':
+            return {}, list(self.FIELD_FORMATS)
 
-            parsed_output = json.loads(content)
+        local_data = LocalExtractor.extract(resume_text)
+        resolved = {}
 
-            return {
-                "full_name": parsed_output.get("full_name", {"value": None, "confidence": 0}),
-                "email": parsed_output.get("email", {"value": None, "confidence": 0}),
-                "phone": parsed_output.get("phone", {"value": None, "confidence": 0}),
-                "current_company": parsed_output.get("current_company", {"value": None, "confidence": 0}),
-                "designation": parsed_output.get("designation", {"value": None, "confidence": 0}),
-                "skills": parsed_output.get("skills", {"value": [], "confidence": 0}),
-                "years_of_experience": parsed_output.get("years_of_experience"),
-                "education": parsed_output.get("education")
-            }
+        for field in self.LOCAL_FIELDS:
+            if self.mode == 'local' or local_data[field]['confidence'] >= Config.LOCAL_EXTRACTION_MIN_CONFIDENCE:
+                resolved[field] = local_data[field]
+
+        if self.mode == 'local':
+            resolved['years_of_experience'] = local_data['years_of_experience']
+            return resolved, []
+
+        unresolved = [field for field in self.FIELD_FORMATS if field not in resolved]
+        print(f"[RESUME CHECKER] Resolved locally: {sorted(resolved)}; asking LLM for: {unresolved}")
+        return resolved, unresolved
+
+    def _variables(self, resume_text, fields):
+        """
+        Returns (prompt variables, compaction stats without the text)
+        """
+        compaction = ResumeCompactor.compact(resume_text)
+        print(f"[RESUME CHECKER] Resume tokens: {compaction['tokens_before']} → {compaction['tokens_after']}"
+              f" (dropped: {compaction['sections_dropped'] or 'none'})")
+
+        output_format = "{\n  " + ",\n  ".join(self.FIELD_FORMATS[field] for field in fields) + "\n}"
+        stats = {key: value for key, value in compaction.items() if key != 'text'}
+        return {"output_format": output_format, "resume_text": compaction['text']}, stats
+
+    def _merge(self, resolved, parsed_output):
+        merged = self._parse_response('{}') if not parsed_output else dict(parsed_output)
+        merged.update(resolved)
+        return merged
+
+    def _handle_response(self, content):
+        try:
+            return self._parse_response(content)
         except Exception as e:
             print(f"Parsing error: {str(e)}")
-            print(f"Raw response: {response.content}")
+            print(f"Raw response: {content}")
             raise
 
+    @staticmethod
+    def _parse_response(content):
+        content = content.strip()
+
+        if content.startswith('```json'):
+            content = content[7:]
+        if content.startswith('```'):
+            content = content[3:]
+        if content.endswith('```'):
+            content = content[:-3]
+        content = content.strip()
+
+        parsed_output = json.loads(content)
+
+        return {
+            "full_name": parsed_output.get("full_name", {"value": None, "confidence": 0}),
+            "email": parsed_output.get("email", {"value": None, "confidence": 0}),
+            "phone": parsed_output.get("phone", {"value": None, "confidence": 0}),
+            "current_company": parsed_output.get("current_company", {"value": None, "confidence": 0}),
+            "designation": parsed_output.get("designation", {"value": None, "confidence": 0}),
+            "skills": parsed_output.get("skills", {"value": [], "confidence": 0}),
+            "years_of_experience": parsed_output.get("years_of_experience"),
+            "education": parsed_output.get("education")
+        }
+
 
 class EmailWriterAgent:
     """
     Agent specialized in writing professional, personalized emails
     """
 
-    def __init__(self):
-        self.llm = llm
+    PROMPT_VERSION = 'email-writer-v1'
 
-    def generate_document_request_email(self, candidate_info: dict) -> str:
-        """
-        Generates a personalized, professional email requesting identity documents
-        """
-        prompt = ChatPromptTemplate.from_template(
-            """You are a professional HR communication specialist.
+    PROMPT = _LazyPrompt(
+        """You are a professional HR communication specialist.
 
 Your task is to write a polite, professional email requesting identity documents from a candidate.
 
@@ -127,19 +291,62 @@ Subject: [Write a clear subject line]
 [Email body]
 
 Write the complete email now:"""
-        )
+    )
+
+    @property
+    def llm(self):
+        return get_llm_clients().chat_model()
+
+    def generate_document_request_email(self, candidate_info: dict) -> str:
+        """
+        Generates a personalized, professional email requesting identity documents
+        """
+        if Config.AGENT_MODE == 'local':
+            return self.template_email(candidate_info)
+
+        content = invoke_cached(self.PROMPT, self.llm, self._variables(candidate_info), self.PROMPT_VERSION)
 
-        chain = prompt | self.llm
+        return content.strip()
 
-        response = chain.invoke({
+    async def agenerate_document_request_email(self, candidate_info: dict) -> str:
+        """
+        Async variant of generate_document_request_email
+        """
+        if Config.AGENT_MODE == 'local':
+            return self.template_email(candidate_info)
+
+        content = await ainvoke_cached(self.PROMPT, self.llm, self._variables(candidate_info), self.PROMPT_VERSION)
+
+        return content.strip()
+
+    @staticmethod
+    def template_email(candidate_info: dict) -> str:
+        """
+        Fixed-template email used when LLM calls are disabled
+        """
+        variables = EmailWriterAgent._variables(candidate_info)
+        return f"""Subject: Identity Documents Required for Verification
+
+Dear {variables['name'] or 'Candidate'},
+
+Thank you for your application for {variables['designation'] or 'the position'}. For further processing of your application we need a few documents from you.
+
+Please share a copy of your PAN Card and Aadhaar Card. These are required for identity verification purposes. You can reply to this email with the documents attached or upload them through our candidate portal.
+
+If you have any questions, feel free to reach out to us.
+
+Best regards,
+HR, TraqCheck"""
+
+    @staticmethod
+    def _variables(candidate_info):
+        return {
             "name": candidate_info.get('full_name', 'Candidate'),
             "email": candidate_info.get('email', ''),
             "phone": candidate_info.get('phone', ''),
             "company": candidate_info.get('current_company', 'our organization'),
             "designation": candidate_info.get('designation', 'the position')
-        })
-
-        return response.content.strip()
+        }
 
 
 class RequestSenderAgent:
@@ -147,15 +354,10 @@ class RequestSenderAgent:
     Agent responsible for preparing and logging document requests
     """
 
-    def __init__(self):
-        self.llm = llm
+    PROMPT_VERSION = 'request-sender-v1'
 
-    def prepare_request(self, candidate_info: dict, email_content: str) -> dict:
-        """
-        Prepares the document request with metadata and logging information
-        """
-        prompt = ChatPromptTemplate.from_template(
-            """You are validating and preparing a document request.
+    PROMPT = _LazyPrompt(
+        """You are validating and preparing a document request.
 
 Candidate Information:
 - Name: {name}
@@ -175,19 +377,41 @@ Your task:
     "priority": "high", "medium", or "low",
     "summary": "One-line summary of the request"
 }}"""
+    )
+
+    @property
+    def llm(self):
+        return get_llm_clients().chat_model()
+
+    def prepare_request(self, candidate_info: dict, email_content: str) -> dict:
+        """
+        Prepares the document request with metadata and logging information
+        """
+        if Config.AGENT_MODE == 'local':
+            return self._build_request(candidate_info, email_content, None)
+
+        content = invoke_cached(
+            self.PROMPT, self.llm,
+            self._variables(candidate_info, email_content),
+            self.PROMPT_VERSION,
+            validate=json.loads
         )
 
-        chain = prompt | self.llm
+        return self._build_request(candidate_info, email_content, content)
 
-        response = chain.invoke({
+    @staticmethod
+    def _variables(candidate_info, email_content):
+        return {
             "name": candidate_info.get('full_name', 'Candidate'),
             "email": candidate_info.get('email', ''),
             "phone": candidate_info.get('phone', ''),
             "email_content": email_content
-        })
+        }
 
+    @staticmethod
+    def _build_request(candidate_info, email_content, content):
         try:
-            validation = json.loads(response.content)
+            validation = json.loads(content)
 
             return {
                 "candidate_email": candidate_info.get('email'),
@@ -220,21 +444,25 @@ class AgentOrchestrator:
         self.email_writer = EmailWriterAgent()
         self.request_sender = RequestSenderAgent()
 
+    @staticmethod
+    def candidate_info(extracted_info: dict) -> dict:
+        return {
+            'full_name': extracted_info.get('full_name', {}).get('value'),
+            'email': extracted_info.get('email', {}).get('value'),
+            'phone': extracted_info.get('phone', {}).get('value'),
+            'current_company': extracted_info.get('current_company', {}).get('value'),
+            'designation': extracted_info.get('designation', {}).get('value')
+        }
+
     def process_resume_and_request_documents(self, resume_text: str) -> dict:
         """
         Complete workflow: Extract info → Generate email → Prepare request
         """
         print("[ORCHESTRATOR] Step 1: Analyzing resume with ResumeCheckerAgent...")
-        extracted_info = self.resume_checker.extract_information(resume_text)
+        extracted_info, compaction = self.resume_checker.extract_information(resume_text)
 
         print("[ORCHESTRATOR] Step 2: Generating email with EmailWriterAgent...")
-        candidate_info = {
-            'full_name': extracted_info.get('full_name', {}).get('value'),
-            'email': extracted_info.get('email', {}).get('value'),
-            'phone': extracted_info.get('phone', {}).get('value'),
-            'current_company': extracted_info.get('current_company', {}).get('value'),
-            'designation': extracted_info.get('designation', {}).get('value')
-        }
+        candidate_info = self.candidate_info(extracted_info)
         email_content = self.email_writer.generate_document_request_email(candidate_info)
 
         print("[ORCHESTRATOR] Step 3: Preparing request with RequestSenderAgent...")
@@ -245,5 +473,55 @@ class AgentOrchestrator:
         return {
             "extracted_data": extracted_info,
             "request_message": email_content,
-            "request_metadata": request_data
+            "request_metadata": request_data,
+            "compaction": compaction
         }
+
+
+_email_writer = None
+
+def get_email_writer():
+    """
+    EmailWriterAgent shared by request handlers; it keeps no per-call state
+    """
+    global _email_writer
+    if _email_writer is None:
+        _email_writer = EmailWriterAgent()
+    return _email_writer
+
+
+class AgentStepTimeout(Exception):
+    pass
+
+
+class AsyncAgentOrchestrator:
+    """
+    Runs ResumePipeline's LLM steps with ainvoke on an event loop owned by
+    the pipeline, so each worker thread keeps its own pooled async
+    connections. Every step is bounded by AGENT_STEP_TIMEOUT_SECONDS and
+    cancelled when it runs over. ResumeWorkerPool runs several jobs at once
+    on that loop through the pipeline's one orchestrator, which keeps no
+    per-call state.
+    """
+
+    def __init__(self, step_timeout: float = None):
+        self.resume_checker = ResumeCheckerAgent()
+        self.email_writer = EmailWriterAgent()
+        self.step_timeout = Config.AGENT_STEP_TIMEOUT_SECONDS if step_timeout is None else step_timeout
+
+    async def _run_step(self, name: str, coroutine):
+        try:
+            return await asyncio.wait_for(coroutine, timeout=self.step_timeout)
+        except asyncio.TimeoutError:
+            raise AgentStepTimeout(f"Step '{name}' timed out after {self.step_timeout}s")
+
+    async def extract(self, resume_text: str) -> tuple:
+        """
+        Returns (extracted info, compaction stats or None)
+        """
+        return await self._run_step('extract', self.resume_checker.aextract_information(resume_text))
+
+    async def write_email(self, candidate_info: dict) -> str:
+        return await self._run_step(
+            'generate_email', self.email_writer.agenerate_document_request_email(candidate_info)
+        )
@@ -0,0 +1,193 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from config import Config
+
+class LLMCache:
+    """
+    Two-tier cache for LLM responses: an in-process LRU in front of a
+    SQLite file with TTL and size-based eviction
+    """
+
+    EVICTION_CHECK_INTERVAL = 50
+
+    def __init__(self, path, memory_entries=256, max_entries=10000, ttl_seconds=604800, enabled=True):
+        self.path = path
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+        self._memory = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._connection = None
+        self._writes_since_eviction = 0
+
+        self._counters = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'writes': 0,
+            'evictions': 0
+        }
+
+    @classmethod
+    def from_config(cls):
+        return cls(
+            path=Config.LLM_CACHE_PATH,
+            memory_entries=Config.LLM_CACHE_MEMORY_ENTRIES,
+            max_entries=Config.LLM_CACHE_MAX_ENTRIES,
+            ttl_seconds=Config.LLM_CACHE_TTL_SECONDS,
+            enabled=Config.LLM_CACHE_ENABLED
+        )
+
+    @staticmethod
+    def make_key(deployment, template_version, temperature, rendered_input):
+        digest = hashlib.sha256(rendered_input.encode('utf-8')).hexdigest()
+        return f"{deployment}:{template_version}:{temperature}:{digest}"
+
+    def _db(self):
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            connection = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )"""
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS ix_llm_cache_last_access ON llm_cache (last_access)')
+            connection.commit()
+            self._connection = connection
+
+        return self._connection
+
+    def _remember(self, key, value, expires_at):
+        with self._memory_lock:
+            self._memory[key] = (value, expires_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _count(self, counter, amount=1):
+        with self._memory_lock:
+            self._counters[counter] += amount
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+
+        now = time.time()
+
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._memory.move_to_end(key)
+                    self._counters['memory_hits'] += 1
+                    return entry[0]
+                del self._memory[key]
+
+        try:
+            with self._disk_lock:
+                db = self._db()
+                row = db.execute(
+                    'SELECT value, expires_at FROM llm_cache WHERE key = ? AND expires_at > ?',
+                    (key, now)
+                ).fetchone()
+                if row is not None:
+                    db.execute('UPDATE llm_cache SET last_access = ? WHERE key = ?', (now, key))
+                    db.commit()
+        except sqlite3.Error as e:
+            print(f"[LLM CACHE] Disk tier unavailable: {str(e)}")
+            row = None
+
+        if row is None:
+            self._count('misses')
+            return None
+
+        self._count('disk_hits')
+        self._remember(key, row[0], row[1])
+        return row[0]
+
+    def set(self, key, value):
+        if not self.enabled:
+            return
+
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        self._remember(key, value, expires_at)
+
+        try:
+            with self._disk_lock:
+                db = self._db()
+                db.execute(
+                    'INSERT OR REPLACE INTO llm_cache (key, value, created_at, expires_at, last_access) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (key, value, now, expires_at, now)
+                )
+                db.commit()
+
+                self._writes_since_eviction += 1
+                if self._writes_since_eviction >= self.EVICTION_CHECK_INTERVAL:
+                    self._writes_since_eviction = 0
+                    self._evict(db, now)
+        except sqlite3.Error as e:
+            print(f"[LLM CACHE] Disk tier unavailable: {str(e)}")
+
+        self._count('writes')
+
+    def _evict(self, db, now):
+        evicted = db.execute('DELETE FROM llm_cache WHERE expires_at <= ?', (now,)).rowcount
+
+        overflow = db.execute('SELECT COUNT(*) FROM llm_cache').fetchone()[0] - self.max_entries
+        if overflow > 0:
+            evicted += db.execute(
+                'DELETE FROM llm_cache WHERE key IN '
+                '(SELECT key FROM llm_cache ORDER BY last_access LIMIT ?)',
+                (overflow,)
+            ).rowcount
+
+        db.commit()
+        if evicted:
+            self._count('evictions', evicted)
+
+    def clear(self):
+        with self._memory_lock:
+            self._memory.clear()
+        with self._disk_lock:
+            db = self._db()
+            db.execute('DELETE FROM llm_cache')
+            db.commit()
+
+    def stats(self):
+        with self._memory_lock:
+            stats = dict(self._counters)
+            stats['memory_entries'] = len(self._memory)
+
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['memory_hits'] + stats['disk_hits']) / lookups, 4) if lookups else 0.0
+        return stats
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_llm_cache():
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMCache.from_config()
+    return _cache
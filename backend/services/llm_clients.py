@@ -0,0 +1,198 @@
+import asyncio
+import os
+import threading
+import httpx
+from config import Config
+from services.metrics import LLM_RETRIES
+
+class _PerLoopTransport(httpx.AsyncBaseTransport):
+    """
+    Async connections belong to the event loop that opened them, and every
+    ResumePipeline worker thread runs its own loop; keep one pool per live
+    loop. A loop's owner closes its pool with aclose_current_loop() before
+    closing the loop. A pool left behind by a loop closed without that can
+    no longer be closed; it is dropped, and its sockets are released when it
+    is garbage collected.
+    """
+
+    def __init__(self, limits):
+        self.limits = limits
+        self._transports = {}
+        self._lock = threading.Lock()
+
+    def _drop_closed_loops(self):
+        for loop in [loop for loop in self._transports if loop.is_closed()]:
+            del self._transports[loop]
+
+    def _transport(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                self._drop_closed_loops()
+                transport = self._transports[loop] = httpx.AsyncHTTPTransport(limits=self.limits)
+            return transport
+
+    async def handle_async_request(self, request):
+        return await self._transport().handle_async_request(request)
+
+    async def aclose_current_loop(self):
+        """
+        Closes the running loop's pool; call before closing the loop
+        """
+        with self._lock:
+            transport = self._transports.pop(asyncio.get_running_loop(), None)
+            self._drop_closed_loops()
+        if transport is not None:
+            await transport.aclose()
+
+    async def aclose(self):
+        """
+        httpx.AsyncClient.aclose() lands here. Only the running loop's pool
+        can be closed from it; pools of other live loops are left to them.
+        """
+        await self.aclose_current_loop()
+
+
+class LLMClients:
+    """
+    Process-wide Azure OpenAI clients. Every agent and extractor shares one
+    keep-alive httpx connection pool (sync, and async per event loop)
+    instead of opening its own, and nothing is built until the first LLM call, so
+    importing the app neither needs Azure settings nor opens sockets.
+    After a fork (gunicorn --preload) the child drops the parent's clients
+    and builds its own on first use.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._http_client = None
+        self._async_http_client = None
+        self._async_transport = None
+        self._openai_client = None
+        self._chat_model = None
+
+    @staticmethod
+    def _check_config():
+        missing = [
+            name for name in ('AZURE_OPENAI_ENDPOINT', 'AZURE_OPENAI_API_KEY', 'AZURE_OPENAI_API_VERSION')
+            if not getattr(Config, name)
+        ]
+        if missing:
+            raise ValueError(f"Azure OpenAI is not configured; set {', '.join(missing)}")
+
+    @staticmethod
+    def _limits():
+        # Async pools are per event loop and each worker loop runs up to
+        # AGENT_MAX_CONCURRENCY jobs; the sync pool is shared by the worker
+        # and request threads. A few spare for calls such as manual requests.
+        max_connections = Config.LLM_HTTP_MAX_CONNECTIONS or \
+            max(Config.RESUME_WORKER_COUNT, Config.AGENT_MAX_CONCURRENCY) + 4
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=Config.LLM_HTTP_KEEPALIVE_SECONDS
+        )
+
+    @staticmethod
+    def _timeout():
+        return httpx.Timeout(Config.LLM_HTTP_TIMEOUT_SECONDS, connect=Config.LLM_HTTP_CONNECT_TIMEOUT_SECONDS)
+
+    @staticmethod
+    def _count_retry(request):
+        # The OpenAI SDK numbers its attempts in this header; anything above 0
+        # is a retry after a 429, 5xx or connection error
+        if request.headers.get('x-stainless-retry-count', '0') not in ('', '0'):
+            LLM_RETRIES.inc()
+
+    @staticmethod
+    async def _acount_retry(request):
+        LLMClients._count_retry(request)
+
+    def http_client(self):
+        if self._http_client is None:
+            with self._lock:
+                if self._http_client is None:
+                    self._http_client = httpx.Client(
+                        limits=self._limits(),
+                        timeout=self._timeout(),
+                        event_hooks={'request': [self._count_retry]}
+                    )
+        return self._http_client
+
+    def async_http_client(self):
+        if self._async_http_client is None:
+            with self._lock:
+                if self._async_http_client is None:
+                    self._async_transport = _PerLoopTransport(self._limits())
+                    self._async_http_client = httpx.AsyncClient(
+                        transport=self._async_transport,
+                        timeout=self._timeout(),
+                        event_hooks={'request': [self._acount_retry]}
+                    )
+        return self._async_http_client
+
+    async def aclose_current_loop(self):
+        """
+        Closes the async connections opened on the running loop, for callers
+        about to close a loop they own
+        """
+        if self._async_transport is not None:
+            await self._async_transport.aclose_current_loop()
+
+    def openai_client(self):
+        """
+        AzureOpenAI SDK client used by AIExtractor and AIAgent
+        """
+        if self._openai_client is None:
+            self._check_config()
+            http_client = self.http_client()
+            with self._lock:
+                if self._openai_client is None:
+                    from openai import AzureOpenAI
+                    self._openai_client = AzureOpenAI(
+                        azure_endpoint=Config.AZURE_OPENAI_ENDPOINT,
+                        api_key=Config.AZURE_OPENAI_API_KEY,
+                        api_version=Config.AZURE_OPENAI_API_VERSION,
+                        max_retries=Config.LLM_MAX_RETRIES,
+                        http_client=http_client
+                    )
+        return self._openai_client
+
+    def chat_model(self):
+        """
+        AzureChatOpenAI model used by the LangChain agents
+        """
+        if self._chat_model is None:
+            self._check_config()
+            http_client = self.http_client()
+            async_http_client = self.async_http_client()
+            with self._lock:
+                if self._chat_model is None:
+                    from langchain_openai import AzureChatOpenAI
+                    self._chat_model = AzureChatOpenAI(
+                        azure_endpoint=Config.AZURE_OPENAI_ENDPOINT,
+                        api_key=Config.AZURE_OPENAI_API_KEY,
+                        api_version=Config.AZURE_OPENAI_API_VERSION,
+                        deployment_name=Config.AZURE_OPENAI_DEPLOYMENT_NAME,
+                        temperature=0.3,
+                        max_retries=Config.LLM_MAX_RETRIES,
+                        http_client=http_client,
+                        http_async_client=async_http_client
+                    )
+        return self._chat_model
+
+
+_clients = LLMClients()
+
+def get_llm_clients():
+    return _clients
+
+def _reset_after_fork():
+    # Sockets inherited from the parent are shared with it and must not be
+    # reused; the parent's lock may also have been held mid-fork
+    global _clients
+    _clients = LLMClients()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,110 @@
+import re
+
+class LocalExtractor:
+    """
+    Deterministic extraction of contact fields (email, phone, name) and
+    years of experience with regexes and simple heuristics. Each field is
+    returned as {"value": ..., "confidence": ...} like the LLM output.
+    """
+
+    EMAIL_PATTERN = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+    PHONE_PATTERN = re.compile(r'(?<![\w+])(\+?\d[\d\s().-]{8,17}\d)(?!\w)')
+    YEARS_PATTERN = re.compile(
+        r'(\d{1,2})(?:\.\d)?\s*\+?\s*(?:years?|yrs?)\b(?:\s+of)?(?:\s+\w+){0,2}\s+experience',
+        re.IGNORECASE
+    )
+    NAME_WORD_PATTERN = re.compile(r"^[A-Za-z][A-Za-z.'-]*$")
+
+    NAME_STOP_WORDS = {
+        'resume', 'curriculum', 'vitae', 'cv', 'profile', 'summary', 'objective',
+        'contact', 'email', 'phone', 'mobile', 'address', 'experience', 'education',
+        'skills', 'engineer', 'developer', 'manager', 'analyst', 'consultant'
+    }
+
+    NAME_SCAN_LINES = 5
+
+    @staticmethod
+    def extract_email(text):
+        matches = []
+        for match in LocalExtractor.EMAIL_PATTERN.findall(text):
+            email = match.strip('.').lower()
+            if email not in matches:
+                matches.append(email)
+
+        if not matches:
+            return {'value': None, 'confidence': 0.0}
+
+        return {'value': matches[0], 'confidence': 0.99 if len(matches) == 1 else 0.9}
+
+    @staticmethod
+    def extract_phone(text):
+        candidates = []
+        for match in LocalExtractor.PHONE_PATTERN.findall(text):
+            digits = re.sub(r'\D', '', match)
+            if 10 <= len(digits) <= 13 and not LocalExtractor._looks_like_date_range(match):
+                candidates.append((match.strip(), digits))
+
+        if not candidates:
+            return {'value': None, 'confidence': 0.0}
+
+        raw, digits = candidates[0]
+        phone = LocalExtractor._format_phone(raw, digits)
+        confidence = 0.95 if len({d for _, d in candidates}) == 1 else 0.85
+        return {'value': phone, 'confidence': confidence}
+
+    @staticmethod
+    def _looks_like_date_range(value):
+        return re.fullmatch(r'\s*(19|20)\d{2}\s*[-–]\s*(19|20)\d{2}\s*', value) is not None
+
+    @staticmethod
+    def _format_phone(raw, digits):
+        if len(digits) == 12 and digits.startswith('91'):
+            return f"+91-{digits[2:]}"
+        if raw.startswith('+'):
+            return f"+{digits}"
+        return digits
+
+    @staticmethod
+    def extract_full_name(text, email=None):
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+
+        for index, line in enumerate(lines[:LocalExtractor.NAME_SCAN_LINES]):
+            line = re.sub(r'^(name\s*[:\-]\s*)', '', line, flags=re.IGNORECASE)
+            words = line.split()
+
+            if not 2 <= len(words) <= 4:
+                continue
+            if not all(LocalExtractor.NAME_WORD_PATTERN.match(word) for word in words):
+                continue
+            if any(word.lower().strip('.') in LocalExtractor.NAME_STOP_WORDS for word in words):
+                continue
+            if not all(word[0].isupper() for word in words):
+                continue
+
+            name = ' '.join(word if not word.isupper() else word.capitalize() for word in words)
+            confidence = 0.85 if index == 0 else 0.7
+
+            if email:
+                local_part = re.sub(r'[^a-z]', '', email.split('@')[0].lower())
+                if any(len(word) > 2 and word.lower().strip('.') in local_part for word in words):
+                    confidence = min(confidence + 0.1, 0.95)
+
+            return {'value': name, 'confidence': confidence}
+
+        return {'value': None, 'confidence': 0.0}
+
+    @staticmethod
+    def extract_years_of_experience(text):
+        years = [int(value) for value in LocalExtractor.YEARS_PATTERN.findall(text)]
+        return max(years) if years else None
+
+    @staticmethod
+    def extract(resume_text):
+        email = LocalExtractor.extract_email(resume_text)
+
+        return {
+            'full_name': LocalExtractor.extract_full_name(resume_text, email['value']),
+            'email': email,
+            'phone': LocalExtractor.extract_phone(resume_text),
+            'years_of_experience': LocalExtractor.extract_years_of_experience(resume_text)
+        }
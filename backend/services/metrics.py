@@ -0,0 +1,441 @@
+import atexit
+import json
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        labels = dict(self.labels)
+        if 'outcome' in labels:
+            labels['outcome'] = 'error' if exc_type is not None else labels['outcome']
+        self.histogram.observe(time.perf_counter() - self.started, **labels)
+        return False
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class _Metric:
+    TYPE = None
+
+    def __init__(self, registry, name, documentation, labelnames=()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def snapshot(self):
+        with self._lock:
+            return {key: self._copy(value) for key, value in self._values.items()}
+
+    def reset(self):
+        self._lock = threading.Lock()
+        self._values = {}
+
+    @staticmethod
+    def _copy(value):
+        return value
+
+    def _format_labels(self, key, extra=None):
+        pairs = list(zip(self.labelnames, key)) + list(extra or [])
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+class Counter(_Metric):
+    TYPE = 'counter'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    @staticmethod
+    def merge(value, other):
+        return value + other
+
+    def samples(self, values=None):
+        values = self.snapshot() if values is None else values
+        return [f"{self.name}{self._format_labels(key)} {value}" for key, value in sorted(values.items())]
+
+
+class Histogram(_Metric):
+    TYPE = 'histogram'
+
+    # Seconds; covers a sub-millisecond commit up to a slow LLM call
+    DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+    def __init__(self, *args, buckets=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(buckets or self.DEFAULT_BUCKETS)
+        self._values = {}
+
+    def observe(self, value, **labels):
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0, 0.0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][index] += 1
+            entry[1] += 1
+            entry[2] += value
+
+    def time(self, **labels):
+        """
+        Context manager observing the elapsed seconds; an 'outcome' label
+        is switched to 'error' when the block raises
+        """
+        if not self.registry.enabled:
+            return _NULL_TIMER
+        return _Timer(self, labels)
+
+    @staticmethod
+    def _copy(entry):
+        return [list(entry[0]), entry[1], entry[2]]
+
+    @staticmethod
+    def merge(entry, other):
+        return [[a + b for a, b in zip(entry[0], other[0])], entry[1] + other[1], entry[2] + other[2]]
+
+    def samples(self, values=None):
+        values = self.snapshot() if values is None else values
+
+        lines = []
+        for key, (bucket_counts, count, total) in sorted(values.items()):
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                lines.append(f"{self.name}_bucket{self._format_labels(key, [('le', repr(float(bound)))])} {bucket_count}")
+            lines.append(f"{self.name}_bucket{self._format_labels(key, [('le', '+Inf')])} {count}")
+            lines.append(f"{self.name}_count{self._format_labels(key)} {count}")
+            lines.append(f"{self.name}_sum{self._format_labels(key)} {total}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Minimal Prometheus text-format registry. Metrics are declared once at
+    import time; while the registry is disabled, inc/observe return at once
+    and time() hands back a shared no-op context manager, so instrumented
+    code costs one attribute check. Collectors are callables evaluated at
+    scrape time that return [(name, type, help, value)] for values that
+    already live elsewhere (cache counters, bytes saved).
+
+    Values are per process. With enable_multiprocess(), every process
+    writes a snapshot to a shared directory every few seconds and render()
+    sums all snapshots, so any one gunicorn worker (or worker.py) can be
+    scraped for the whole host. Collected gauges describe a live process
+    (e.g. entries in its memory cache), so they are summed only over the
+    snapshots of processes that are still running.
+    """
+
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._metrics = []
+        self._collectors = []
+        self.multiprocess_dir = None
+        self.flush_interval = None
+        self._snapshot_path = None
+        self._flusher_pid = None
+
+    def counter(self, name, documentation, labelnames=()):
+        metric = Counter(self, name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name, documentation, labelnames=(), buckets=None):
+        metric = Histogram(self, name, documentation, labelnames, buckets=buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def collector(self, function):
+        self._collectors.append(function)
+        return function
+
+    def _collect(self):
+        samples = []
+        for collect in self._collectors:
+            try:
+                collected = collect()
+            except Exception as e:
+                print(f"[METRICS] Collector {collect.__name__} failed: {str(e)}")
+                continue
+            for name, metric_type, documentation, value in collected:
+                if value is None or (isinstance(value, float) and math.isnan(value)):
+                    continue
+                samples.append((name, metric_type, documentation, value))
+        return samples
+
+    def enable_multiprocess(self, directory, flush_interval=5.0):
+        """
+        Shares this process's values through `directory`. Snapshots of
+        exited processes are kept so counters never go backwards; clear the
+        directory when the whole deployment restarts.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.multiprocess_dir = directory
+        self.flush_interval = flush_interval
+        self._start_flusher()
+        atexit.register(self.flush)
+
+    def _start_flusher(self):
+        # One file per process lifetime; a reused pid must not overwrite the
+        # totals of the process that had it before
+        self._snapshot_path = os.path.join(
+            self.multiprocess_dir, f"{os.getpid()}-{time.time_ns()}.json"
+        )
+        self._flusher_pid = os.getpid()
+        threading.Thread(target=self._flush_periodically, name='metrics-flush', daemon=True).start()
+
+    def _flush_periodically(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def _after_fork(self):
+        # The parent keeps reporting what it recorded before the fork, and
+        # the flusher thread did not survive it
+        if self.multiprocess_dir is None or self._flusher_pid == os.getpid():
+            return
+        for metric in self._metrics:
+            metric.reset()
+        self._start_flusher()
+
+    def flush(self):
+        if self.multiprocess_dir is None or self._flusher_pid != os.getpid():
+            return
+        snapshot = {
+            'metrics': {
+                metric.name: [[list(key), value] for key, value in metric.snapshot().items()]
+                for metric in self._metrics
+            },
+            'collected': self._collect()
+        }
+        temporary = f"{self._snapshot_path}.tmp"
+        try:
+            with open(temporary, 'w') as handle:
+                json.dump(snapshot, handle)
+            os.replace(temporary, self._snapshot_path)
+        except OSError as e:
+            print(f"[METRICS] Could not write {self._snapshot_path}: {str(e)}")
+
+    @staticmethod
+    def _is_running(filename):
+        # Snapshots are named <pid>-<start time>.json
+        try:
+            os.kill(int(filename.split('-', 1)[0]), 0)
+        except (ValueError, ProcessLookupError):
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def _merged(self):
+        """
+        Returns ({metric name: {key: value}}, collected samples) summed over
+        every process snapshot in the multiprocess directory; collected
+        gauges only count processes that are still running
+        """
+        self.flush()
+        values = {metric.name: {} for metric in self._metrics}
+        merge = {metric.name: metric.merge for metric in self._metrics}
+        collected = {}
+
+        for filename in sorted(os.listdir(self.multiprocess_dir)):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.multiprocess_dir, filename)) as handle:
+                    snapshot = json.load(handle)
+            except (OSError, ValueError):
+                continue
+
+            for name, samples in snapshot['metrics'].items():
+                if name not in values:
+                    continue
+                for key, value in samples:
+                    key = tuple(key)
+                    current = values[name].get(key)
+                    values[name][key] = value if current is None else merge[name](current, value)
+
+            running = None
+            for name, metric_type, documentation, value in snapshot['collected']:
+                if metric_type != 'counter':
+                    if running is None:
+                        running = self._is_running(filename)
+                    if not running:
+                        continue
+                if name in collected:
+                    collected[name] = (metric_type, documentation, collected[name][2] + value)
+                else:
+                    collected[name] = (metric_type, documentation, value)
+
+        return values, [(name,) + sample for name, sample in collected.items()]
+
+    def render(self):
+        if self.multiprocess_dir is not None:
+            values, collected = self._merged()
+        else:
+            values, collected = {}, self._collect()
+
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.TYPE}")
+            lines.extend(metric.samples(values.get(metric.name)))
+
+        for name, metric_type, documentation, value in collected:
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"{name} {value}")
+
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port, host='0.0.0.0'):
+        """
+        Serves render() at /metrics from a daemon thread, for processes
+        without the Flask app's endpoint such as worker.py
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', registry.CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True).start()
+        print(f"[METRICS] Serving /metrics on port {server.server_address[1]}")
+        return server
+
+
+REGISTRY = MetricsRegistry()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=REGISTRY._after_fork)
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    'traqcheck_http_request_seconds', 'HTTP request latency by endpoint', ('method', 'endpoint', 'status')
+)
+FILE_SAVE_SECONDS = REGISTRY.histogram(
+    'traqcheck_file_save_seconds', 'Time to validate, hash and store an upload', ('kind', 'outcome')
+)
+FILE_SAVE_BYTES = REGISTRY.counter(
+    'traqcheck_file_save_bytes_total', 'Bytes stored for uploads (after normalization)', ('kind',)
+)
+RESUME_PARSE_SECONDS = REGISTRY.histogram(
+    'traqcheck_resume_parse_seconds', 'Resume text extraction time, including the parser pool wait',
+    ('format', 'outcome')
+)
+PIPELINE_STAGE_SECONDS = REGISTRY.histogram(
+    'traqcheck_pipeline_stage_seconds', 'Resume pipeline stage duration', ('stage', 'status')
+)
+LLM_CALL_SECONDS = REGISTRY.histogram(
+    'traqcheck_llm_call_seconds', 'LangChain agent call latency', ('agent', 'outcome')
+)
+LLM_TOKENS = REGISTRY.counter(
+    'traqcheck_llm_tokens_total', 'Tokens used by LangChain agent calls', ('agent', 'type')
+)
+LLM_RETRIES = REGISTRY.counter(
+    'traqcheck_llm_retries_total', 'Azure OpenAI requests retried after a 429, 5xx or connection error', ()
+)
+DB_COMMIT_SECONDS = REGISTRY.histogram(
+    'traqcheck_db_commit_seconds', 'Session commit time, including the final flush', ()
+)
+NOTIFICATION_DISPATCH_SECONDS = REGISTRY.histogram(
+    'traqcheck_notification_dispatch_seconds', 'Time to deliver one notification', ('channel', 'outcome')
+)
+NOTIFICATIONS = REGISTRY.counter(
+    'traqcheck_notifications_total', 'Notification delivery attempts', ('channel', 'outcome')
+)
+
+
+@REGISTRY.collector
+def _llm_cache_stats():
+    from services.llm_cache import get_llm_cache
+    stats = get_llm_cache().stats()
+    samples = [
+        (f"traqcheck_llm_cache_{name}_total", 'counter', f"LLM cache {name.replace('_', ' ')}", stats[name])
+        for name in ('memory_hits', 'disk_hits', 'misses', 'writes', 'evictions')
+    ]
+    samples.append(('traqcheck_llm_cache_memory_entries', 'gauge', 'LLM cache in-memory entries',
+                    stats['memory_entries']))
+    return samples
+
+
+@REGISTRY.collector
+def _image_normalizer_stats():
+    from services.image_normalizer import ImageNormalizer
+    stats = ImageNormalizer.stats()
+    return [
+        ('traqcheck_images_normalized_total', 'counter', 'Document images normalized', stats['normalized']),
+        ('traqcheck_image_normalization_bytes_saved_total', 'counter',
+         'Bytes saved by document image normalization', stats['bytes_saved'])
+    ]
+
+
+@event.listens_for(Session, 'before_commit')
+def _commit_started(session):
+    if REGISTRY.enabled:
+        session.info['metrics_commit_started'] = time.perf_counter()
+
+@event.listens_for(Session, 'after_commit')
+def _commit_finished(session):
+    started = session.info.pop('metrics_commit_started', None)
+    if started is not None:
+        DB_COMMIT_SECONDS.observe(time.perf_counter() - started)
+
+@event.listens_for(Session, 'after_rollback')
+def _commit_abandoned(session):
+    session.info.pop('metrics_commit_started', None)
@@ -0,0 +1,191 @@
+import os
+import smtplib
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import and_, func, or_, update
+from models import db, DocumentRequest, NotificationOutbox
+from services.metrics import NOTIFICATIONS, NOTIFICATION_DISPATCH_SECONDS
+from services.notification_service import NotificationService, get_smtp_pool
+from config import Config
+
+class NotificationDispatcher:
+    """
+    Background thread that drains the notification outbox: claims a batch
+    of due entries, delivers them over one pooled SMTP connection and
+    records the outcome. Failed deliveries are retried with exponential
+    backoff until max_attempts; entries held by a dead dispatcher are
+    reclaimed when their lease expires, so delivery is at-least-once.
+    """
+
+    def __init__(self, app, batch_size=None, poll_interval=None):
+        self.app = app
+        self.batch_size = Config.NOTIFICATION_BATCH_SIZE if batch_size is None else batch_size
+        self.poll_interval = Config.NOTIFICATION_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:notifications"
+        self._stop = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def _claimable(now):
+        lease_expired = now - timedelta(seconds=Config.NOTIFICATION_LEASE_SECONDS)
+        return or_(
+            and_(NotificationOutbox.status == 'pending', NotificationOutbox.available_at <= now),
+            and_(NotificationOutbox.status == 'sending', NotificationOutbox.locked_at < lease_expired)
+        )
+
+    def claim_batch(self):
+        now = datetime.utcnow()
+        # Unique per claim, so rows are told apart even from another claim
+        # by this dispatcher (or a same-named one) at the same timestamp
+        claim = f"{self.worker_id}:{uuid.uuid4().hex[:12]}"
+
+        entry_ids = [
+            row.id for row in db.session.query(NotificationOutbox.id)
+            .filter(self._claimable(now))
+            .order_by(NotificationOutbox.available_at, NotificationOutbox.created_at)
+            .limit(self.batch_size)
+        ]
+        if not entry_ids:
+            return []
+
+        db.session.execute(
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id.in_(entry_ids), self._claimable(now))
+            .values(
+                status='sending',
+                locked_by=claim,
+                locked_at=now,
+                attempts=NotificationOutbox.attempts + 1,
+                updated_at=now
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+
+        # Entries another dispatcher claimed in the meantime are left out
+        return NotificationOutbox.query.filter(
+            NotificationOutbox.id.in_(entry_ids),
+            NotificationOutbox.locked_by == claim
+        ).all()
+
+    @staticmethod
+    def _deliver(entry, connection):
+        with NOTIFICATION_DISPATCH_SECONDS.time(channel=entry.channel, outcome='sent'):
+            NotificationDispatcher._send(entry, connection)
+
+    @staticmethod
+    def _send(entry, connection):
+        if entry.channel == 'email':
+            NotificationService.send_email(entry.recipient, entry.subject, entry.body, connection=connection)
+        elif entry.channel == 'sms':
+            NotificationService.send_sms(entry.recipient, entry.body)
+        else:
+            raise ValueError(f"Unknown notification channel: {entry.channel}")
+
+    @staticmethod
+    def _mark_failed(entry, error):
+        entry.last_error = str(error)
+        entry.locked_by = None
+        entry.locked_at = None
+
+        if entry.attempts < entry.max_attempts:
+            backoff = min(
+                Config.NOTIFICATION_RETRY_BACKOFF_SECONDS * 2 ** (entry.attempts - 1),
+                Config.NOTIFICATION_MAX_BACKOFF_SECONDS
+            )
+            entry.status = 'pending'
+            entry.available_at = datetime.utcnow() + timedelta(seconds=backoff)
+        else:
+            entry.status = 'failed'
+
+    def deliver_batch(self, entries):
+        pool = get_smtp_pool() if Config.SMTP_HOST else None
+        connection = None
+
+        try:
+            for entry in entries:
+                try:
+                    if pool is not None and entry.channel == 'email' and connection is None:
+                        connection = pool.acquire()
+
+                    self._deliver(entry, connection)
+
+                    NOTIFICATIONS.inc(channel=entry.channel, outcome='sent')
+                    entry.status = 'sent'
+                    entry.sent_at = datetime.utcnow()
+                    entry.last_error = None
+                    entry.locked_by = None
+                    entry.locked_at = None
+                except Exception as e:
+                    if connection is not None and isinstance(e, (smtplib.SMTPServerDisconnected, OSError)):
+                        pool.discard(connection)
+                        connection = None
+                    self._mark_failed(entry, e)
+                    NOTIFICATIONS.inc(channel=entry.channel, outcome='retry' if entry.status == 'pending' else 'failed')
+                    print(f"[NOTIFY] {entry.channel} to {entry.recipient} failed "
+                          f"(attempt {entry.attempts}/{entry.max_attempts}): {str(e)}")
+        finally:
+            if connection is not None:
+                pool.release(connection)
+
+        self._update_requests({entry.document_request_id for entry in entries})
+        db.session.commit()
+
+    @staticmethod
+    def _update_requests(document_request_ids):
+        """
+        A request is sent once all its notifications are, failed as soon as
+        one has run out of attempts, and queued otherwise
+        """
+        if not document_request_ids:
+            return
+
+        counts = {}
+        for document_request_id, status, count in db.session.query(
+            NotificationOutbox.document_request_id, NotificationOutbox.status, func.count()
+        ).filter(
+            NotificationOutbox.document_request_id.in_(document_request_ids)
+        ).group_by(NotificationOutbox.document_request_id, NotificationOutbox.status):
+            counts.setdefault(document_request_id, {})[status] = count
+
+        for document_request in DocumentRequest.query.filter(DocumentRequest.id.in_(document_request_ids)):
+            statuses = counts.get(document_request.id, {})
+            if statuses.get('failed'):
+                document_request.request_status = 'failed'
+            elif statuses and set(statuses) == {'sent'}:
+                document_request.request_status = 'sent'
+            else:
+                document_request.request_status = 'queued'
+
+    def run_once(self):
+        """
+        Delivers one batch; returns the number of entries attempted
+        """
+        entries = self.claim_batch()
+        if entries:
+            self.deliver_batch(entries)
+        return len(entries)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='notification-dispatcher', daemon=True)
+        self._thread.start()
+        print("[NOTIFY] Started notification dispatcher")
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                with self.app.app_context():
+                    if self.run_once() >= self.batch_size:
+                        continue
+            except Exception as e:
+                print(f"[NOTIFY] Dispatcher error: {str(e)}")
+
+            self._stop.wait(self.poll_interval)
@@ -1,22 +1,145 @@
+import queue
+import smtplib
+import threading
+from contextlib import contextmanager
+from email.message import EmailMessage
+from models import db, NotificationOutbox
+from config import Config
+
+class SMTPConnectionPool:
+    """
+    Keeps up to `size` authenticated SMTP connections open between
+    deliveries so each batch skips the connect/STARTTLS/login round trips.
+    Idle connections are checked with NOOP before reuse.
+    """
+
+    def __init__(self, host, port, username=None, password=None, use_tls=True, timeout=10, size=2):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    @classmethod
+    def from_config(cls):
+        return cls(
+            host=Config.SMTP_HOST,
+            port=Config.SMTP_PORT,
+            username=Config.SMTP_USERNAME,
+            password=Config.SMTP_PASSWORD,
+            use_tls=Config.SMTP_USE_TLS,
+            timeout=Config.SMTP_TIMEOUT_SECONDS,
+            size=Config.SMTP_POOL_SIZE
+        )
+
+    def _connect(self):
+        connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            connection.starttls()
+        if self.username:
+            connection.login(self.username, self.password)
+        return connection
+
+    @staticmethod
+    def _close(connection):
+        try:
+            connection.quit()
+        except Exception:
+            connection.close()
+
+    def acquire(self):
+        self._slots.acquire()
+        try:
+            while True:
+                try:
+                    connection = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._connect()
+
+                try:
+                    if connection.noop()[0] == 250:
+                        return connection
+                except smtplib.SMTPException:
+                    pass
+                except OSError:
+                    pass
+                self._close(connection)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection):
+        self._idle.put(connection)
+        self._slots.release()
+
+    def discard(self, connection):
+        self._close(connection)
+        self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        connection = self.acquire()
+        try:
+            yield connection
+        except (smtplib.SMTPServerDisconnected, OSError):
+            self.discard(connection)
+            raise
+        except BaseException:
+            self.release(connection)
+            raise
+        self.release(connection)
+
+    def close(self):
+        while True:
+            try:
+                self._close(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
 class NotificationService:
 
     @staticmethod
-    def send_email(to_email, subject, body):
+    def send_email(to_email, subject, body, connection=None):
         """
-        Send email notification to candidate
-        Future implementation: Integrate with SendGrid, AWS SES, or SMTP
+        Send email notification to candidate over SMTP, or print it when
+        SMTP_HOST is not configured. Pass a pooled connection to reuse it;
+        otherwise one is checked out of the shared pool.
         """
-        print(f"[EMAIL NOTIFICATION]")
-        print(f"To: {to_email}")
-        print(f"Subject: {subject}")
-        print(f"Body: {body[:100]}...")
-        print("-" * 50)
+        if not Config.SMTP_HOST:
+            print(f"[EMAIL NOTIFICATION]")
+            print(f"To: {to_email}")
+            print(f"Subject: {subject}")
+            print(f"Body: {body[:100]}...")
+            print("-" * 50)
+
+            return {
+                'sent': True,
+                'method': 'email',
+                'recipient': to_email,
+                'status': 'simulated'
+            }
+
+        message = EmailMessage()
+        message['From'] = Config.SMTP_FROM
+        message['To'] = to_email
+        message['Subject'] = subject
+        message.set_content(body)
+
+        if connection is not None:
+            connection.send_message(message)
+        else:
+            with get_smtp_pool().connection() as pooled:
+                pooled.send_message(message)
 
         return {
             'sent': True,
             'method': 'email',
             'recipient': to_email,
-            'status': 'simulated'
+            'status': 'sent'
         }
 
     @staticmethod
@@ -38,26 +161,46 @@ class NotificationService:
         }
 
     @staticmethod
-    def send_document_request(candidate_email, candidate_phone, message):
+    def enqueue_document_request(document_request, candidate_email, candidate_phone):
         """
-        Send document request via email and/or SMS
+        Adds the email and/or SMS for a document request to the outbox in
+        the caller's transaction; NotificationDispatcher delivers them after
+        the commit. Returns the outbox entries.
         """
-        results = []
+        entries = []
 
         if candidate_email:
-            email_result = NotificationService.send_email(
-                to_email=candidate_email,
+            entries.append(NotificationOutbox(
+                channel='email',
+                recipient=candidate_email,
                 subject="Document Submission Required",
-                body=message
-            )
-            results.append(email_result)
+                body=document_request.request_message,
+                max_attempts=Config.NOTIFICATION_MAX_ATTEMPTS
+            ))
 
         if candidate_phone:
-            sms_message = f"Document required. Please check your email for details."
-            sms_result = NotificationService.send_sms(
-                to_phone=candidate_phone,
-                message=sms_message
-            )
-            results.append(sms_result)
-
-        return results
+            entries.append(NotificationOutbox(
+                channel='sms',
+                recipient=candidate_phone,
+                body="Document required. Please check your email for details.",
+                max_attempts=Config.NOTIFICATION_MAX_ATTEMPTS
+            ))
+
+        for entry in entries:
+            document_request.notifications.append(entry)
+            db.session.add(entry)
+
+        document_request.request_status = 'queued' if entries else 'no_recipient'
+        return entries
+
+
+_smtp_pool = None
+_smtp_pool_lock = threading.Lock()
+
+def get_smtp_pool():
+    global _smtp_pool
+    if _smtp_pool is None:
+        with _smtp_pool_lock:
+            if _smtp_pool is None:
+                _smtp_pool = SMTPConnectionPool.from_config()
+    return _smtp_pool
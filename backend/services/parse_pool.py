@@ -0,0 +1,156 @@
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from config import Config
+from services.metrics import RESUME_PARSE_SECONDS
+from services.resume_parser import ResumeParser
+
+
+class ParseTimeout(Exception):
+    pass
+
+
+def _worker_main(connection):
+    while True:
+        try:
+            request = connection.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+
+        if request is None:
+            break
+
+        file_path, time_budget = request
+        try:
+            deadline = time.monotonic() + time_budget if time_budget else None
+            connection.send(('ok', ResumeParser.parse_resume(file_path, deadline=deadline)))
+        except Exception as e:
+            connection.send(('error', str(e)))
+
+
+class _ParseWorker:
+    """
+    A long-lived parser subprocess that can be killed if a parse hangs
+    """
+
+    def __init__(self, context):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.tasks = 0
+
+    def parse(self, file_path, timeout):
+        self.tasks += 1
+        self.connection.send((file_path, timeout))
+
+        if not self.connection.poll(timeout + Config.PARSE_KILL_GRACE_SECONDS if timeout else None):
+            self.kill()
+            raise ParseTimeout(f"Parsing exceeded {timeout}s and was aborted: {file_path}")
+
+        try:
+            status, payload = self.connection.recv()
+        except EOFError:
+            self.kill()
+            raise Exception(f"Parser process died while parsing: {file_path}")
+
+        if status == 'error':
+            raise Exception(payload)
+        return payload
+
+    def is_alive(self):
+        return self.process.is_alive()
+
+    def close(self):
+        try:
+            self.connection.send(None)
+        except Exception:
+            pass
+        self.process.join(1)
+        if self.process.is_alive():
+            self.kill()
+        self.connection.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+class ParsePool:
+    """
+    Pool of isolated parser subprocesses. pdfplumber is CPU-bound and holds
+    the GIL, so parsing in worker threads would serialize; separate
+    processes let concurrent jobs (e.g. from a bulk upload) parse in
+    parallel. Each parse gets a time budget and the subprocess is killed if
+    it overruns, so a pathological PDF cannot pin a worker.
+    """
+
+    _idle = queue.LifoQueue()
+    _slots = None
+    _lock = threading.Lock()
+    _context = multiprocessing.get_context('spawn')
+
+    @classmethod
+    def _get_slots(cls):
+        if cls._slots is None:
+            with cls._lock:
+                if cls._slots is None:
+                    cls._slots = threading.BoundedSemaphore(Config.PARSE_POOL_PROCESSES)
+        return cls._slots
+
+    @classmethod
+    def _checkout(cls):
+        while True:
+            try:
+                worker = cls._idle.get_nowait()
+            except queue.Empty:
+                return _ParseWorker(cls._context)
+
+            if worker.is_alive():
+                return worker
+            worker.close()
+
+    @classmethod
+    def parse(cls, file_path, timeout=None):
+        with RESUME_PARSE_SECONDS.time(format=os.path.splitext(file_path)[1].lstrip('.').lower(), outcome='ok'):
+            return cls._parse(file_path, timeout)
+
+    @classmethod
+    def _parse(cls, file_path, timeout):
+        timeout = Config.PARSE_TIMEOUT_SECONDS if timeout is None else timeout
+
+        if Config.PARSE_POOL_PROCESSES <= 0:
+            deadline = time.monotonic() + timeout if timeout else None
+            return ResumeParser.parse_resume(file_path, deadline=deadline)
+
+        with cls._get_slots():
+            worker = cls._checkout()
+            try:
+                result = worker.parse(file_path, timeout)
+            except ParseTimeout:
+                raise
+            except Exception:
+                if worker.is_alive():
+                    cls._recycle(worker)
+                raise
+
+            cls._recycle(worker)
+            return result
+
+    @classmethod
+    def _recycle(cls, worker):
+        if worker.tasks >= Config.PARSE_POOL_MAX_TASKS_PER_CHILD:
+            worker.close()
+        else:
+            cls._idle.put(worker)
+
+    @classmethod
+    def shutdown(cls):
+        while True:
+            try:
+                cls._idle.get_nowait().close()
+            except queue.Empty:
+                break
@@ -0,0 +1,203 @@
+import json
+import os
+import re
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+from werkzeug.datastructures import FileStorage as UploadedFile
+from models import db
+from services.file_storage import FileStorage
+from config import Config
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class UploadOffsetMismatch(Exception):
+    def __init__(self, received):
+        super().__init__(f"Chunk does not start at the next expected offset ({received})")
+        self.received = received
+
+
+class ResumableUploadService:
+    """
+    Chunked, resumable document uploads. Each upload lives in
+    UPLOAD_FOLDER/partial/<upload_id>/ as a metadata file and a data file
+    that chunks are appended to. The data file's size is the acknowledged
+    offset, so after a dropped connection the client asks for the status
+    and continues from there; bytes written before the drop are kept.
+    """
+
+    UPLOAD_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+    COPY_CHUNK_SIZE = 64 * 1024
+
+    @staticmethod
+    def _root():
+        return os.path.join(Config.UPLOAD_FOLDER, 'partial')
+
+    @staticmethod
+    def _directory(upload_id):
+        if not ResumableUploadService.UPLOAD_ID_PATTERN.match(upload_id or ''):
+            raise FileNotFoundError("Upload not found")
+        return os.path.join(ResumableUploadService._root(), upload_id)
+
+    @staticmethod
+    def _load(upload_id, candidate_id=None):
+        directory = ResumableUploadService._directory(upload_id)
+        try:
+            with open(os.path.join(directory, 'state.json')) as state_file:
+                state = json.load(state_file)
+        except (OSError, ValueError):
+            raise FileNotFoundError("Upload not found")
+
+        if candidate_id is not None and state['candidate_id'] != candidate_id:
+            raise FileNotFoundError("Upload not found")
+
+        state['received'] = os.path.getsize(os.path.join(directory, 'data.part'))
+        return state
+
+    @staticmethod
+    @contextmanager
+    def _locked(upload_id):
+        """
+        Serializes writers of one upload across threads and processes where
+        flock is available
+        """
+        lock_path = os.path.join(ResumableUploadService._directory(upload_id), 'lock')
+        with open(lock_path, 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def status(upload_id, candidate_id=None):
+        state = ResumableUploadService._load(upload_id, candidate_id)
+        state['complete'] = state['received'] == state['total_size']
+        return state
+
+    @staticmethod
+    def initiate(candidate_id, document_type, filename, total_size):
+        if not filename or not FileStorage.allowed_file(filename, Config.ALLOWED_DOCUMENT_EXTENSIONS):
+            raise ValueError("Invalid file type. Only PDF and image files are allowed.")
+        if not isinstance(total_size, int) or total_size <= 0:
+            raise ValueError("total_size must be a positive integer")
+        if total_size > Config.MAX_CONTENT_LENGTH:
+            raise ValueError(f"File exceeds the maximum size of {Config.MAX_CONTENT_LENGTH} bytes")
+
+        ResumableUploadService.cleanup_expired()
+
+        upload_id = uuid.uuid4().hex
+        directory = os.path.join(ResumableUploadService._root(), upload_id)
+        os.makedirs(directory)
+
+        state = {
+            'upload_id': upload_id,
+            'candidate_id': candidate_id,
+            'document_type': document_type,
+            'filename': filename,
+            'total_size': total_size,
+            'created_at': time.time()
+        }
+
+        open(os.path.join(directory, 'data.part'), 'wb').close()
+        temp_path = os.path.join(directory, 'state.json.tmp')
+        with open(temp_path, 'w') as state_file:
+            json.dump(state, state_file)
+        os.replace(temp_path, os.path.join(directory, 'state.json'))
+
+        state['received'] = 0
+        return state
+
+    @staticmethod
+    def append_chunk(upload_id, candidate_id, offset, stream):
+        """
+        Appends the request body at offset, which must equal the bytes
+        received so far. Returns the new received offset.
+        """
+        with ResumableUploadService._locked(upload_id):
+            state = ResumableUploadService._load(upload_id, candidate_id)
+            if offset != state['received']:
+                raise UploadOffsetMismatch(state['received'])
+
+            data_path = os.path.join(ResumableUploadService._directory(upload_id), 'data.part')
+            received = state['received']
+
+            with open(data_path, 'ab') as data_file:
+                try:
+                    while True:
+                        chunk = stream.read(ResumableUploadService.COPY_CHUNK_SIZE)
+                        if not chunk:
+                            break
+
+                        if received + len(chunk) > state['total_size']:
+                            data_file.truncate(offset)
+                            raise ValueError("Chunk extends past the declared total_size")
+
+                        data_file.write(chunk)
+                        received += len(chunk)
+                finally:
+                    # Whatever arrived before a disconnect stays acknowledged
+                    data_file.flush()
+                    os.fsync(data_file.fileno())
+
+            return received
+
+    @staticmethod
+    def finalize(upload_id, candidate_id, expected_sha256=None):
+        """
+        Validates and stores the assembled file through FileStorage and
+        returns (state, file_info). The caller discards the partial upload
+        once the document row is committed.
+        """
+        with ResumableUploadService._locked(upload_id):
+            state = ResumableUploadService._load(upload_id, candidate_id)
+            if state['received'] != state['total_size']:
+                raise UploadOffsetMismatch(state['received'])
+
+            directory = ResumableUploadService._directory(upload_id)
+            with open(os.path.join(directory, 'data.part'), 'rb') as data_file:
+                file_info = FileStorage.save_document(
+                    UploadedFile(stream=data_file, filename=state['filename']),
+                    state['document_type']
+                )
+
+        # Checked against the bytes as uploaded, before any image normalization
+        if expected_sha256 and expected_sha256.lower() != file_info['original_hash']:
+            FileStorage.delete_file(file_info['path'])
+            if file_info['original_path']:
+                FileStorage.delete_file(file_info['original_path'])
+            # Makes the release stick; with content-addressed storage this also removes the blob
+            db.session.commit()
+            ResumableUploadService.discard(upload_id)
+            raise ValueError("Checksum mismatch; the upload was corrupted")
+
+        return state, file_info
+
+    @staticmethod
+    def discard(upload_id):
+        shutil.rmtree(ResumableUploadService._directory(upload_id), ignore_errors=True)
+
+    @staticmethod
+    def cleanup_expired():
+        root = ResumableUploadService._root()
+        if not os.path.isdir(root):
+            return 0
+
+        cutoff = time.time() - Config.RESUMABLE_UPLOAD_TTL_SECONDS
+        removed = 0
+        for upload_id in os.listdir(root):
+            data_path = os.path.join(root, upload_id, 'data.part')
+            try:
+                if os.path.getmtime(data_path) < cutoff:
+                    shutil.rmtree(os.path.join(root, upload_id), ignore_errors=True)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
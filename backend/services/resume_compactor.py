@@ -0,0 +1,216 @@
+import math
+import re
+import threading
+import unicodedata
+from config import Config
+
+class ResumeCompactor:
+    """
+    Shrinks resume text before it is pasted into a prompt: normalizes
+    whitespace, splits the text into sections, drops boilerplate and trims
+    low-priority sections until the text fits a token budget
+    """
+
+    SECTION_HEADINGS = {
+        'summary': ['summary', 'profile', 'professional summary', 'career summary', 'objective',
+                    'career objective', 'about me'],
+        'experience': ['experience', 'work experience', 'professional experience', 'employment',
+                       'employment history', 'work history', 'career history', 'internships'],
+        'skills': ['skills', 'technical skills', 'key skills', 'core competencies', 'competencies',
+                   'technologies', 'tools', 'tech stack'],
+        'education': ['education', 'academic background', 'academics', 'qualifications',
+                      'educational qualifications'],
+        'projects': ['projects', 'key projects', 'personal projects', 'academic projects'],
+        'certifications': ['certifications', 'certificates', 'courses', 'training', 'licenses'],
+        'awards': ['awards', 'achievements', 'honors', 'honours', 'accomplishments'],
+        'publications': ['publications', 'papers', 'research', 'presentations', 'patents',
+                         'conference papers', 'journal articles'],
+        'interests': ['interests', 'hobbies', 'extracurricular activities', 'activities'],
+        'languages': ['languages'],
+        'personal': ['personal details', 'personal information', 'personal profile'],
+        'references': ['references', 'referees'],
+        'declaration': ['declaration']
+    }
+
+    # Sections kept first (and truncated rather than dropped) when over budget
+    CORE_SECTIONS = ['contact', 'experience', 'skills', 'education']
+    OPTIONAL_SECTIONS = ['summary', 'projects', 'certifications', 'awards', 'languages',
+                         'personal', 'interests', 'publications']
+    DROPPED_SECTIONS = {'references', 'declaration'}
+
+    BOILERPLATE_PATTERNS = [
+        re.compile(r'^page\s+\d+(\s+of\s+\d+)?$', re.IGNORECASE),
+        re.compile(r'^-?\s*\d{1,3}\s*-?$'),
+        re.compile(r'^(curriculum\s+vitae|resume|r[ée]sum[ée]|cv)$', re.IGNORECASE),
+        re.compile(r'^references\s+(are\s+)?available\s+(up)?on\s+request\.?$', re.IGNORECASE),
+        re.compile(r'^i\s+hereby\s+declare\b.*$', re.IGNORECASE),
+        re.compile(r'^(date|place)\s*:.*$', re.IGNORECASE)
+    ]
+
+    BULLET_PATTERN = re.compile(r'^[•●▪■‣⁃∙·*\-–—>]+\s*')
+    SPACE_PATTERN = re.compile(r'[ \t\u00a0\u2000-\u200b]+')
+
+    _encoder = None
+    _encoder_loaded = False
+    _encoder_lock = threading.Lock()
+
+    @classmethod
+    def _get_encoder(cls):
+        if not cls._encoder_loaded:
+            with cls._encoder_lock:
+                if not cls._encoder_loaded:
+                    try:
+                        import tiktoken
+                        cls._encoder = tiktoken.get_encoding('cl100k_base')
+                    except Exception as e:
+                        # e.g. no network to fetch the encoding and no TIKTOKEN_CACHE_DIR copy
+                        print(f"[RESUME COMPACTOR] tiktoken unavailable, estimating tokens from length: {str(e)}")
+                        cls._encoder = None
+                    cls._encoder_loaded = True
+        return cls._encoder
+
+    @classmethod
+    def count_tokens(cls, text):
+        """
+        Token count with tiktoken when its encoding is available, otherwise
+        an estimate of one token per four characters
+        """
+        if not text:
+            return 0
+
+        encoder = cls._get_encoder()
+        if encoder is not None:
+            return len(encoder.encode(text, disallowed_special=()))
+        return math.ceil(len(text) / 4)
+
+    @classmethod
+    def normalize(cls, text):
+        text = unicodedata.normalize('NFKC', text or '')
+
+        lines = []
+        previous = None
+        for raw_line in text.splitlines():
+            line = cls.SPACE_PATTERN.sub(' ', raw_line).strip()
+            line = cls.BULLET_PATTERN.sub('- ', line) if cls.BULLET_PATTERN.match(line) else line
+
+            if not line:
+                if lines and lines[-1] != '':
+                    lines.append('')
+                continue
+            if line == previous:
+                continue
+            if any(pattern.match(line) for pattern in cls.BOILERPLATE_PATTERNS):
+                continue
+
+            lines.append(line)
+            previous = line
+
+        return '\n'.join(lines).strip()
+
+    @classmethod
+    def _heading_for(cls, line):
+        if len(line) > 40:
+            return None
+
+        key = re.sub(r'[^a-z& ]', '', line.lower()).replace('&', 'and').strip()
+        key = re.sub(r'\s+', ' ', key)
+        if not key:
+            return None
+
+        for section, headings in cls.SECTION_HEADINGS.items():
+            if key in headings:
+                return section
+        return None
+
+    @classmethod
+    def split_sections(cls, text):
+        """
+        Returns an ordered list of (section, lines). Text before the first
+        recognised heading is treated as the contact block.
+        """
+        sections = [['contact', []]]
+
+        for line in text.splitlines():
+            section = cls._heading_for(line)
+            if section is not None:
+                sections.append([section, [line]])
+            else:
+                sections[-1][1].append(line)
+
+        return [(name, lines) for name, lines in sections if any(lines)]
+
+    @classmethod
+    def _truncate(cls, lines, budget):
+        kept = []
+        used = 0
+        for line in lines:
+            tokens = cls.count_tokens(line) + 1
+            if used + tokens > budget:
+                break
+            kept.append(line)
+            used += tokens
+        return kept
+
+    @classmethod
+    def compact(cls, text, token_budget=None):
+        """
+        Returns {'text', 'tokens_before', 'tokens_after', 'sections_kept',
+        'sections_dropped', 'truncated'}
+        """
+        token_budget = Config.RESUME_TOKEN_BUDGET if token_budget is None else token_budget
+        tokens_before = cls.count_tokens(text)
+
+        normalized = cls.normalize(text)
+        all_sections = cls.split_sections(normalized)
+        sections = [
+            (index, name, lines) for index, (name, lines) in enumerate(all_sections)
+            if name not in cls.DROPPED_SECTIONS
+        ]
+        dropped = [name for name, _ in all_sections if name in cls.DROPPED_SECTIONS]
+
+        if token_budget <= 0 or cls.count_tokens(normalized) <= token_budget:
+            kept_text = '\n'.join('\n'.join(lines) for _, _, lines in sections).strip()
+            return {
+                'text': kept_text,
+                'tokens_before': tokens_before,
+                'tokens_after': cls.count_tokens(kept_text),
+                'sections_kept': [name for _, name, _ in sections],
+                'sections_dropped': dropped,
+                'truncated': False
+            }
+
+        priority = cls.CORE_SECTIONS + cls.OPTIONAL_SECTIONS
+        ordered = sorted(
+            sections,
+            key=lambda section: (priority.index(section[1]) if section[1] in priority else len(priority), section[0])
+        )
+
+        remaining = token_budget
+        kept = {}
+        truncated = False
+
+        for index, name, lines in ordered:
+            cost = cls.count_tokens('\n'.join(lines)) + 1
+            if cost <= remaining:
+                kept[index] = lines
+                remaining -= cost
+            elif name in cls.CORE_SECTIONS and remaining > 0:
+                partial = cls._truncate(lines, remaining)
+                if partial:
+                    kept[index] = partial
+                    remaining -= cls.count_tokens('\n'.join(partial)) + 1
+                truncated = True
+            else:
+                dropped.append(name)
+
+        kept_sections = [(index, name, kept[index]) for index, name, _ in sections if index in kept]
+        kept_text = '\n'.join('\n'.join(lines) for _, _, lines in kept_sections).strip()
+
+        return {
+            'text': kept_text,
+            'tokens_before': tokens_before,
+            'tokens_after': cls.count_tokens(kept_text),
+            'sections_kept': [name for _, name, _ in kept_sections],
+            'sections_dropped': dropped,
+            'truncated': truncated
+        }
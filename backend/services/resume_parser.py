@@ -1,48 +1,105 @@
 import os
-import PyPDF2
-import pdfplumber
-from docx import Document
+import time
+from config import Config
 
 class ResumeParser:
+    # Bump whenever extraction or normalization changes so stored text is re-parsed
+    PARSER_VERSION = '2'
+
+    @staticmethod
+    def _deadline_passed(deadline):
+        return deadline is not None and time.monotonic() >= deadline
+
     @staticmethod
-    def extract_text_from_pdf(file_path):
-        text = ""
+    def extract_text_from_pdf(file_path, max_pages=None, max_chars=None, deadline=None):
+        """
+        Extracts text page by page with PyPDF2 (the faster backend), falling
+        back to pdfplumber only for pages PyPDF2 cannot read. Stops after
+        max_pages, once max_chars of text are collected, or when the
+        deadline passes, returning the text gathered so far.
+        """
+        import PyPDF2
+        import pdfplumber
+
+        max_pages = Config.PDF_MAX_PAGES if max_pages is None else max_pages
+        max_chars = Config.RESUME_MAX_TEXT_CHARS if max_chars is None else max_chars
+
+        parts = []
+        collected = 0
+        plumber_pdf = None
+        last_error = None
+
         try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        except Exception as e:
             try:
-                with open(file_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-            except Exception as fallback_error:
-                raise Exception(f"Failed to parse PDF: {str(fallback_error)}")
+                reader = PyPDF2.PdfReader(file_path)
+                page_count = len(reader.pages)
+            except Exception as e:
+                reader = None
+                last_error = e
+                plumber_pdf = pdfplumber.open(file_path)
+                page_count = len(plumber_pdf.pages)
+
+            for page_number in range(min(page_count, max_pages)):
+                if ResumeParser._deadline_passed(deadline):
+                    print(f"[PARSER] Time budget exhausted after {page_number} page(s): {file_path}")
+                    break
 
-        return text.strip()
+                page_text = None
+                if reader is not None:
+                    try:
+                        page_text = reader.pages[page_number].extract_text()
+                    except Exception as e:
+                        last_error = e
+
+                if not page_text or not page_text.strip():
+                    try:
+                        if plumber_pdf is None:
+                            plumber_pdf = pdfplumber.open(file_path)
+                        page_text = plumber_pdf.pages[page_number].extract_text()
+                    except Exception as e:
+                        last_error = e
+
+                if page_text:
+                    parts.append(page_text)
+                    collected += len(page_text)
+                    if max_chars and collected >= max_chars:
+                        break
+        except Exception as e:
+            raise Exception(f"Failed to parse PDF: {str(e)}")
+        finally:
+            if plumber_pdf is not None:
+                plumber_pdf.close()
+
+        if not parts and last_error is not None:
+            raise Exception(f"Failed to parse PDF: {str(last_error)}")
+
+        return "\n".join(parts).strip()
 
     @staticmethod
-    def extract_text_from_docx(file_path):
+    def extract_text_from_docx(file_path, max_chars=None):
+        from docx import Document
+
+        max_chars = Config.RESUME_MAX_TEXT_CHARS if max_chars is None else max_chars
+
         try:
             doc = Document(file_path)
-            text = ""
+            parts = []
+            collected = 0
             for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+                parts.append(paragraph.text)
+                collected += len(paragraph.text) + 1
+                if max_chars and collected >= max_chars:
+                    break
+            return "\n".join(parts).strip()
         except Exception as e:
             raise Exception(f"Failed to parse DOCX: {str(e)}")
 
     @staticmethod
-    def parse_resume(file_path):
+    def parse_resume(file_path, deadline=None):
         file_extension = os.path.splitext(file_path)[1].lower()
 
         if file_extension == '.pdf':
-            return ResumeParser.extract_text_from_pdf(file_path)
+            return ResumeParser.extract_text_from_pdf(file_path, deadline=deadline)
         elif file_extension in ['.docx', '.doc']:
             return ResumeParser.extract_text_from_docx(file_path)
         else:
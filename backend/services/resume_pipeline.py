@@ -0,0 +1,227 @@
+import asyncio
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from models import db, Candidate, ExtractedData, DocumentRequest
+from services.job_queue import JobQueue
+from services.metrics import PIPELINE_STAGE_SECONDS
+from services.resume_text_store import ResumeTextStore
+from services.skill_service import SkillService
+from services.langchain_agents import AsyncAgentOrchestrator
+from services.llm_clients import get_llm_clients
+from services.notification_service import NotificationService
+
+class ResumePipeline:
+    """
+    Runs a queued resume through parse → extract → generate_email → notify,
+    recording stage-by-stage progress on the ProcessingJob. Each worker
+    thread owns one pipeline and runs its jobs on the pipeline's event loop,
+    several at a time, so their LLM calls and parses overlap and async
+    connections are reused from job to job. Database work happens between
+    awaits, in the app context of the job's own task.
+    """
+
+    def __init__(self):
+        self.agents = AsyncAgentOrchestrator()
+        self._loop = None
+
+    def execute(self, coroutine):
+        """
+        Runs coroutine to completion on the pipeline's event loop
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coroutine)
+
+    def close(self):
+        if self._loop is not None:
+            self._loop.run_until_complete(get_llm_clients().aclose_current_loop())
+            self._loop.close()
+            self._loop = None
+
+    @contextmanager
+    def _stage(self, job, stage):
+        started = time.perf_counter()
+        job.update_stage(stage, 'running', started_at=datetime.utcnow().isoformat())
+        db.session.commit()
+
+        try:
+            yield
+        except Exception as e:
+            db.session.rollback()
+            PIPELINE_STAGE_SECONDS.observe(time.perf_counter() - started, stage=stage, status='failed')
+            job.update_stage(
+                stage, 'failed',
+                error=str(e),
+                duration_ms=round((time.perf_counter() - started) * 1000, 1)
+            )
+            db.session.commit()
+            raise
+
+        elapsed = time.perf_counter() - started
+        PIPELINE_STAGE_SECONDS.observe(elapsed, stage=stage, status='completed')
+        job.update_stage(
+            stage, 'completed',
+            completed_at=datetime.utcnow().isoformat(),
+            duration_ms=round(elapsed * 1000, 1)
+        )
+        db.session.commit()
+
+    async def run(self, job):
+        candidate = db.session.get(Candidate, job.candidate_id)
+        if candidate is None:
+            JobQueue.fail(job, 'Candidate no longer exists')
+            return
+
+        print(f"\n[PIPELINE] Processing candidate {candidate.id} (job {job.id}, attempt {job.attempts})")
+
+        candidate.extraction_status = 'processing'
+        db.session.commit()
+
+        try:
+            source = None
+            if candidate.extracted_data is None and not job.force_extraction:
+                source = self.find_reusable_candidate(candidate)
+
+            if candidate.extracted_data is not None and not job.force_extraction:
+                job.update_stage('parse', 'skipped')
+                job.update_stage('extract', 'skipped')
+                candidate.extraction_status = 'completed'
+                db.session.commit()
+            elif source is not None:
+                print(f"[PIPELINE] Resume content matches candidate {source.id}, reusing extracted data")
+                self._copy_extracted_data(source.extracted_data, candidate)
+                ResumeTextStore.copy(source, candidate)
+                candidate.extraction_status = 'completed'
+                job.update_stage('parse', 'skipped')
+                job.update_stage('extract', 'reused', source_candidate_id=source.id)
+                db.session.commit()
+            else:
+                with self._stage(job, 'parse'):
+                    resume_text = await ResumeTextStore.aget_text(candidate)
+
+                with self._stage(job, 'extract'):
+                    extracted_info, compaction = await self.agents.extract(resume_text)
+                    if compaction:
+                        job.update_stage('extract', 'running', **compaction)
+
+                    if candidate.extracted_data is not None:
+                        db.session.delete(candidate.extracted_data)
+                        db.session.flush()
+
+                    self._save_extracted_data(candidate, extracted_info)
+                    candidate.extraction_status = 'completed'
+        except Exception as e:
+            print(f"[PIPELINE] Extraction failed for candidate {candidate.id}: {str(e)}")
+            if not JobQueue.fail(job, e):
+                candidate.extraction_status = 'failed'
+                db.session.commit()
+            return
+
+        try:
+            await self._request_documents(job, candidate)
+        except Exception as e:
+            job.last_error = str(e)
+            print(f"Auto-request generation failed: {str(e)}")
+
+        JobQueue.complete(job)
+        print(f"[PIPELINE] Candidate {candidate.id} processed successfully")
+
+    async def _request_documents(self, job, candidate):
+        existing_request = DocumentRequest.query.filter_by(
+            candidate_id=candidate.id,
+            auto_generated=True
+        ).first()
+
+        if existing_request is not None:
+            job.update_stage('generate_email', 'skipped')
+            job.update_stage('notify', 'skipped')
+            db.session.commit()
+            return
+
+        extracted_data = candidate.extracted_data
+        candidate_info = {
+            'full_name': extracted_data.full_name or 'Candidate',
+            'email': extracted_data.email or '',
+            'phone': extracted_data.phone or '',
+            'current_company': extracted_data.current_company or 'our organization',
+            'designation': extracted_data.designation or 'the position'
+        }
+
+        with self._stage(job, 'generate_email'):
+            request_message = await self.agents.write_email(candidate_info)
+
+        # The request and its outbox entries commit together; delivery happens in NotificationDispatcher
+        with self._stage(job, 'notify'):
+            document_request = DocumentRequest(
+                candidate_id=candidate.id,
+                request_type='email',
+                request_message=request_message,
+                auto_generated=True
+            )
+            db.session.add(document_request)
+            NotificationService.enqueue_document_request(
+                document_request,
+                candidate_email=candidate_info['email'],
+                candidate_phone=candidate_info['phone']
+            )
+
+    @staticmethod
+    def find_reusable_candidate(candidate):
+        """
+        Returns the earliest other candidate uploaded with identical resume
+        content whose extraction has already completed
+        """
+        if not candidate.content_hash:
+            return None
+
+        return Candidate.query.join(ExtractedData).filter(
+            Candidate.content_hash == candidate.content_hash,
+            Candidate.id != candidate.id
+        ).order_by(Candidate.upload_date).first()
+
+    @staticmethod
+    def _copy_extracted_data(source, candidate):
+        skip_columns = {'id', 'candidate_id', 'created_at', 'updated_at'}
+        values = {
+            column.name: getattr(source, column.name)
+            for column in ExtractedData.__table__.columns
+            if column.name not in skip_columns
+        }
+
+        extracted_data = ExtractedData(candidate_id=candidate.id, **values)
+        db.session.add(extracted_data)
+        candidate.skills = list(source.candidate.skills)
+        return extracted_data
+
+    @staticmethod
+    def _save_extracted_data(candidate, normalized_data):
+        education_value = normalized_data.get('education')
+        if isinstance(education_value, dict):
+            education_value = education_value.get('value')
+
+        extracted_data = ExtractedData(
+            candidate_id=candidate.id,
+            full_name=normalized_data['full_name']['value'],
+            full_name_confidence=normalized_data['full_name']['confidence'],
+            email=normalized_data['email']['value'],
+            email_confidence=normalized_data['email']['confidence'],
+            phone=normalized_data['phone']['value'],
+            phone_confidence=normalized_data['phone']['confidence'],
+            current_company=normalized_data['current_company']['value'],
+            current_company_confidence=normalized_data['current_company']['confidence'],
+            designation=normalized_data['designation']['value'],
+            designation_confidence=normalized_data['designation']['confidence'],
+            years_of_experience=normalized_data['years_of_experience'],
+            education=education_value,
+            raw_extracted_data=json.dumps(normalized_data)
+        )
+
+        if normalized_data['skills']['value']:
+            extracted_data.set_skills_list(normalized_data['skills']['value'])
+            extracted_data.skills_confidence = normalized_data['skills']['confidence']
+
+        db.session.add(extracted_data)
+        SkillService.set_candidate_skills(candidate, normalized_data['skills']['value'] or [])
+        return extracted_data
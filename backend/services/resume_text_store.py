@@ -0,0 +1,70 @@
+import asyncio
+from models import ResumeText
+from services.parse_pool import ParsePool
+from services.resume_compactor import ResumeCompactor
+from services.resume_parser import ResumeParser
+
+class ResumeTextStore:
+    """
+    Persists normalized, compressed resume text so downstream consumers
+    (extraction, re-extraction, search) never re-open the original file.
+    Text is re-parsed lazily only when the parser version changes.
+    """
+
+    @staticmethod
+    def save(candidate, text, parser_version=None):
+        record = candidate.resume_text
+        if record is None:
+            record = ResumeText(candidate_id=candidate.id)
+            candidate.resume_text = record
+
+        record.set_text(text)
+        record.parser_version = parser_version or ResumeParser.PARSER_VERSION
+        return record
+
+    @staticmethod
+    def get_text(candidate, reparse=True):
+        """
+        Returns the stored text, parsing the resume file (and storing the
+        result) when nothing is stored yet or it came from an older parser.
+        The caller is responsible for committing.
+        """
+        record = candidate.resume_text
+        if record is not None and (record.parser_version == ResumeParser.PARSER_VERSION or not reparse):
+            return record.get_text()
+
+        if not reparse:
+            return None
+
+        text = ResumeCompactor.normalize(ParsePool.parse(candidate.resume_path))
+        ResumeTextStore.save(candidate, text)
+        return text
+
+    @staticmethod
+    async def aget_text(candidate):
+        """
+        Async variant of get_text for the pipeline. The file is parsed in a
+        thread so the event loop keeps serving the worker's other jobs.
+        """
+        record = candidate.resume_text
+        if record is not None and record.parser_version == ResumeParser.PARSER_VERSION:
+            return record.get_text()
+
+        text = ResumeCompactor.normalize(await asyncio.to_thread(ParsePool.parse, candidate.resume_path))
+        ResumeTextStore.save(candidate, text)
+        return text
+
+    @staticmethod
+    def copy(source_candidate, target_candidate):
+        source = source_candidate.resume_text
+        if source is None:
+            return None
+
+        record = ResumeText(
+            candidate_id=target_candidate.id,
+            content=source.content,
+            parser_version=source.parser_version,
+            char_count=source.char_count
+        )
+        target_candidate.resume_text = record
+        return record
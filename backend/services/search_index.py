@@ -0,0 +1,185 @@
+import json
+import re
+import zlib
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from models import db, Candidate, ExtractedData, ResumeText
+
+class SearchIndex:
+    """
+    Full-text index over candidate name, company, designation, skills and
+    resume text. Uses an FTS5 virtual table on SQLite and a weighted
+    tsvector column with a GIN index on PostgreSQL. Rows are refreshed
+    inside the same transaction whenever ExtractedData or ResumeText
+    changes, so the index never needs a full rebuild.
+    """
+
+    TABLE = 'candidate_search'
+    TERM_PATTERN = re.compile(r'\w+', re.UNICODE)
+    MAX_TERMS = 8
+
+    # Column weights: name > company/designation > skills > resume text
+    SQLITE_RANK = f"bm25({TABLE}, 0.0, 10.0, 5.0, 5.0, 3.0, 1.0)"
+
+    @staticmethod
+    def _is_postgres(connection):
+        return connection.dialect.name == 'postgresql'
+
+    @staticmethod
+    def include_name(name, type_, parent_names):
+        """
+        Alembic autogenerate filter: the index tables (and FTS5 shadow
+        tables) are managed by hand-written migrations, not the models
+        """
+        return not (type_ == 'table' and name.startswith(SearchIndex.TABLE))
+
+    @staticmethod
+    def _document_fields(connection, candidate_id):
+        extracted = connection.execute(
+            text("SELECT full_name, current_company, designation, skills FROM extracted_data WHERE candidate_id = :id"),
+            {'id': candidate_id}
+        ).first()
+        resume = connection.execute(
+            text("SELECT content FROM resume_texts WHERE candidate_id = :id"),
+            {'id': candidate_id}
+        ).first()
+
+        if extracted is None and resume is None:
+            return None
+
+        skills = ''
+        if extracted is not None and extracted.skills:
+            try:
+                skills = ' '.join(str(skill) for skill in json.loads(extracted.skills))
+            except (ValueError, TypeError):
+                skills = extracted.skills
+
+        return {
+            'candidate_id': candidate_id,
+            'full_name': (extracted.full_name if extracted is not None else None) or '',
+            'current_company': (extracted.current_company if extracted is not None else None) or '',
+            'designation': (extracted.designation if extracted is not None else None) or '',
+            'skills': skills,
+            'resume_text': zlib.decompress(resume.content).decode('utf-8') if resume is not None else ''
+        }
+
+    @staticmethod
+    def refresh_candidate(connection, candidate_id):
+        """
+        Rewrites the index row for one candidate from the current
+        ExtractedData and ResumeText rows, or removes it if neither exists
+        """
+        fields = SearchIndex._document_fields(connection, candidate_id)
+        SearchIndex.remove_candidate(connection, candidate_id)
+
+        if fields is None:
+            return
+
+        if SearchIndex._is_postgres(connection):
+            fields['body'] = '\n'.join(
+                value for value in (fields['full_name'], fields['current_company'], fields['designation'],
+                                    fields['skills'], fields['resume_text']) if value
+            )
+            connection.execute(text(f"""
+                INSERT INTO {SearchIndex.TABLE} (candidate_id, body, document) VALUES (
+                    :candidate_id, :body,
+                    setweight(to_tsvector('english', :full_name), 'A') ||
+                    setweight(to_tsvector('english', :current_company || ' ' || :designation), 'B') ||
+                    setweight(to_tsvector('english', :skills), 'B') ||
+                    setweight(to_tsvector('english', :resume_text), 'D')
+                )
+            """), fields)
+        else:
+            connection.execute(text(f"""
+                INSERT INTO {SearchIndex.TABLE} (candidate_id, full_name, current_company, designation, skills, resume_text)
+                VALUES (:candidate_id, :full_name, :current_company, :designation, :skills, :resume_text)
+            """), fields)
+
+    @staticmethod
+    def remove_candidate(connection, candidate_id):
+        connection.execute(text(f"DELETE FROM {SearchIndex.TABLE} WHERE candidate_id = :id"), {'id': candidate_id})
+
+    @staticmethod
+    def rebuild(connection):
+        connection.execute(text(f"DELETE FROM {SearchIndex.TABLE}"))
+        candidate_ids = connection.execute(text(
+            "SELECT candidate_id FROM extracted_data UNION SELECT candidate_id FROM resume_texts"
+        )).scalars().all()
+
+        for candidate_id in candidate_ids:
+            SearchIndex.refresh_candidate(connection, candidate_id)
+        return len(candidate_ids)
+
+    @staticmethod
+    def _terms(query):
+        return [term.lower() for term in SearchIndex.TERM_PATTERN.findall(query or '')][:SearchIndex.MAX_TERMS]
+
+    @staticmethod
+    def search(query, limit=20, offset=0, status=None):
+        """
+        Returns [{'candidate_id', 'rank', 'snippet'}] best match first. Every
+        term must match; terms are matched as prefixes.
+        """
+        terms = SearchIndex._terms(query)
+        if not terms:
+            return []
+
+        connection = db.session.connection()
+        params = {'limit': limit, 'offset': offset, 'status': status}
+        status_filter = "AND c.extraction_status = :status" if status else ""
+
+        if SearchIndex._is_postgres(connection):
+            params['query'] = ' & '.join(f"{term}:*" for term in terms)
+            rows = connection.execute(text(f"""
+                SELECT page.candidate_id, page.rank,
+                       ts_headline('english', page.body, to_tsquery('english', :query),
+                                   'MaxFragments=2, MaxWords=12, MinWords=4, StartSel=<mark>, StopSel=</mark>') AS snippet
+                FROM (
+                    SELECT s.candidate_id, s.body, ts_rank_cd(s.document, to_tsquery('english', :query)) AS rank
+                    FROM {SearchIndex.TABLE} s
+                    JOIN candidates c ON c.id = s.candidate_id
+                    WHERE s.document @@ to_tsquery('english', :query) {status_filter}
+                    ORDER BY rank DESC, s.candidate_id
+                    LIMIT :limit OFFSET :offset
+                ) page
+                ORDER BY page.rank DESC, page.candidate_id
+            """), params)
+        else:
+            params['query'] = ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+            rows = connection.execute(text(f"""
+                SELECT {SearchIndex.TABLE}.candidate_id, -{SearchIndex.SQLITE_RANK} AS rank,
+                       snippet({SearchIndex.TABLE}, -1, '<mark>', '</mark>', '…', 12) AS snippet
+                FROM {SearchIndex.TABLE}
+                JOIN candidates c ON c.id = {SearchIndex.TABLE}.candidate_id
+                WHERE {SearchIndex.TABLE} MATCH :query {status_filter}
+                ORDER BY {SearchIndex.SQLITE_RANK}
+                LIMIT :limit OFFSET :offset
+            """), params)
+
+        return [
+            {'candidate_id': row.candidate_id, 'rank': round(float(row.rank), 6), 'snippet': row.snippet}
+            for row in rows
+        ]
+
+
+@event.listens_for(Session, 'after_flush')
+def _sync_search_index(session, flush_context):
+    changed = set()
+    removed = set()
+
+    dirty = [instance for instance in session.dirty if session.is_modified(instance)]
+
+    for instance in list(session.new) + dirty + list(session.deleted):
+        if isinstance(instance, (ExtractedData, ResumeText)) and instance.candidate_id:
+            changed.add(instance.candidate_id)
+        elif isinstance(instance, Candidate) and instance in session.deleted:
+            removed.add(instance.id)
+
+    if not changed and not removed:
+        return
+
+    connection = session.connection()
+    for candidate_id in removed:
+        SearchIndex.remove_candidate(connection, candidate_id)
+    for candidate_id in changed - removed:
+        SearchIndex.refresh_candidate(connection, candidate_id)
@@ -0,0 +1,90 @@
+import re
+
+class SkillNormalizer:
+    """
+    Maps free-text skill names from extraction onto canonical names, so
+    "ReactJS", "React.js" and "react" all become the same Skill
+    """
+
+    # Keys are compact lowercase forms (see compact_key)
+    ALIASES = {
+        'react': 'React', 'reactjs': 'React',
+        'reactnative': 'React Native',
+        'angular': 'Angular', 'angularjs': 'Angular',
+        'vue': 'Vue.js', 'vuejs': 'Vue.js',
+        'nextjs': 'Next.js',
+        'node': 'Node.js', 'nodejs': 'Node.js',
+        'express': 'Express', 'expressjs': 'Express',
+        'js': 'JavaScript', 'javascript': 'JavaScript', 'es6': 'JavaScript',
+        'ts': 'TypeScript', 'typescript': 'TypeScript',
+        'py': 'Python', 'python': 'Python', 'python3': 'Python',
+        'golang': 'Go', 'go': 'Go',
+        'java': 'Java', 'corejava': 'Java',
+        'springboot': 'Spring Boot',
+        'c#': 'C#', 'csharp': 'C#',
+        'c++': 'C++', 'cpp': 'C++',
+        'net': '.NET', 'dotnet': '.NET', 'netcore': '.NET',
+        'aws': 'AWS', 'amazonwebservices': 'AWS',
+        'gcp': 'GCP', 'googlecloud': 'GCP', 'googlecloudplatform': 'GCP',
+        'azure': 'Azure', 'microsoftazure': 'Azure',
+        'k8s': 'Kubernetes', 'kubernetes': 'Kubernetes',
+        'docker': 'Docker',
+        'postgres': 'PostgreSQL', 'postgresql': 'PostgreSQL', 'psql': 'PostgreSQL',
+        'mysql': 'MySQL',
+        'mongo': 'MongoDB', 'mongodb': 'MongoDB',
+        'sql': 'SQL',
+        'html': 'HTML', 'html5': 'HTML',
+        'css': 'CSS', 'css3': 'CSS',
+        'ml': 'Machine Learning', 'machinelearning': 'Machine Learning',
+        'dl': 'Deep Learning', 'deeplearning': 'Deep Learning',
+        'nlp': 'NLP', 'naturallanguageprocessing': 'NLP',
+        'tensorflow': 'TensorFlow', 'tf': 'TensorFlow',
+        'pytorch': 'PyTorch', 'torch': 'PyTorch',
+        'sklearn': 'scikit-learn', 'scikitlearn': 'scikit-learn',
+        'rest': 'REST APIs', 'restapi': 'REST APIs', 'restapis': 'REST APIs', 'restful': 'REST APIs',
+        'restfulapis': 'REST APIs',
+        'cicd': 'CI/CD',
+        'git': 'Git', 'github': 'GitHub',
+        'excel': 'Excel', 'msexcel': 'Excel', 'microsoftexcel': 'Excel'
+    }
+
+    MAX_LENGTH = 100
+    SPACE_PATTERN = re.compile(r'\s+')
+    COMPACT_PATTERN = re.compile(r'[\s._\-/]+')
+
+    @staticmethod
+    def clean(name):
+        return SkillNormalizer.SPACE_PATTERN.sub(' ', str(name or '')).strip(' ,;:')
+
+    @staticmethod
+    def compact_key(name):
+        return SkillNormalizer.COMPACT_PATTERN.sub('', SkillNormalizer.clean(name).lower())
+
+    @staticmethod
+    def canonicalize(name):
+        """
+        Returns (normalized_name, display_name), or None for an empty or
+        overlong name. normalized_name is the unique lookup key.
+        """
+        cleaned = SkillNormalizer.clean(name)
+        key = SkillNormalizer.compact_key(cleaned)
+        if not key or len(cleaned) > SkillNormalizer.MAX_LENGTH:
+            return None
+
+        display = SkillNormalizer.ALIASES.get(key)
+        if display is not None:
+            return SkillNormalizer.compact_key(display), display
+        return key, cleaned
+
+    @staticmethod
+    def canonicalize_all(names):
+        """
+        Canonicalizes a list of names, dropping duplicates and keeping the
+        first spelling seen. Returns {normalized_name: display_name}.
+        """
+        skills = {}
+        for name in names or []:
+            canonical = SkillNormalizer.canonicalize(name)
+            if canonical is not None and canonical[0] not in skills:
+                skills[canonical[0]] = canonical[1]
+        return skills
@@ -0,0 +1,74 @@
+from sqlalchemy import intersect, select
+from sqlalchemy.exc import IntegrityError
+from models import db, Skill, candidate_skills
+from services.skill_normalizer import SkillNormalizer
+
+class SkillService:
+    """
+    Maintains the canonical Skill table and the candidate_skills
+    association, and answers skill filter queries from its indexes
+    """
+
+    @staticmethod
+    def get_or_create(skills):
+        """
+        Takes {normalized_name: display_name} and returns the matching Skill
+        rows, creating missing ones. A concurrent insert of the same skill
+        is resolved by re-reading it.
+        """
+        if not skills:
+            return []
+
+        existing = {
+            skill.normalized_name: skill
+            for skill in Skill.query.filter(Skill.normalized_name.in_(list(skills))).all()
+        }
+
+        for normalized_name, name in skills.items():
+            if normalized_name in existing:
+                continue
+
+            try:
+                with db.session.begin_nested():
+                    skill = Skill(name=name, normalized_name=normalized_name)
+                    db.session.add(skill)
+            except IntegrityError:
+                skill = Skill.query.filter_by(normalized_name=normalized_name).one()
+            existing[normalized_name] = skill
+
+        return [existing[normalized_name] for normalized_name in skills]
+
+    @staticmethod
+    def set_candidate_skills(candidate, names):
+        candidate.skills = SkillService.get_or_create(SkillNormalizer.canonicalize_all(names))
+        return candidate.skills
+
+    @staticmethod
+    def resolve(names):
+        """
+        Returns (skills, unknown_names) for the requested names
+        """
+        requested = SkillNormalizer.canonicalize_all(names)
+        if not requested:
+            return [], []
+
+        found = Skill.query.filter(Skill.normalized_name.in_(list(requested))).all()
+        known = {skill.normalized_name for skill in found}
+        unknown = [name for normalized_name, name in requested.items() if normalized_name not in known]
+        return found, unknown
+
+    @staticmethod
+    def candidate_ids_query(skill_ids, match_all=True):
+        """
+        Select of candidate ids having all (INTERSECT of one index range per
+        skill) or any of the given skills
+        """
+        if match_all and len(skill_ids) > 1:
+            return intersect(*[
+                select(candidate_skills.c.candidate_id).where(candidate_skills.c.skill_id == skill_id)
+                for skill_id in skill_ids
+            ])
+
+        return select(candidate_skills.c.candidate_id).where(
+            candidate_skills.c.skill_id.in_(skill_ids)
+        ).distinct()
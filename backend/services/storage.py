@@ -0,0 +1,265 @@
+import abc
+import hashlib
+import os
+import shutil
+import uuid
+from sqlalchemy import delete, event, insert, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+from models import db, Candidate, SubmittedDocument, StoredBlob
+from config import Config
+
+class StorageBackend(abc.ABC):
+    """
+    Where uploaded files end up. store() consumes a fully written file
+    (normally a temp file in UPLOAD_FOLDER/tmp) and returns the path it
+    was stored at; release() drops one reference to a stored path.
+    """
+
+    name = None
+
+    @abc.abstractmethod
+    def store(self, source_path, kind, filename, content_hash, size, keep_source=False):
+        pass
+
+    @abc.abstractmethod
+    def release(self, path):
+        pass
+
+    @staticmethod
+    def _place(source_path, destination, keep_source):
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        if not keep_source:
+            os.replace(source_path, destination)
+            return
+
+        try:
+            os.link(source_path, destination)
+        except OSError:
+            temp_path = f"{destination}.{uuid.uuid4().hex}.part"
+            shutil.copyfile(source_path, temp_path)
+            os.replace(temp_path, destination)
+
+
+class FlatStorageBackend(StorageBackend):
+    """
+    The original layout: UPLOAD_FOLDER/<kind>/<uuid>_<filename>, one file
+    per upload
+    """
+
+    name = 'flat'
+
+    def store(self, source_path, kind, filename, content_hash, size, keep_source=False):
+        path = os.path.join(Config.UPLOAD_FOLDER, kind, f"{uuid.uuid4()}_{filename}")
+        self._place(source_path, path, keep_source)
+        return path
+
+    def release(self, path):
+        if os.path.exists(path):
+            os.remove(path)
+            return True
+        return False
+
+
+class ContentAddressedStorageBackend(StorageBackend):
+    """
+    Stores each distinct file once under UPLOAD_FOLDER/cas/ab/cd/<sha256><ext>,
+    sharded on the hash so no directory grows large. StoredBlob rows count
+    the references; a file is deleted after the commit that drops its last
+    reference, unless a concurrent store() has referenced it again.
+    """
+
+    name = 'cas'
+
+    @staticmethod
+    def root():
+        return os.path.join(Config.UPLOAD_FOLDER, 'cas')
+
+    @staticmethod
+    def blob_key(content_hash, filename):
+        return content_hash + os.path.splitext(filename)[1].lower()
+
+    @staticmethod
+    def path_for(blob_key):
+        return os.path.join(ContentAddressedStorageBackend.root(), blob_key[:2], blob_key[2:4], blob_key)
+
+    @staticmethod
+    def owns(path):
+        root = os.path.abspath(ContentAddressedStorageBackend.root())
+        return os.path.abspath(path).startswith(root + os.sep)
+
+    def store(self, source_path, kind, filename, content_hash, size, keep_source=False):
+        blob_key = self.blob_key(content_hash, filename)
+        path = self.path_for(blob_key)
+
+        # The reference is taken first: the row then stays locked until this
+        # transaction ends, so no release() can drop the file in between
+        self._add_reference(blob_key, content_hash, size)
+
+        if os.path.exists(path):
+            if not keep_source:
+                os.remove(source_path)
+        else:
+            self._place(source_path, path, keep_source)
+
+        return path
+
+    @staticmethod
+    def _increment(blob_key):
+        return db.session.execute(
+            update(StoredBlob)
+            .where(StoredBlob.blob_key == blob_key)
+            .values(ref_count=StoredBlob.ref_count + 1, updated_at=db.func.now())
+        ).rowcount
+
+    def _add_reference(self, blob_key, content_hash, size):
+        if self._increment(blob_key):
+            return
+
+        try:
+            with db.session.begin_nested():
+                db.session.add(StoredBlob(blob_key=blob_key, content_hash=content_hash, size=size, ref_count=1))
+        except IntegrityError:
+            self._increment(blob_key)
+
+    def release(self, path):
+        blob = StoredBlob.query.filter_by(blob_key=os.path.basename(path)).with_for_update().first()
+        if blob is None:
+            return False
+
+        blob.ref_count -= 1
+        if blob.ref_count <= 0:
+            db.session.delete(blob)
+            db.session.info.setdefault('storage_deletes', []).append(path)
+        return True
+
+    @staticmethod
+    def delete_unreferenced(bind, path):
+        """
+        Deletes a released file unless its blob has been referenced again.
+        A row without references is held while the file is removed: it waits
+        for a store() inserting the same key to finish, and makes a later
+        store() wait until the file is gone and place it afresh.
+        """
+        blob_key = os.path.basename(path)
+        with bind.begin() as connection:
+            try:
+                with connection.begin_nested():
+                    connection.execute(insert(StoredBlob).values(
+                        id=str(uuid.uuid4()),
+                        blob_key=blob_key,
+                        content_hash=os.path.splitext(blob_key)[0],
+                        size=0,
+                        ref_count=0
+                    ))
+            except IntegrityError:
+                return False
+
+            if os.path.exists(path):
+                os.remove(path)
+            connection.execute(delete(StoredBlob).where(StoredBlob.blob_key == blob_key, StoredBlob.ref_count == 0))
+        return True
+
+
+BACKENDS = {
+    FlatStorageBackend.name: FlatStorageBackend(),
+    ContentAddressedStorageBackend.name: ContentAddressedStorageBackend()
+}
+
+def get_storage(name=None):
+    name = name or Config.STORAGE_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown storage backend: {name}")
+    return BACKENDS[name]
+
+def storage_for_path(path):
+    """
+    The backend a stored path belongs to, whatever backend is configured
+    for new uploads
+    """
+    if ContentAddressedStorageBackend.owns(path):
+        return BACKENDS[ContentAddressedStorageBackend.name]
+    return BACKENDS[FlatStorageBackend.name]
+
+
+@event.listens_for(Session, 'after_commit')
+def _delete_released_blobs(session):
+    for path in session.info.pop('storage_deletes', []):
+        try:
+            ContentAddressedStorageBackend.delete_unreferenced(session.get_bind(), path)
+        except (OSError, SQLAlchemyError) as e:
+            print(f"[STORAGE] Failed to delete {path}: {str(e)}")
+
+@event.listens_for(Session, 'after_rollback')
+def _keep_released_blobs(session):
+    session.info.pop('storage_deletes', None)
+
+
+class StorageMigrator:
+    """
+    Moves files stored by the flat backend into the content-addressed
+    store and repoints the rows at them. Each file is linked (or copied)
+    into the store first; the original is removed only after the batch
+    that references the new path has been committed, so an interrupted
+    run loses nothing and can simply be re-run.
+    """
+
+    @staticmethod
+    def _hash(path, chunk_size=64 * 1024):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as source:
+            for chunk in iter(lambda: source.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _migrate_rows(model, path_column, name_column, hash_column, kind, batch_size, dry_run, stats):
+        cas = BACKENDS[ContentAddressedStorageBackend.name]
+        last_id = ''
+
+        while True:
+            rows = model.query.filter(model.id > last_id).order_by(model.id).limit(batch_size).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            moved = []
+            for row in rows:
+                path = getattr(row, path_column)
+                if not path or cas.owns(path):
+                    continue
+                if not os.path.exists(path):
+                    stats['missing'] += 1
+                    continue
+
+                # The stored hash was computed over the same bytes at upload time
+                content_hash = (hash_column and getattr(row, hash_column)) or StorageMigrator._hash(path)
+                stats['migrated'] += 1
+                stats['bytes'] += os.path.getsize(path)
+                if dry_run:
+                    continue
+
+                new_path = cas.store(path, kind, getattr(row, name_column), content_hash, os.path.getsize(path),
+                                     keep_source=True)
+                setattr(row, path_column, new_path)
+                if hash_column:
+                    setattr(row, hash_column, content_hash)
+                moved.append(path)
+
+            if not dry_run:
+                db.session.commit()
+                for path in moved:
+                    if os.path.exists(path):
+                        os.remove(path)
+
+    @staticmethod
+    def migrate_to_cas(batch_size=200, dry_run=False):
+        stats = {'migrated': 0, 'missing': 0, 'bytes': 0}
+        StorageMigrator._migrate_rows(Candidate, 'resume_path', 'resume_filename', 'content_hash', 'resumes',
+                                      batch_size, dry_run, stats)
+        StorageMigrator._migrate_rows(SubmittedDocument, 'document_path', 'document_filename', 'content_hash',
+                                      'documents', batch_size, dry_run, stats)
+        # Originals kept before image normalization; no hash of them is stored
+        StorageMigrator._migrate_rows(SubmittedDocument, 'original_path', 'document_filename', None,
+                                      'originals', batch_size, dry_run, stats)
+        return stats
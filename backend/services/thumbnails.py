@@ -0,0 +1,124 @@
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+
+class ThumbnailService:
+    """
+    Small JPEG previews of submitted documents at the fixed sizes in
+    DOCUMENT_THUMBNAIL_SIZES (longest side, in pixels). Images are decoded
+    with Pillow, PDFs by rasterizing the first page. Thumbnails are keyed
+    by the document's content hash, so identical files share them and a
+    stored thumbnail never goes stale:
+    UPLOAD_FOLDER/thumbnails/ab/<sha256>-<size>.jpg
+    """
+
+    @staticmethod
+    def sizes():
+        return sorted({int(size) for size in Config.DOCUMENT_THUMBNAIL_SIZES.split(',') if size.strip()})
+
+    @staticmethod
+    def path_for(content_hash, size):
+        return os.path.join(Config.UPLOAD_FOLDER, 'thumbnails', content_hash[:2], f"{content_hash}-{size}.jpg")
+
+    @staticmethod
+    def _open_source(path, size):
+        from PIL import Image, ImageOps
+
+        if path.lower().endswith('.pdf'):
+            import pdfplumber
+            with pdfplumber.open(path) as pdf:
+                page = pdf.pages[0]
+                # Rasterize just large enough for the requested size
+                resolution = max(10, 72 * size / max(page.width, page.height))
+                return page.to_image(resolution=resolution).original.copy()
+
+        with Image.open(path) as image:
+            # Lets the JPEG decoder scale down while decoding instead of after
+            image.draft('RGB', (size, size))
+            # Returns a loaded copy (transposed if needed), so the file can close
+            return ImageOps.exif_transpose(image)
+
+    @staticmethod
+    def _to_rgb(image):
+        from PIL import Image
+
+        if image.mode in ('RGBA', 'LA', 'P'):
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            return background
+        return image.convert('RGB')
+
+    @staticmethod
+    def generate(path, content_hash):
+        """
+        Writes any missing thumbnails for a document, decoding the source
+        once and scaling down from the largest size. Returns the number
+        written.
+        """
+        missing = [
+            size for size in ThumbnailService.sizes()
+            if not os.path.exists(ThumbnailService.path_for(content_hash, size))
+        ]
+        if not missing:
+            return 0
+
+        from PIL import Image
+
+        image = ThumbnailService._to_rgb(ThumbnailService._open_source(path, max(missing)))
+        for size in sorted(missing, reverse=True):
+            image.thumbnail((size, size), Image.LANCZOS)
+
+            destination = ThumbnailService.path_for(content_hash, size)
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(destination), suffix='.part', delete=False) as temp:
+                image.save(temp, 'JPEG', quality=Config.DOCUMENT_THUMBNAIL_QUALITY, optimize=True)
+            os.replace(temp.name, destination)
+
+        return len(missing)
+
+    @staticmethod
+    def get(path, content_hash, size):
+        """
+        Path of the thumbnail at size, generating it now if the background
+        job has not (yet) done so
+        """
+        if size not in ThumbnailService.sizes():
+            raise ValueError(f"Unsupported thumbnail size. Use one of: {ThumbnailService.sizes()}")
+
+        thumbnail_path = ThumbnailService.path_for(content_hash, size)
+        if not os.path.exists(thumbnail_path):
+            ThumbnailService.generate(path, content_hash)
+        return thumbnail_path
+
+    @staticmethod
+    def _generate_logged(path, content_hash):
+        try:
+            ThumbnailService.generate(path, content_hash)
+        except Exception as e:
+            print(f"[THUMBNAIL] Failed for {content_hash}: {str(e)}")
+
+    @staticmethod
+    def schedule(path, content_hash):
+        """
+        Generates the thumbnails in the background; failures are logged and
+        the endpoint retries on first request
+        """
+        get_thumbnail_executor().submit(ThumbnailService._generate_logged, path, content_hash)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_thumbnail_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=Config.THUMBNAIL_WORKERS,
+                    thread_name_prefix='thumbnail'
+                )
+    return _executor
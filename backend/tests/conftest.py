@@ -0,0 +1,45 @@
+import os
+import sys
+import tempfile
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+# Config reads the environment at import time, so this runs before any app import
+os.environ.update({
+    'DATABASE_URL': 'sqlite://',
+    'UPLOAD_FOLDER': tempfile.mkdtemp(prefix='traqcheck-tests-'),
+    'AZURE_OPENAI_ENDPOINT': 'http://127.0.0.1:9',
+    'AZURE_OPENAI_API_KEY': 'test',
+    'AZURE_OPENAI_API_VERSION': '2024-02-01',
+    'AZURE_OPENAI_DEPLOYMENT_NAME': 'test',
+    'LLM_CACHE_ENABLED': 'false',
+    'METRICS_ENABLED': 'false',
+    'RESUME_WORKERS_EMBEDDED': 'false',
+    'SMTP_HOST': ''
+})
+
+
+@pytest.fixture
+def app():
+    """
+    App on a fresh in-memory SQLite database, migrated to head
+    """
+    from flask_migrate import upgrade
+    from app import create_app
+    from models import db
+    from services.candidate_listing import CandidateListing
+
+    app = create_app(start_workers=False, metrics=False)
+    with app.app_context():
+        upgrade(directory=os.path.join(BACKEND_DIR, 'migrations'))
+        CandidateListing._counts.clear()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,95 @@
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import event
+from models import db, Candidate, ExtractedData, DocumentRequest, SubmittedDocument
+from services.candidate_listing import CandidateListing
+from services.skill_service import SkillService
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def record(connection, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+
+
+def add_candidates(count, documents_per_candidate=2):
+    candidates = []
+    for index in range(count):
+        candidate = Candidate(
+            resume_filename=f"resume_{index}.pdf",
+            resume_path=f"uploads/resumes/resume_{index}.pdf",
+            extraction_status='completed'
+        )
+        db.session.add(candidate)
+        db.session.flush()
+
+        db.session.add(ExtractedData(
+            candidate_id=candidate.id,
+            full_name=f"Candidate {index}",
+            email=f"candidate{index}@example.com",
+            current_company='Acme',
+            skills='["Python", "SQL"]'
+        ))
+        SkillService.set_candidate_skills(candidate, ['Python', 'SQL', f"Skill {index}"])
+        for number in range(documents_per_candidate):
+            db.session.add(DocumentRequest(
+                candidate_id=candidate.id, request_type='email', request_message=f"Request {number}"
+            ))
+            db.session.add(SubmittedDocument(
+                candidate_id=candidate.id,
+                document_type='pan',
+                document_path=f"uploads/documents/{candidate.id}_{number}.pdf",
+                document_filename=f"pan_{number}.pdf"
+            ))
+        candidates.append(candidate)
+
+    db.session.commit()
+    return candidates
+
+
+def list_query_count(client):
+    # Measure the uncached path; the total is otherwise reused for a while
+    CandidateListing._counts.clear()
+    with count_queries() as statements:
+        response = client.get('/api/candidates?limit=100')
+    assert response.status_code == 200
+    return len(statements), len(response.get_json()['candidates'])
+
+
+def detail_query_count(client, candidate_id):
+    db.session.expunge_all()
+    with count_queries() as statements:
+        response = client.get(f'/api/candidates/{candidate_id}')
+    assert response.status_code == 200
+    body = response.get_json()
+    assert len(body['submitted_documents']) and len(body['document_requests']) and body['skills']
+    return len(statements)
+
+
+def test_candidate_list_query_count_is_constant(client):
+    add_candidates(3)
+    small, listed = list_query_count(client)
+    assert listed == 3
+
+    add_candidates(40)
+    large, listed = list_query_count(client)
+    assert listed == 43
+
+    # One page query plus the total count
+    assert small == large == 2
+
+
+@pytest.mark.parametrize('documents', [1, 6])
+def test_candidate_detail_query_count_is_constant(client, documents):
+    candidate = add_candidates(1, documents_per_candidate=documents)[0]
+
+    # Candidate with extracted data, then one select each for requests, documents and skills
+    assert detail_query_count(client, candidate.id) == 4
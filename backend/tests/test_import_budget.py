@@ -0,0 +1,62 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded on first use only; none of these may be imported by create_app()
+LAZY_MODULES = [
+    'langchain_core', 'langchain_openai', 'openai', 'pdfplumber', 'PyPDF2', 'docx', 'numpy', 'scipy', 'PIL'
+]
+
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+from app import create_app
+create_app(start_workers=False)
+elapsed = time.perf_counter() - started
+print(json.dumps({
+    'milliseconds': elapsed * 1000,
+    'eager': [name for name in %r if name in sys.modules]
+}))
+"""
+
+
+def measure(runs):
+    """
+    Times `from app import create_app; create_app()` in fresh interpreters.
+    Returns (millisecond timings, lazy modules that were imported anyway).
+    """
+    env = dict(os.environ)
+    env.setdefault('DATABASE_URL', 'sqlite://')
+    env.setdefault('METRICS_ENABLED', 'false')
+
+    timings = []
+    eager = set()
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-c', CHILD % (LAZY_MODULES,)],
+            cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+        )
+        sample = json.loads(result.stdout.strip().splitlines()[-1])
+        timings.append(sample['milliseconds'])
+        eager.update(sample['eager'])
+    return timings, sorted(eager)
+
+
+def test_create_app_stays_within_import_budget():
+    budget_ms = float(os.getenv('IMPORT_BUDGET_MS', 1000))
+    runs = int(os.getenv('IMPORT_BUDGET_RUNS', 5))
+
+    timings, eager = measure(runs)
+    median = statistics.median(timings)
+    print(f"[IMPORT BUDGET] create_app startup: median {median:.0f} ms over {runs} run(s) "
+          f"(min {min(timings):.0f}, max {max(timings):.0f}); budget {budget_ms:.0f} ms")
+
+    assert not eager, f"Imported at startup but should be lazy: {', '.join(eager)}"
+    assert median <= budget_ms, (
+        "Over budget; profile with "
+        "`python -X importtime -c \"from app import create_app; create_app(start_workers=False)\"`"
+    )
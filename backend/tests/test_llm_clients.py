@@ -0,0 +1,127 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import httpx
+import pytest
+from services.llm_clients import _PerLoopTransport
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.open_connections += 1
+
+    def finish(self):
+        super().finish()
+        with self.server.lock:
+            self.server.open_connections -= 1
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), OkHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.open_connections = 0
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def wait_for_connections(server, expected, timeout=5):
+    deadline = time.monotonic() + timeout
+    while server.open_connections != expected and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return server.open_connections
+
+
+def fetch_on_new_loop(client, url, count, close_pool=False):
+    async def fetch_all():
+        responses = await asyncio.gather(*(client.get(url) for _ in range(count)))
+        assert all(response.status_code == 200 for response in responses)
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(fetch_all())
+        if close_pool:
+            loop.run_until_complete(client._transport.aclose_current_loop())
+    finally:
+        loop.close()
+
+
+def make_client():
+    transport = _PerLoopTransport(httpx.Limits(max_connections=4))
+    return transport, httpx.AsyncClient(transport=transport)
+
+
+def test_owner_closes_its_loops_pool(server):
+    transport, client = make_client()
+    fetch_on_new_loop(client, server.url, 2, close_pool=True)
+
+    assert wait_for_connections(server, 0) == 0
+    assert not transport._transports
+
+
+def test_pools_of_closed_loops_are_dropped_on_next_request(server):
+    transport, client = make_client()
+    fetch_on_new_loop(client, server.url, 2)
+    closed_loop, = transport._transports
+
+    fetch_on_new_loop(client, server.url, 1)
+
+    assert closed_loop not in transport._transports
+    assert len(transport._transports) == 1
+
+
+def test_client_aclose_closes_the_running_loops_pool(server):
+    transport, client = make_client()
+    fetch_on_new_loop(client, server.url, 2)
+
+    async def fetch_and_close():
+        await client.get(server.url)
+        await client.aclose()
+
+    asyncio.run(fetch_and_close())
+
+    # The closed loop's pool is dropped along with it
+    assert not transport._transports
+
+
+def test_aclose_current_loop_leaves_other_pools(server):
+    transport, client = make_client()
+
+    # A pool on another loop that is still running is not touched
+    other_loop = asyncio.new_event_loop()
+    other_thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    other_thread.start()
+
+    async def fetch_and_close():
+        await client.get(server.url)
+        assert wait_for_connections(server, 2) == 2
+        await transport.aclose_current_loop()
+
+    try:
+        asyncio.run_coroutine_threadsafe(client.get(server.url), other_loop).result(5)
+        asyncio.run(fetch_and_close())
+
+        assert wait_for_connections(server, 1) == 1
+        assert list(transport._transports) == [other_loop]
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        other_thread.join(5)
+        other_loop.close()
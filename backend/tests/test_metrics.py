@@ -0,0 +1,68 @@
+import os
+import shutil
+import subprocess
+import sys
+import urllib.request
+from services.metrics import MetricsRegistry
+
+
+def make_registry():
+    registry = MetricsRegistry(enabled=True)
+    counter = registry.counter('test_requests_total', 'Requests', ('outcome',))
+    histogram = registry.histogram('test_seconds', 'Latency', buckets=(0.1, 1))
+    return registry, counter, histogram
+
+
+def test_multiprocess_render_sums_every_process_snapshot(tmp_path):
+    registry, counter, histogram = make_registry()
+    registry.enable_multiprocess(str(tmp_path), flush_interval=3600)
+    registry.collector(lambda: [('test_cache_hits_total', 'counter', 'Cache hits', 3)])
+
+    counter.inc(2, outcome='ok')
+    histogram.observe(0.5)
+    registry.flush()
+
+    # A second process with the same values, e.g. another gunicorn worker
+    snapshot, = os.listdir(tmp_path)
+    shutil.copy(tmp_path / snapshot, tmp_path / 'other-process.json')
+
+    output = registry.render()
+    assert 'test_requests_total{outcome="ok"} 4' in output
+    assert 'test_seconds_bucket{le="0.1"} 0' in output
+    assert 'test_seconds_bucket{le="1.0"} 2' in output
+    assert 'test_seconds_count 2' in output
+    assert 'test_cache_hits_total 6' in output
+
+
+def test_gauges_of_exited_processes_are_not_summed(tmp_path):
+    registry, _, _ = make_registry()
+    registry.enable_multiprocess(str(tmp_path), flush_interval=3600)
+    registry.collector(lambda: [
+        ('test_cache_hits_total', 'counter', 'Cache hits', 3),
+        ('test_cache_entries', 'gauge', 'Cache entries', 5)
+    ])
+    registry.flush()
+
+    exited = subprocess.Popen([sys.executable, '-c', 'pass'])
+    exited.wait()
+    snapshot, = os.listdir(tmp_path)
+    shutil.copy(tmp_path / snapshot, tmp_path / f"{exited.pid}-1.json")
+
+    output = registry.render()
+    assert 'test_cache_hits_total 6' in output
+    assert 'test_cache_entries 5' in output
+
+
+def test_serve_exposes_metrics_over_http():
+    registry, counter, _ = make_registry()
+    counter.inc(outcome='ok')
+
+    server = registry.serve(0, host='127.0.0.1')
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url) as response:
+            assert response.headers['Content-Type'] == MetricsRegistry.CONTENT_TYPE
+            assert 'test_requests_total{outcome="ok"} 1' in response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
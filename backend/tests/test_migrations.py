@@ -0,0 +1,122 @@
+import os
+from datetime import datetime
+import pytest
+import sqlalchemy as sa
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from config import Config
+
+MIGRATIONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+
+def baseline_metadata():
+    """
+    The models as db.create_all() built them before migrations existed
+    """
+    metadata = sa.MetaData()
+    sa.Table(
+        'candidates', metadata,
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('resume_filename', sa.String(255), nullable=False),
+        sa.Column('resume_path', sa.String(500), nullable=False),
+        sa.Column('upload_date', sa.DateTime),
+        sa.Column('extraction_status', sa.String(50)),
+        sa.Column('created_at', sa.DateTime),
+        sa.Column('updated_at', sa.DateTime)
+    )
+    sa.Table(
+        'extracted_data', metadata,
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('candidate_id', sa.String(36), sa.ForeignKey('candidates.id', ondelete='CASCADE'),
+                  nullable=False, unique=True),
+        sa.Column('full_name', sa.String(255)),
+        sa.Column('full_name_confidence', sa.Float),
+        sa.Column('email', sa.String(255)),
+        sa.Column('email_confidence', sa.Float),
+        sa.Column('phone', sa.String(20)),
+        sa.Column('phone_confidence', sa.Float),
+        sa.Column('current_company', sa.String(255)),
+        sa.Column('current_company_confidence', sa.Float),
+        sa.Column('designation', sa.String(255)),
+        sa.Column('designation_confidence', sa.Float),
+        sa.Column('skills', sa.Text),
+        sa.Column('skills_confidence', sa.Float),
+        sa.Column('years_of_experience', sa.Integer),
+        sa.Column('education', sa.Text),
+        sa.Column('raw_extracted_data', sa.Text),
+        sa.Column('created_at', sa.DateTime),
+        sa.Column('updated_at', sa.DateTime)
+    )
+    sa.Table(
+        'document_requests', metadata,
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('candidate_id', sa.String(36), sa.ForeignKey('candidates.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('request_type', sa.String(50), nullable=False),
+        sa.Column('request_message', sa.Text, nullable=False),
+        sa.Column('request_status', sa.String(50)),
+        sa.Column('requested_at', sa.DateTime),
+        sa.Column('created_at', sa.DateTime)
+    )
+    sa.Table(
+        'submitted_documents', metadata,
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('candidate_id', sa.String(36), sa.ForeignKey('candidates.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('document_type', sa.String(50), nullable=False),
+        sa.Column('document_path', sa.String(500), nullable=False),
+        sa.Column('document_filename', sa.String(255), nullable=False),
+        sa.Column('file_size', sa.Integer),
+        sa.Column('submitted_at', sa.DateTime),
+        sa.Column('verification_status', sa.String(50)),
+        sa.Column('created_at', sa.DateTime)
+    )
+    return metadata
+
+
+@pytest.fixture
+def baseline_app(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'baseline.db'}"
+    engine = sa.create_engine(url)
+    metadata = baseline_metadata()
+    metadata.create_all(engine)
+
+    now = datetime.utcnow()
+    with engine.begin() as connection:
+        connection.execute(metadata.tables['candidates'].insert(), {
+            'id': 'c1', 'resume_filename': 'resume.pdf', 'resume_path': 'uploads/resumes/resume.pdf',
+            'upload_date': now, 'extraction_status': 'completed', 'created_at': now, 'updated_at': now
+        })
+        connection.execute(metadata.tables['extracted_data'].insert(), {
+            'id': 'e1', 'candidate_id': 'c1', 'full_name': 'Priya Sharma', 'skills': '["ReactJS", "k8s"]'
+        })
+    engine.dispose()
+
+    monkeypatch.setattr(Config, 'SQLALCHEMY_DATABASE_URI', url)
+    from app import create_app
+    from models import db
+    app = create_app(start_workers=False, metrics=False)
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_baseline_database_upgrades_to_head(baseline_app):
+    from flask_migrate import stamp, upgrade
+    from models import db
+    from services.search_index import SearchIndex
+
+    stamp(directory=MIGRATIONS, revision='9d30264498f3')
+    upgrade(directory=MIGRATIONS)
+
+    # Nothing left between the migrated schema and the models
+    with db.engine.connect() as connection:
+        context = MigrationContext.configure(connection, opts={'include_name': SearchIndex.include_name})
+        assert compare_metadata(context, db.metadata) == []
+
+    response = baseline_app.test_client().get('/api/candidates?limit=10')
+    assert response.status_code == 200
+    candidate, = response.get_json()['candidates']
+    assert candidate['id'] == 'c1'
+
+    detail = baseline_app.test_client().get('/api/candidates/c1').get_json()
+    assert sorted(detail['skills']) == ['Kubernetes', 'React']
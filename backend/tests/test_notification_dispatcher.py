@@ -0,0 +1,164 @@
+import socket
+import socketserver
+import threading
+from datetime import datetime
+import pytest
+import services.notification_service as notification_service
+from config import Config
+from models import db, Candidate, DocumentRequest, NotificationOutbox
+from services.notification_dispatcher import NotificationDispatcher
+from services.notification_service import NotificationService
+
+
+class SMTPStandIn(socketserver.ThreadingTCPServer):
+    """
+    Just enough of an SMTP server for smtplib without TLS or auth; records
+    the connections made and the messages received
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), SMTPHandler)
+        self.connections = 0
+        self.messages = []
+        self.lock = threading.Lock()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        with self.server.lock:
+            self.server.connections += 1
+        self.reply('220 localhost ready')
+
+        for raw in self.rfile:
+            command = raw.decode().strip().upper()
+            if command.startswith(('EHLO', 'HELO')):
+                self.reply('250 localhost')
+            elif command == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                lines = []
+                for data in self.rfile:
+                    if data in (b'.\r\n', b'.\n'):
+                        break
+                    lines.append(data)
+                with self.server.lock:
+                    self.server.messages.append(b''.join(lines))
+                self.reply('250 OK')
+            elif command == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('250 OK')
+
+
+@pytest.fixture
+def smtp_config(monkeypatch):
+    monkeypatch.setattr(Config, 'SMTP_HOST', '127.0.0.1')
+    monkeypatch.setattr(Config, 'SMTP_USE_TLS', False)
+    monkeypatch.setattr(Config, 'SMTP_USERNAME', '')
+    monkeypatch.setattr(notification_service, '_smtp_pool', None)
+    yield
+    if notification_service._smtp_pool is not None:
+        notification_service._smtp_pool.close()
+
+
+@pytest.fixture
+def smtp_server(smtp_config, monkeypatch):
+    server = SMTPStandIn()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(Config, 'SMTP_PORT', server.port)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def closed_port():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+def queue_requests(count, max_attempts=None):
+    candidate = Candidate(resume_filename='resume.pdf', resume_path='uploads/resumes/resume.pdf')
+    db.session.add(candidate)
+    db.session.flush()
+
+    document_requests = []
+    for index in range(count):
+        document_request = DocumentRequest(
+            candidate_id=candidate.id, request_type='email', request_message=f"Please send documents {index}"
+        )
+        db.session.add(document_request)
+        entries = NotificationService.enqueue_document_request(
+            document_request, candidate_email=f"candidate{index}@example.com", candidate_phone=''
+        )
+        if max_attempts is not None:
+            for entry in entries:
+                entry.max_attempts = max_attempts
+        document_requests.append(document_request)
+
+    db.session.commit()
+    assert {request.request_status for request in document_requests} == {'queued'}
+    return document_requests
+
+
+def test_batch_is_delivered_over_one_connection(app, smtp_server):
+    document_requests = queue_requests(3)
+
+    assert NotificationDispatcher(app).run_once() == 3
+
+    assert smtp_server.connections == 1
+    assert len(smtp_server.messages) == 3
+    assert {entry.status for entry in NotificationOutbox.query} == {'sent'}
+    assert {request.request_status for request in document_requests} == {'sent'}
+
+
+def test_refused_connection_is_backed_off(app, smtp_config, monkeypatch):
+    monkeypatch.setattr(Config, 'SMTP_PORT', closed_port())
+    document_request, = queue_requests(1)
+    dispatcher = NotificationDispatcher(app)
+
+    assert dispatcher.run_once() == 1
+
+    entry = NotificationOutbox.query.one()
+    assert entry.status == 'pending'
+    assert entry.attempts == 1
+    assert entry.last_error
+    assert entry.locked_by is None
+    assert entry.available_at > datetime.utcnow()
+    assert document_request.request_status == 'queued'
+
+    # Not due again until the backoff has passed
+    assert dispatcher.run_once() == 0
+
+
+def test_request_fails_when_attempts_run_out(app, smtp_config, monkeypatch):
+    monkeypatch.setattr(Config, 'SMTP_PORT', closed_port())
+    document_request, = queue_requests(1, max_attempts=1)
+
+    assert NotificationDispatcher(app).run_once() == 1
+
+    assert NotificationOutbox.query.one().status == 'failed'
+    assert document_request.request_status == 'failed'
+
+
+def test_claims_from_one_dispatcher_do_not_overlap(app):
+    queue_requests(4)
+    dispatcher = NotificationDispatcher(app, batch_size=2)
+
+    first = dispatcher.claim_batch()
+    second = dispatcher.claim_batch()
+
+    assert len(first) == len(second) == 2
+    assert not {entry.id for entry in first} & {entry.id for entry in second}
+    assert first[0].locked_by != second[0].locked_by
+    assert all(entry.locked_by.startswith(dispatcher.worker_id) for entry in first + second)
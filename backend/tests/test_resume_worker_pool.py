@@ -0,0 +1,67 @@
+import asyncio
+from models import db, Candidate, ExtractedData, DocumentRequest, ProcessingJob
+from services.job_queue import JobQueue, ResumeWorkerPool
+from services.resume_pipeline import ResumePipeline
+
+
+class SlowEmailWriter:
+    """
+    Stands in for the orchestrator's email step and records how many calls
+    are in flight at once
+    """
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.finished = 0
+
+    async def write_email(self, candidate_info):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.2)
+        self.active -= 1
+        self.finished += 1
+        return f"Dear {candidate_info['full_name']}, please send your documents."
+
+
+def queue_extracted_candidates(count):
+    jobs = []
+    for index in range(count):
+        candidate = Candidate(
+            resume_filename=f"resume_{index}.pdf",
+            resume_path=f"uploads/resumes/resume_{index}.pdf",
+            extraction_status='completed'
+        )
+        db.session.add(candidate)
+        db.session.flush()
+        db.session.add(ExtractedData(candidate_id=candidate.id, full_name=f"Candidate {index}"))
+        jobs.append(JobQueue.enqueue(candidate.id, commit=False))
+
+    db.session.commit()
+    return [job.id for job in jobs]
+
+
+def test_worker_runs_claimed_jobs_concurrently(app):
+    job_ids = queue_extracted_candidates(2)
+
+    pipeline = ResumePipeline()
+    pipeline.agents = SlowEmailWriter()
+    pool = ResumeWorkerPool(app, size=1, poll_interval=0.05, concurrency=2)
+
+    async def run_until_drained():
+        work = asyncio.create_task(pool._work('test-worker', pipeline))
+        while pipeline.agents.finished < len(job_ids):
+            await asyncio.sleep(0.01)
+        pool._stop.set()
+        await work
+
+    try:
+        pipeline.execute(asyncio.wait_for(run_until_drained(), timeout=5))
+    finally:
+        pipeline.close()
+
+    assert pipeline.agents.peak == 2
+
+    db.session.expire_all()
+    assert [db.session.get(ProcessingJob, job_id).status for job_id in job_ids] == ['completed', 'completed']
+    assert DocumentRequest.query.filter_by(auto_generated=True).count() == 2
@@ -0,0 +1,66 @@
+import hashlib
+import os
+from config import Config
+from models import db, Candidate, SubmittedDocument, StoredBlob
+from services.storage import BACKENDS, ContentAddressedStorageBackend, StorageMigrator
+
+
+def write_file(name, content):
+    path = os.path.join(Config.UPLOAD_FOLDER, 'tmp', name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as target:
+        target.write(content)
+    return path, hashlib.sha256(content).hexdigest()
+
+
+def test_released_blob_referenced_again_is_kept(app):
+    cas = BACKENDS[ContentAddressedStorageBackend.name]
+    content = b'%PDF-1.4 released and stored again'
+    source, content_hash = write_file('first.pdf', content)
+    path = cas.store(source, 'documents', 'first.pdf', content_hash, len(content))
+    db.session.commit()
+
+    # The last reference is dropped, and the same content is stored again before the commit
+    cas.release(path)
+    source, _ = write_file('second.pdf', content)
+    assert cas.store(source, 'documents', 'second.pdf', content_hash, len(content)) == path
+    db.session.commit()
+
+    assert os.path.exists(path)
+    assert StoredBlob.query.filter_by(blob_key=os.path.basename(path)).one().ref_count == 1
+
+    cas.release(path)
+    db.session.commit()
+    assert not os.path.exists(path)
+    assert StoredBlob.query.count() == 0
+
+
+def test_migration_moves_kept_originals(app):
+    flat = BACKENDS['flat']
+    candidate = Candidate(resume_filename='resume.pdf', resume_path='uploads/resumes/resume.pdf')
+    db.session.add(candidate)
+    db.session.flush()
+
+    normalized, normalized_hash = write_file('id.jpg', b'normalized photo')
+    original, _ = write_file('id-original.jpg', b'original photo with exif')
+    document = SubmittedDocument(
+        candidate_id=candidate.id,
+        document_type='aadhaar',
+        document_filename='id.jpg',
+        document_path=flat.store(normalized, 'documents', 'id.jpg', normalized_hash, 16),
+        original_path=flat.store(original, 'originals', 'id.jpg', None, 24),
+        content_hash=normalized_hash
+    )
+    db.session.add(document)
+    db.session.commit()
+    flat_paths = (document.document_path, document.original_path)
+
+    stats = StorageMigrator.migrate_to_cas()
+
+    assert stats['migrated'] == 2
+    assert ContentAddressedStorageBackend.owns(document.document_path)
+    assert ContentAddressedStorageBackend.owns(document.original_path)
+    assert document.content_hash == normalized_hash
+    with open(document.original_path, 'rb') as stored:
+        assert stored.read() == b'original photo with exif'
+    assert not any(os.path.exists(path) for path in flat_paths)
@@ -0,0 +1,24 @@
+import signal
+import time
+from app import create_app
+from config import Config
+from services.job_queue import ResumeWorkerPool
+from services.metrics import REGISTRY
+from services.notification_dispatcher import NotificationDispatcher
+
+if __name__ == '__main__':
+    app = create_app(start_workers=False)
+    if REGISTRY.enabled:
+        REGISTRY.serve(Config.METRICS_PORT)
+    pool = ResumeWorkerPool(app).start()
+    dispatcher = NotificationDispatcher(app).start()
+
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("[WORKER] Shutting down...")
+        pool.stop(timeout=30)
+        dispatcher.stop(timeout=30)
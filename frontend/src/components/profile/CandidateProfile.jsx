@@ -164,17 +164,27 @@ export default function CandidateProfile() {
               <div className="bg-gray-50 p-4 rounded-lg">
                 <div className="flex justify-between items-start mb-2">
                   <h3 className="font-semibold text-gray-900">Latest Request</h3>
-                  {document_requests[document_requests.length - 1].request_status === 'auto-generated' && (
-                    <Badge variant="info" className="text-xs">
-                      Auto-Generated
+                  <div className="flex space-x-2">
+                    {document_requests[document_requests.length - 1].auto_generated && (
+                      <Badge variant="info" className="text-xs">
+                        Auto-Generated
+                      </Badge>
+                    )}
+                    <Badge
+                      variant={{ sent: 'success', failed: 'error', queued: 'warning' }[
+                        document_requests[document_requests.length - 1].request_status
+                      ] || 'default'}
+                      className="text-xs"
+                    >
+                      {document_requests[document_requests.length - 1].request_status}
                     </Badge>
-                  )}
+                  </div>
                 </div>
                 <pre className="whitespace-pre-wrap text-sm text-gray-700">
                   {document_requests[document_requests.length - 1].request_message}
                 </pre>
                 <p className="text-xs text-gray-500 mt-2">
-                  Sent: {new Date(document_requests[document_requests.length - 1].requested_at).toLocaleString()}
+                  Requested: {new Date(document_requests[document_requests.length - 1].requested_at).toLocaleString()}
                 </p>
               </div>
 
@@ -10,6 +10,8 @@ export default function DocumentSection({ candidateId, submittedDocuments, onDoc
   const [uploading, setUploading] = useState(false);
   const [documentType, setDocumentType] = useState('pan');
   const [viewingDocument, setViewingDocument] = useState(null);
+  const [brokenThumbnails, setBrokenThumbnails] = useState({});
+  const apiBaseUrl = import.meta.env.VITE_API_BASE_URL || 'http://localhost:5000/api';
 
   const handleFileUpload = async (e) => {
     const file = e.target.files[0];
@@ -17,7 +19,7 @@ export default function DocumentSection({ candidateId, submittedDocuments, onDoc
 
     setUploading(true);
     try {
-      await candidateService.submitDocuments(candidateId, file, documentType);
+      await candidateService.submitDocumentsResumable(candidateId, file, documentType);
       onDocumentSubmit();
       e.target.value = '';
     } catch (err) {
@@ -134,17 +136,27 @@ export default function DocumentSection({ candidateId, submittedDocuments, onDoc
               >
                 <div className="flex items-start justify-between mb-3">
                   <div className="flex items-center space-x-3">
-                    <div className={`w-12 h-12 rounded-lg flex items-center justify-center ${
-                      doc.document_type === 'pan'
-                        ? 'bg-blue-100'
-                        : 'bg-indigo-100'
-                    }`}>
-                      <FileText className={`w-6 h-6 ${
+                    {brokenThumbnails[doc.id] ? (
+                      <div className={`w-12 h-12 rounded-lg flex items-center justify-center ${
                         doc.document_type === 'pan'
-                          ? 'text-blue-600'
-                          : 'text-indigo-600'
-                      }`} />
-                    </div>
+                          ? 'bg-blue-100'
+                          : 'bg-indigo-100'
+                      }`}>
+                        <FileText className={`w-6 h-6 ${
+                          doc.document_type === 'pan'
+                            ? 'text-blue-600'
+                            : 'text-indigo-600'
+                        }`} />
+                      </div>
+                    ) : (
+                      <img
+                        src={`${apiBaseUrl}/candidates/${candidateId}/documents/${doc.id}/thumbnail`}
+                        alt={doc.document_filename}
+                        loading="lazy"
+                        className="w-12 h-12 rounded-lg object-cover bg-gray-100"
+                        onError={() => setBrokenThumbnails((prev) => ({ ...prev, [doc.id]: true }))}
+                      />
+                    )}
                     <div>
                       <p className="font-semibold text-gray-900">
                         {doc.document_type === 'pan' ? 'PAN Card' : 'Aadhaar Card'}
@@ -28,6 +28,11 @@ export const candidateService = {
     return response.data;
   },
 
+  getCandidateStatus: async (candidateId) => {
+    const response = await api.get(`/candidates/${candidateId}/status`);
+    return response.data;
+  },
+
   requestDocuments: async (candidateId) => {
     const response = await api.post(`/candidates/${candidateId}/request-documents`);
     return response.data;
@@ -46,4 +51,47 @@ export const candidateService = {
 
     return response.data;
   },
+
+  submitDocumentsResumable: async (candidateId, file, documentType, onProgress, maxRetries = 5) => {
+    const { data: upload } = await api.post(`/candidates/${candidateId}/document-uploads`, {
+      document_type: documentType,
+      filename: file.name,
+      total_size: file.size,
+    });
+
+    const uploadUrl = `/candidates/${candidateId}/document-uploads/${upload.upload_id}`;
+    let received = 0;
+    let failures = 0;
+
+    while (received < file.size) {
+      const end = Math.min(received + upload.chunk_size, file.size);
+      try {
+        const { data } = await api.put(uploadUrl, file.slice(received, end), {
+          headers: {
+            'Content-Type': 'application/octet-stream',
+            'Content-Range': `bytes ${received}-${end - 1}/${file.size}`,
+          },
+        });
+        received = data.received;
+        failures = 0;
+      } catch (err) {
+        failures += 1;
+        if (failures > maxRetries) throw err;
+
+        // Resume from whatever the server acknowledged, including partial chunks
+        await new Promise((resolve) => setTimeout(resolve, 1000 * failures));
+        try {
+          const { data } = await api.get(uploadUrl);
+          received = data.received;
+        } catch {
+          // Still offline; retry from the last known offset
+        }
+      }
+
+      if (onProgress) onProgress(Math.round((received * 100) / file.size));
+    }
+
+    const response = await api.post(`${uploadUrl}/finalize`);
+    return response.data;
+  },
 };